@@ -7,3 +7,46 @@ class MediaProcessingStatus(str, enum.Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     ERROR = "error"
+    DEAD_LETTER = "dead_letter"
+    CANCELLED = "cancelled"
+
+
+class JobStatus(str, enum.Enum):
+    """Lifecycle states for durable media processing jobs."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    DEAD = "dead"
+    CANCELLED = "cancelled"
+
+
+class ProcessingStage(str, enum.Enum):
+    """Pipeline stage a video (and its uploads) is currently in."""
+
+    QUEUED = "queued"
+    EXTRACTING = "extracting"
+    SPLICING = "splicing"
+    REGISTERING = "registering"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ProcessingCheckpoint(str, enum.Enum):
+    """Last pipeline stage whose output is durably on disk (and, for REGISTERED, in the database)."""
+
+    EXTRACTED = "extracted"
+    SPLICED = "spliced"
+    REGISTERED = "registered"
+
+
+class SpliceStatus(str, enum.Enum):
+    """Queue a splice is in; every lifecycle step is an UPDATE of this column."""
+
+    PENDING = "pending"
+    LABELING = "labeling"
+    LABELED = "labeled"
+    VALIDATING = "validating"
+    VALIDATED = "validated"
+    DELETED = "deleted"
@@ -3,7 +3,7 @@ import sqlalchemy as _sql
 from sqlalchemy.orm import relationship
 
 from . import database as _database
-from .enums import MediaProcessingStatus
+from .enums import JobStatus, MediaProcessingStatus, ProcessingCheckpoint, ProcessingStage, SpliceStatus
 
 
 class User(_database.Base):
@@ -42,6 +42,8 @@ class Video(_database.Base):
     to_mp3_status = _sql.Column(_sql.String, nullable=True)
     splice_status = _sql.Column(_sql.String, nullable=True)
     mp3_path = _sql.Column(_sql.String, nullable=True)
+    # Decoded audio the splices were cut from (PCM WAV, or the MP3 on the legacy path).
+    audio_path = _sql.Column(_sql.String, nullable=True)
     upload_time = _sql.Column(_sql.DateTime, default=_dt.datetime.utcnow)
     uploader_id = _sql.Column(_sql.String, _sql.ForeignKey("users.id"), nullable=True)
     processing_status = _sql.Column(
@@ -50,8 +52,34 @@ class Video(_database.Base):
         default=MediaProcessingStatus.IN_PROGRESS,
     )
     processing_error = _sql.Column(_sql.String, nullable=True)
+    content_hash = _sql.Column(_sql.String(64), nullable=True, index=True)
+    duration_seconds = _sql.Column(_sql.Float, nullable=True)
+    processing_checkpoint = _sql.Column(
+        _sql.Enum(ProcessingCheckpoint, name="processing_checkpoint", native_enum=False, length=32),
+        nullable=True,
+    )
+    # JSON list of [path, start, end, duration] written at the SPLICED checkpoint.
+    splice_manifest = _sql.Column(_sql.Text, nullable=True)
+    # JSON object of splicer overrides (see ``processing.SPLICE_PARAM_NAMES``) set by a re-splice.
+    splice_params = _sql.Column(_sql.Text, nullable=True)
+    # Stored as VARCHAR so new stages never need an ALTER TYPE.
+    processing_stage = _sql.Column(
+        _sql.Enum(ProcessingStage, name="processing_stage", native_enum=False, length=32),
+        nullable=True,
+        default=ProcessingStage.QUEUED,
+    )
+    progress_percent = _sql.Column(_sql.Integer, nullable=False, default=0, server_default="0")
+
+
+def _status_queue_index(name: str, status: SpliceStatus) -> _sql.Index:
+    """Partial index over the ids of one status, i.e. the claim order of that queue."""
+    predicate = _sql.text(f"status = '{status.name}'")
+    return _sql.Index(name, "id", postgresql_where=predicate, sqlite_where=predicate)
+
 
 class Splice(_database.Base):
+    """A clip for its whole life; ``status`` moves it between the labeling queues in place."""
+
     __tablename__ = "splices"
     id = _sql.Column(_sql.Integer, primary_key=True, index=True)
     name = _sql.Column(_sql.String, nullable=True)
@@ -61,8 +89,38 @@ class Splice(_database.Base):
     duration = _sql.Column(_sql.String, nullable=True)
     validation = _sql.Column(_sql.String, nullable=True)
     owner_id = _sql.Column(_sql.String, _sql.ForeignKey("users.id"), nullable=False)
+    labeler_id = _sql.Column(_sql.String, _sql.ForeignKey("users.id"), nullable=True)
+    validator_id = _sql.Column(_sql.String, _sql.ForeignKey("users.id"), nullable=True)
+    # Stored as VARCHAR so the partial queue indexes can name the states literally.
+    status = _sql.Column(
+        _sql.Enum(SpliceStatus, name="splice_status", native_enum=False, length=32),
+        nullable=False,
+        default=SpliceStatus.PENDING,
+        server_default=SpliceStatus.PENDING.name,
+    )
+    # Lease of a LABELING/VALIDATING reservation; the reaper requeues it once it lapses.
+    reserved_by = _sql.Column(_sql.String, _sql.ForeignKey("users.id"), nullable=True)
+    reserved_until = _sql.Column(_sql.DateTime, nullable=True)
+    updated_at = _sql.Column(
+        _sql.DateTime,
+        default=_dt.datetime.utcnow,
+        onupdate=_dt.datetime.utcnow,
+    )
+
+    __table_args__ = (
+        _status_queue_index("ix_splices_pending_queue", SpliceStatus.PENDING),
+        _sql.Index("ix_splices_lease_expiry", "status", "reserved_until"),
+        _sql.Index("ix_splices_reserved_by_status", "reserved_by", "status"),
+        _status_queue_index("ix_splices_labeled_queue", SpliceStatus.LABELED),
+        _sql.Index("ix_splices_name_status", "name", "status"),
+        _sql.Index("ix_splices_labeler_status", "labeler_id", "status"),
+        _sql.Index("ix_splices_validator_status", "validator_id", "status"),
+    )
 
 
+# Tables of the old copy-and-delete lifecycle. Nothing writes to them any more;
+# ``main._migrate_legacy_splices`` drains their rows into ``splices`` in batches of
+# ``services.migrate_legacy_splice_batch``.
 class LabeledSplice(_database.Base):
     __tablename__ = "labeled_splices"
     id = _sql.Column(_sql.Integer, primary_key=True, index=True)
@@ -127,7 +185,7 @@ class TextSplice(_database.Base):
     reserved_by = _sql.Column(_sql.String, _sql.ForeignKey("users.id"), nullable=True)
     reserved_at = _sql.Column(_sql.DateTime, nullable=True)
     completed_at = _sql.Column(_sql.DateTime, nullable=True)
-    recorded_splice_id = _sql.Column(_sql.Integer, _sql.ForeignKey("labeled_splices.id"), nullable=True)
+    recorded_splice_id = _sql.Column(_sql.Integer, _sql.ForeignKey("splices.id"), nullable=True)
     created_at = _sql.Column(_sql.DateTime, default=_dt.datetime.utcnow)
     updated_at = _sql.Column(
         _sql.DateTime,
@@ -174,6 +232,67 @@ class UploadRecord(_database.Base):
         default=MediaProcessingStatus.IN_PROGRESS,
     )
     error_message = _sql.Column(_sql.String, nullable=True)
+    processing_stage = _sql.Column(
+        _sql.Enum(ProcessingStage, name="processing_stage", native_enum=False, length=32),
+        nullable=True,
+        default=ProcessingStage.QUEUED,
+    )
+    progress_percent = _sql.Column(_sql.Integer, nullable=False, default=0, server_default="0")
+    created_at = _sql.Column(_sql.DateTime, default=_dt.datetime.utcnow)
+    updated_at = _sql.Column(
+        _sql.DateTime,
+        default=_dt.datetime.utcnow,
+        onupdate=_dt.datetime.utcnow,
+    )
+
+
+
+class UploadSession(_database.Base):
+    __tablename__ = "upload_sessions"
+
+    id = _sql.Column(_sql.String, primary_key=True, index=True)
+    user_id = _sql.Column(_sql.String, _sql.ForeignKey("users.id"), nullable=False)
+    video_name = _sql.Column(_sql.String, nullable=False)
+    category = _sql.Column(_sql.String, nullable=True)
+    original_filename = _sql.Column(_sql.String, nullable=False)
+    total_size = _sql.Column(_sql.BigInteger, nullable=False)
+    received_bytes = _sql.Column(_sql.BigInteger, nullable=False, default=0)
+    temp_path = _sql.Column(_sql.String, nullable=False)
+    status = _sql.Column(_sql.String, nullable=False, default="open")
+    # Identifies the request currently writing a chunk while ``status`` is "receiving".
+    writer_token = _sql.Column(_sql.String(32), nullable=True)
+    upload_record_id = _sql.Column(_sql.Integer, _sql.ForeignKey("upload_records.id"), nullable=True)
+    expires_at = _sql.Column(_sql.DateTime, nullable=False, index=True)
+    created_at = _sql.Column(_sql.DateTime, default=_dt.datetime.utcnow)
+    updated_at = _sql.Column(
+        _sql.DateTime,
+        default=_dt.datetime.utcnow,
+        onupdate=_dt.datetime.utcnow,
+    )
+
+
+class ProcessingJob(_database.Base):
+    __tablename__ = "processing_jobs"
+
+    id = _sql.Column(_sql.Integer, primary_key=True, index=True)
+    video_id = _sql.Column(_sql.Integer, _sql.ForeignKey("videos.id"), nullable=False, index=True)
+    status = _sql.Column(
+        _sql.Enum(JobStatus, name="processing_job_status"),
+        nullable=False,
+        default=JobStatus.QUEUED,
+    )
+    attempts = _sql.Column(_sql.Integer, nullable=False, default=0)
+    max_attempts = _sql.Column(_sql.Integer, nullable=False, default=3)
+    # Higher runs first; see ``services.compute_job_priority``.
+    priority = _sql.Column(_sql.Integer, nullable=False, default=0, server_default="0")
+    cancel_requested = _sql.Column(_sql.Boolean, nullable=False, default=False, server_default=_sql.false())
+    # Estimated peak decode memory (bytes) held against the admission budget while running.
+    memory_reserved = _sql.Column(_sql.BigInteger, nullable=True)
+    available_at = _sql.Column(_sql.DateTime, nullable=False, default=_dt.datetime.utcnow)
+    locked_by = _sql.Column(_sql.String, nullable=True)
+    locked_at = _sql.Column(_sql.DateTime, nullable=True)
+    heartbeat_at = _sql.Column(_sql.DateTime, nullable=True)
+    last_error = _sql.Column(_sql.String, nullable=True)
     created_at = _sql.Column(_sql.DateTime, default=_dt.datetime.utcnow)
     updated_at = _sql.Column(
         _sql.DateTime,
@@ -181,3 +300,7 @@ class UploadRecord(_database.Base):
         onupdate=_dt.datetime.utcnow,
     )
 
+    __table_args__ = (
+        _sql.Index("ix_processing_jobs_claim", "status", "available_at"),
+        _sql.Index("ix_processing_jobs_priority", "status", "priority", "available_at"),
+    )
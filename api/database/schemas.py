@@ -2,7 +2,7 @@ import datetime as _dt
 from typing import Optional, Generic, TypeVar, Any
 import pydantic as _pydantic
 
-from .enums import MediaProcessingStatus
+from .enums import JobStatus, MediaProcessingStatus, ProcessingCheckpoint, ProcessingStage, SpliceStatus
 
 T = TypeVar('T')
 
@@ -19,9 +19,17 @@ class VideoBase(_pydantic.BaseModel):
     to_mp3_status: Optional[str] = None
     splice_status: Optional[str] = None
     mp3_path: Optional[str] = None
+    audio_path: Optional[str] = None
     uploader_id: Optional[str] = None
     processing_status: Optional[MediaProcessingStatus] = MediaProcessingStatus.IN_PROGRESS
     processing_error: Optional[str] = None
+    content_hash: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    processing_checkpoint: Optional[ProcessingCheckpoint] = None
+    splice_manifest: Optional[str] = None
+    splice_params: Optional[str] = None
+    processing_stage: Optional[ProcessingStage] = ProcessingStage.QUEUED
+    progress_percent: int = 0
 
 class Video(VideoBase):
     id: int
@@ -44,6 +52,11 @@ class SpliceBase(_pydantic.BaseModel):
 
 class Splice(SpliceBase):
     id: int
+    labeler_id: Optional[str] = None
+    validator_id: Optional[str] = None
+    status: SpliceStatus = SpliceStatus.PENDING
+    reserved_by: Optional[str] = None
+    reserved_until: Optional[_dt.datetime] = None
     model_config = _pydantic.ConfigDict(from_attributes=True)
 
 class SpliceCreate(SpliceBase):
@@ -61,26 +74,10 @@ class LabeledSpliceBase(_pydantic.BaseModel):
     labeler_id: Optional[str] = None
 
 
-class LabeledSplice(LabeledSpliceBase):
-    id: int
-    model_config = _pydantic.ConfigDict(from_attributes=True)
-
 class LabeledSpliceCreate(LabeledSpliceBase):
     pass
 
 
-class HighQualityLabeledSpliceBase(_pydantic.BaseModel):
-    name: str
-    path: str
-    label: str
-    origin: str
-    duration: str
-    validation: str
-    owner_id: str
-    validator_id: str
-    labeler_id: Optional[str] = None
-
-
 class UploadStats(_pydantic.BaseModel):
     total_generated: int = 0
     validated_count: int = 0
@@ -88,56 +85,6 @@ class UploadStats(_pydantic.BaseModel):
     unlabeled_count: int = 0
 
 
-class HighQualityLabeledSplice(HighQualityLabeledSpliceBase):
-    id: int
-    stats: UploadStats = UploadStats()
-    model_config = _pydantic.ConfigDict(from_attributes=True)
-
-class HighQualityLabeledSpliceCreate(HighQualityLabeledSpliceBase):
-    pass
-
-
-class DeletedSpliceBase(_pydantic.BaseModel):
-    name: str
-    path: str
-    label: str
-    origin: str
-    duration: str
-    validation: str
-    owner_id: str
-    labeler_id: Optional[str] = None
-    validator_id: Optional[str] = None
-
-
-class DeletedSplice(DeletedSpliceBase):
-    id: int
-    model_config = _pydantic.ConfigDict(from_attributes=True)
-
-class DeletedSpliceCreate(DeletedSpliceBase):
-    pass
-
-
-class SpliceBeingProcessedBase(_pydantic.BaseModel):
-    name: str
-    path: str
-    label: str
-    origin: str
-    duration: str
-    validation: str
-    owner_id: str
-    labeler_id: Optional[str] = None
-    validator_id: Optional[str] = None
-
-    status: str
-
-class SpliceBeingProcessed(SpliceBeingProcessedBase):
-    id: int
-    model_config = _pydantic.ConfigDict(from_attributes=True)
-
-class SpliceBeingProcessedCreate(SpliceBeingProcessedBase):
-    pass
-
-
 class TextSpliceBase(_pydantic.BaseModel):
     prompt_text: str
     status: str = "pending"
@@ -200,6 +147,8 @@ class UploadRecordBase(_pydantic.BaseModel):
     consent_given: bool = True
     status: MediaProcessingStatus = MediaProcessingStatus.IN_PROGRESS
     error_message: Optional[str] = None
+    processing_stage: Optional[ProcessingStage] = ProcessingStage.QUEUED
+    progress_percent: int = 0
 
 
 class UploadRecord(UploadRecordBase):
@@ -214,6 +163,48 @@ class UploadRecordCreate(UploadRecordBase):
     pass
 
 
+class UploadSessionCreate(_pydantic.BaseModel):
+    video_name: str
+    video_category: str
+    filename: str
+    total_size: int = _pydantic.Field(..., gt=0)
+    consent: bool = True
+
+
+class UploadSession(_pydantic.BaseModel):
+    id: str
+    video_name: str
+    category: Optional[str] = None
+    original_filename: str
+    total_size: int
+    received_bytes: int
+    status: str
+    upload_record_id: Optional[int] = None
+    expires_at: _dt.datetime
+    created_at: _dt.datetime
+    updated_at: _dt.datetime
+    model_config = _pydantic.ConfigDict(from_attributes=True)
+
+
+class ProcessingJob(_pydantic.BaseModel):
+    id: int
+    video_id: int
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    priority: int = 0
+    cancel_requested: bool = False
+    memory_reserved: Optional[int] = None
+    available_at: _dt.datetime
+    locked_by: Optional[str] = None
+    locked_at: Optional[_dt.datetime] = None
+    heartbeat_at: Optional[_dt.datetime] = None
+    last_error: Optional[str] = None
+    created_at: _dt.datetime
+    updated_at: _dt.datetime
+    model_config = _pydantic.ConfigDict(from_attributes=True)
+
+
 class ActivityItem(_pydantic.BaseModel):
     id: int
     name: Optional[str] = None
@@ -247,6 +238,22 @@ class ValidateSplice(BaseSpliceAction):
 class DeleteSplice(_pydantic.BaseModel):
     id: int
 
+class RespliceRequest(_pydantic.BaseModel):
+    min_silence_len: int = _pydantic.Field(700, ge=50, le=10_000)
+    silence_thresh: int = _pydantic.Field(-20, ge=-90, le=0)
+    # ``None`` keeps the server's MIN_SPLICE_DURATION_MS.
+    min_chunk_duration_ms: Optional[int] = _pydantic.Field(None, ge=1_000, le=600_000)
+    # ``None`` keeps MAX_SPLICE_DURATION_MS; 0 removes the upper bound.
+    max_chunk_duration_ms: Optional[int] = _pydantic.Field(None, ge=0, le=3_600_000)
+    dry_run: bool = True
+
+    @_pydantic.field_validator("max_chunk_duration_ms")
+    @classmethod
+    def _max_chunk_floor(cls, value: Optional[int]) -> Optional[int]:
+        if value and value < 1_000:
+            raise ValueError("max_chunk_duration_ms must be 0 or at least 1000")
+        return value
+
 
 class UserBase(_pydantic.BaseModel):
     name: Optional[str] = None
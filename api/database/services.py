@@ -1,23 +1,124 @@
 import datetime as _dt
-from typing import TYPE_CHECKING, Optional
+import json
+import os
+from typing import TYPE_CHECKING, Callable, Optional
 
+import sqlalchemy as _sql
 from fastapi import HTTPException
 from sqlalchemy import func, literal, select, union_all
 
 from . import database as _database
 from . import models as _models
 from . import schemas as _schemas
-from .enums import MediaProcessingStatus
+from .enums import JobStatus, MediaProcessingStatus, ProcessingCheckpoint, ProcessingStage, SpliceStatus
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 
+# Columns and indexes added after the initial schema. ``create_all`` only creates missing
+# tables, so existing deployments pick these up through ``_upgrade_schema``.
+SCHEMA_UPGRADES = [
+    ("videos", "content_hash", "VARCHAR(64)"),
+    ("videos", "audio_path", "VARCHAR"),
+    ("videos", "processing_stage", "VARCHAR(32)"),
+    ("videos", "progress_percent", "INTEGER NOT NULL DEFAULT 0"),
+    ("upload_records", "processing_stage", "VARCHAR(32)"),
+    ("upload_records", "progress_percent", "INTEGER NOT NULL DEFAULT 0"),
+    ("videos", "duration_seconds", "FLOAT"),
+    ("processing_jobs", "priority", "INTEGER NOT NULL DEFAULT 0"),
+    ("processing_jobs", "cancel_requested", "BOOLEAN NOT NULL DEFAULT FALSE"),
+    ("videos", "processing_checkpoint", "VARCHAR(32)"),
+    ("videos", "splice_manifest", "TEXT"),
+    ("videos", "splice_params", "TEXT"),
+    ("processing_jobs", "memory_reserved", "BIGINT"),
+    ("splices", "labeler_id", "VARCHAR REFERENCES users (id)"),
+    ("splices", "validator_id", "VARCHAR REFERENCES users (id)"),
+    ("splices", "status", "VARCHAR(32) NOT NULL DEFAULT 'PENDING'"),
+    ("splices", "updated_at", "TIMESTAMP"),
+    ("splices", "reserved_by", "VARCHAR REFERENCES users (id)"),
+    ("splices", "reserved_until", "TIMESTAMP"),
+    ("upload_sessions", "writer_token", "VARCHAR(32)"),
+]
+INDEX_UPGRADES = [
+    "CREATE INDEX IF NOT EXISTS ix_videos_content_hash ON videos (content_hash)",
+    "CREATE INDEX IF NOT EXISTS ix_processing_jobs_priority ON processing_jobs (status, priority, available_at)",
+    "CREATE INDEX IF NOT EXISTS ix_splices_pending_queue ON splices (id) WHERE status = 'PENDING'",
+    "CREATE INDEX IF NOT EXISTS ix_splices_labeled_queue ON splices (id) WHERE status = 'LABELED'",
+    "CREATE INDEX IF NOT EXISTS ix_splices_name_status ON splices (name, status)",
+    "CREATE INDEX IF NOT EXISTS ix_splices_labeler_status ON splices (labeler_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_splices_validator_status ON splices (validator_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_splices_lease_expiry ON splices (status, reserved_until)",
+    "CREATE INDEX IF NOT EXISTS ix_splices_reserved_by_status ON splices (reserved_by, status)",
+]
+# New members of Postgres enum types (SQLAlchemy stores the member names).
+ENUM_UPGRADES = [
+    ("video_processing_status", "DEAD_LETTER"),
+    ("upload_status_enum", "DEAD_LETTER"),
+    ("video_processing_status", "CANCELLED"),
+    ("upload_status_enum", "CANCELLED"),
+    ("processing_job_status", "CANCELLED"),
+]
+
+
+def _upgrade_schema():
+    inspector = _sql.inspect(_database.engine)
+    with _database.engine.begin() as connection:
+        for table_name, column_name, column_type in SCHEMA_UPGRADES:
+            existing_columns = {column["name"] for column in inspector.get_columns(table_name)}
+            if column_name not in existing_columns:
+                connection.execute(_sql.text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"))
+        for statement in INDEX_UPGRADES:
+            connection.execute(_sql.text(statement))
+        if connection.dialect.name == "postgresql":
+            for type_name, value in ENUM_UPGRADES:
+                connection.execute(_sql.text(f"ALTER TYPE {type_name} ADD VALUE IF NOT EXISTS '{value}'"))
+            _repoint_recorded_splice_fk(inspector, connection)
+
+
+def _repoint_recorded_splice_fk(inspector, connection) -> None:
+    """Point ``text_splices.recorded_splice_id`` at ``splices`` instead of the legacy labeled table.
+
+    The new constraint is ``NOT VALID`` so rows the legacy migration has not remapped yet
+    are left alone; every id written from now on is checked.
+    """
+    for foreign_key in inspector.get_foreign_keys("text_splices"):
+        if foreign_key["referred_table"] == "labeled_splices":
+            connection.execute(_sql.text(f'ALTER TABLE text_splices DROP CONSTRAINT "{foreign_key["name"]}"'))
+            connection.execute(_sql.text(
+                "ALTER TABLE text_splices ADD CONSTRAINT text_splices_recorded_splice_id_fkey "
+                "FOREIGN KEY (recorded_splice_id) REFERENCES splices (id) NOT VALID"
+            ))
+
+
 def _add_tables():
-    return _database.Base.metadata.create_all(bind=_database.engine)
+    _database.Base.metadata.create_all(bind=_database.engine)
+    _upgrade_schema()
 
 SessionLocal = _database.SessionLocal
 
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BASE_SECONDS = int(os.getenv("JOB_RETRY_BASE_SECONDS", "30"))
+JOB_RETRY_MAX_SECONDS = int(os.getenv("JOB_RETRY_MAX_SECONDS", "3600"))
+# A running job whose heartbeat is older than this is assumed to belong to a dead worker.
+JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "300"))
+# Error recorded when a job is dead-lettered because its worker died on the last attempt.
+JOB_WORKER_LOST_ERROR = "Processing worker stopped responding"
+# Priority lanes by media duration (seconds, bonus); anything longer gets no bonus.
+JOB_PRIORITY_LANES = [(10 * 60, 30), (60 * 60, 20), (3 * 60 * 60, 10)]
+JOB_PRIORITY_UNKNOWN_DURATION = 10
+# A waiting job gains one priority point per this many seconds, so no lane starves (0 disables).
+JOB_PRIORITY_AGING_SECONDS = int(os.getenv("JOB_PRIORITY_AGING_SECONDS", "600"))
+# Staff/trusted uploaders (comma-separated user ids) jump a lane; the system seed account drops one.
+PRIORITY_UPLOADER_IDS = {uid.strip() for uid in os.getenv("PRIORITY_UPLOADER_IDS", "").split(",") if uid.strip()}
+SYSTEM_UPLOADER_EMAIL = "system@albaniansr.com"
+# Duration assumed for admission control when a video's length could not be probed.
+JOB_UNKNOWN_DURATION_SECONDS = float(os.getenv("JOB_UNKNOWN_DURATION_SECONDS", "3600"))
+# Postgres advisory lock key serialising memory admission across workers.
+JOB_ADMISSION_LOCK_KEY = 7_310_416
+# A chunk writer that has not refreshed its reservation for this long is assumed dead.
+UPLOAD_WRITE_LEASE_SECONDS = int(os.getenv("UPLOAD_WRITE_LEASE_SECONDS", "120"))
+
 def get_db():
     db = _database.SessionLocal()
     try:
@@ -32,6 +133,10 @@ async def create_video(video: _schemas.VideoCreate, db: "Session") -> _schemas.V
     db.refresh(video_db)
     return _schemas.Video.model_validate(video_db)
 
+def get_video(db: "Session", video_id: int) -> Optional[_schemas.Video]:
+    video_db = db.query(_models.Video).filter(_models.Video.id == video_id).first()
+    return _schemas.Video.model_validate(video_db) if video_db else None
+
 async def update_video(video_path: str, update_data: dict, db: "Session") -> _schemas.Video:
     video_db = db.query(_models.Video).filter(_models.Video.path == video_path).first()
     if video_db is None:
@@ -57,18 +162,6 @@ async def update_video_by_id(video_id: int, update_data: dict, db: "Session") ->
     db.refresh(video_db)
     return _schemas.Video.model_validate(video_db)
 
-async def update_splice_being_processed(splice_id: int, data: dict, db: "Session") -> _schemas.SpliceBeingProcessed:
-    splice_being_processed_db = db.query(_models.SpliceBeingProcessed).filter(_models.SpliceBeingProcessed.id == splice_id).first()
-    if splice_being_processed_db is None:
-        raise HTTPException(404, detail="Splice not found")
-
-    for key, value in data.items():
-        setattr(splice_being_processed_db, key, value)
-
-    db.commit()
-    db.refresh(splice_being_processed_db)
-    return _schemas.SpliceBeingProcessed.model_validate(splice_being_processed_db)
-
 async def create_splice(splice: _schemas.SpliceCreate, db: "Session") -> _schemas.Splice:
     splice_db = _models.Splice(**splice.model_dump())
     db.add(splice_db)
@@ -76,13 +169,6 @@ async def create_splice(splice: _schemas.SpliceCreate, db: "Session") -> _schema
     db.refresh(splice_db)
     return _schemas.Splice.model_validate(splice_db)
 
-async def create_splice_being_processed(splice: _schemas.SpliceBeingProcessedCreate, db: "Session") -> _schemas.SpliceBeingProcessed:
-    splice_dict = splice.model_dump()
-    splice_being_processed_db = _models.SpliceBeingProcessed(**splice_dict)
-    db.add(splice_being_processed_db)
-    db.commit()
-    db.refresh(splice_being_processed_db)
-    return _schemas.SpliceBeingProcessed.model_validate(splice_being_processed_db)
 
 
 async def create_upload_record(upload: _schemas.UploadRecordCreate, db: "Session") -> _schemas.UploadRecord:
@@ -93,6 +179,11 @@ async def create_upload_record(upload: _schemas.UploadRecordCreate, db: "Session
     return _schemas.UploadRecord.model_validate(upload_db)
 
 
+def get_upload_record(db: "Session", upload_id: int) -> Optional[_schemas.UploadRecord]:
+    record = db.query(_models.UploadRecord).filter(_models.UploadRecord.id == upload_id).first()
+    return _schemas.UploadRecord.model_validate(record) if record else None
+
+
 def update_upload_record(upload_id: int, data: dict, db: "Session") -> _schemas.UploadRecord:
     record = db.query(_models.UploadRecord).filter(_models.UploadRecord.id == upload_id).first()
     if record is None:
@@ -117,68 +208,1116 @@ def set_upload_status(
         payload["error_message"] = error_message
     return update_upload_record(upload_id, payload, db)
 
-async def delete_labeled_splice(splice_id: int, db: "Session"):
-    labeled_splice = (
-        db.query(_models.LabeledSplice)
-        .filter(_models.LabeledSplice.id == splice_id)
-        .first()
+
+def set_upload_status_for_video(
+    video_id: int,
+    status: MediaProcessingStatus,
+    db: "Session",
+    error_message: Optional[str] = None,
+) -> int:
+    """Apply a status to every upload record pointing at ``video_id`` (including deduplicated ones)."""
+    updated = _update_upload_status_for_video(video_id, status, db, error_message)
+    db.commit()
+    return updated
+
+
+def _update_upload_status_for_video(
+    video_id: int,
+    status: MediaProcessingStatus,
+    db: "Session",
+    error_message: Optional[str] = None,
+) -> int:
+    payload = {
+        _models.UploadRecord.status: status,
+        _models.UploadRecord.updated_at: _dt.datetime.utcnow(),
+    }
+    if error_message is not None:
+        payload[_models.UploadRecord.error_message] = error_message
+    updated = (
+        db.query(_models.UploadRecord)
+        .filter(_models.UploadRecord.video_id == video_id)
+        .update(payload, synchronize_session=False)
     )
-    if not labeled_splice:
-        return
+    return updated
 
-    referencing_text_splices = (
-        db.query(_models.TextSplice)
-        .filter(_models.TextSplice.recorded_splice_id == splice_id)
+
+def set_processing_progress(
+    video_id: int,
+    stage: ProcessingStage,
+    percent: Optional[int],
+    db: "Session",
+) -> None:
+    """Record the pipeline stage and percent complete on a video and every upload linked to it.
+
+    ``percent=None`` changes the stage and keeps the last recorded percentage.
+    """
+    payload = {"processing_stage": stage}
+    if percent is not None:
+        payload["progress_percent"] = max(0, min(100, int(percent)))
+    db.query(_models.Video).filter(_models.Video.id == video_id).update(payload, synchronize_session=False)
+    db.query(_models.UploadRecord).filter(_models.UploadRecord.video_id == video_id).update(
+        {**payload, "updated_at": _dt.datetime.utcnow()}, synchronize_session=False
+    )
+    db.commit()
+
+
+def record_processing_checkpoint(
+    video_id: int,
+    checkpoint: ProcessingCheckpoint,
+    db: "Session",
+    **fields,
+) -> None:
+    """Persist the last completed pipeline stage (plus any outputs it produced) on the video."""
+    db.query(_models.Video).filter(_models.Video.id == video_id).update(
+        {"processing_checkpoint": checkpoint, **fields},
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+SPLICE_INSERT_BATCH = 1000
+
+
+def create_splices_bulk(
+    video_id: int,
+    splices: list[_schemas.SpliceCreate],
+    video_update: dict,
+    db: "Session",
+) -> int:
+    """Insert all splices of a video and mark it (and its uploads) completed in one transaction.
+
+    Rows go in as multi-row ``INSERT ... VALUES`` statements of ``SPLICE_INSERT_BATCH`` rows,
+    so a failure leaves neither splices nor a completed status behind.
+    """
+    rows = [splice.model_dump() for splice in splices]
+    try:
+        for offset in range(0, len(rows), SPLICE_INSERT_BATCH):
+            db.execute(_sql.insert(_models.Splice).values(rows[offset:offset + SPLICE_INSERT_BATCH]))
+        updated = (
+            db.query(_models.Video)
+            .filter(_models.Video.id == video_id)
+            .update(video_update, synchronize_session=False)
+        )
+        if not updated:
+            raise HTTPException(404, detail="Video not found")
+        _update_upload_status_for_video(video_id, MediaProcessingStatus.COMPLETED, db)
+        db.query(_models.UploadRecord).filter(_models.UploadRecord.video_id == video_id).update(
+            {"processing_stage": ProcessingStage.COMPLETED, "progress_percent": 100},
+            synchronize_session=False,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(rows)
+
+
+def create_media_uploads(
+    uploads: list[tuple[_schemas.VideoCreate, _schemas.UploadRecordCreate]],
+    db: "Session",
+) -> list[tuple[_schemas.Video, _schemas.UploadRecord, bool]]:
+    """Insert videos and their upload records for a set of stored files in one transaction.
+
+    An entry whose ``content_hash`` matches an existing non-failed video, or an earlier
+    entry of the same call, is linked to that video instead of creating a new one.
+    Every newly created video gets a queued ``ProcessingJob`` in the same transaction, so
+    no video can exist without the work that completes it. Returns
+    ``(video, upload_record, created)`` for every entry, in input order.
+    """
+    hashes = {video.content_hash for video, _ in uploads if video.content_hash}
+    videos_by_hash = {}
+    if hashes:
+        existing_videos = (
+            db.query(_models.Video)
+            .filter(
+                _models.Video.content_hash.in_(hashes),
+                _models.Video.processing_status.notin_([MediaProcessingStatus.ERROR, MediaProcessingStatus.DEAD_LETTER]),
+            )
+            .order_by(_models.Video.id)
+            .all()
+        )
+        for video_db in existing_videos:
+            videos_by_hash.setdefault(video_db.content_hash, video_db)
+
+    rows = []
+    try:
+        for video, upload in uploads:
+            video_db = videos_by_hash.get(video.content_hash) if video.content_hash else None
+            created = video_db is None
+            if created:
+                video_db = _models.Video(**video.model_dump())
+                db.add(video_db)
+                db.flush()
+                db.add(_new_processing_job(video_db, db))
+                if video.content_hash:
+                    videos_by_hash[video.content_hash] = video_db
+
+            upload_values = upload.model_dump()
+            upload_values["video_id"] = video_db.id
+            if not created:
+                upload_values["display_name"] = video_db.name
+                upload_values["status"] = video_db.processing_status
+                upload_values["processing_stage"] = video_db.processing_stage
+                upload_values["progress_percent"] = video_db.progress_percent
+            upload_db = _models.UploadRecord(**upload_values)
+            db.add(upload_db)
+            rows.append((video_db, upload_db, created))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return [
+        (_schemas.Video.model_validate(video_db), _schemas.UploadRecord.model_validate(upload_db), created)
+        for video_db, upload_db, created in rows
+    ]
+
+
+def compute_job_priority(duration_seconds: Optional[float], uploader: Optional[_models.User]) -> int:
+    """Queue priority for a video's processing job; higher is claimed first.
+
+    Shorter media lands in a higher lane (``JOB_PRIORITY_LANES``) so a two-minute recording
+    is not stuck behind a three-hour podcast. ``PRIORITY_UPLOADER_IDS`` move up one lane and
+    the system seed account moves down one.
+    """
+    if duration_seconds is None:
+        priority = JOB_PRIORITY_UNKNOWN_DURATION
+    else:
+        priority = next((bonus for limit, bonus in JOB_PRIORITY_LANES if duration_seconds <= limit), 0)
+    if uploader is not None:
+        if uploader.id in PRIORITY_UPLOADER_IDS:
+            priority += 10
+        elif uploader.email == SYSTEM_UPLOADER_EMAIL:
+            priority -= 10
+    return priority
+
+
+def _effective_job_priority(now: _dt.datetime, dialect: str):
+    """``priority`` plus one point per ``JOB_PRIORITY_AGING_SECONDS`` the job has been runnable."""
+    if not JOB_PRIORITY_AGING_SECONDS:
+        return _models.ProcessingJob.priority
+    available_at = _models.ProcessingJob.available_at
+    if dialect == "postgresql":
+        waited = func.extract("epoch", literal(now, _sql.DateTime) - available_at)
+        aging = func.floor(waited / JOB_PRIORITY_AGING_SECONDS)
+    else:
+        waited = (func.julianday(literal(now, _sql.DateTime)) - func.julianday(available_at)) * 86400
+        # Truncating equals flooring: a job is only runnable once ``available_at`` has passed.
+        aging = _sql.cast(waited / JOB_PRIORITY_AGING_SECONDS, _sql.Integer)
+    return _models.ProcessingJob.priority + aging
+
+
+def _new_processing_job(video_db: _models.Video, db: "Session") -> _models.ProcessingJob:
+    uploader = db.get(_models.User, video_db.uploader_id) if video_db.uploader_id else None
+    return _models.ProcessingJob(
+        video_id=video_db.id,
+        max_attempts=JOB_MAX_ATTEMPTS,
+        priority=compute_job_priority(video_db.duration_seconds, uploader),
+    )
+
+
+def enqueue_processing_job(video_id: int, db: "Session") -> _schemas.ProcessingJob:
+    video_db = db.get(_models.Video, video_id)
+    if video_db is None:
+        raise HTTPException(404, detail="Video not found")
+    job_db = _new_processing_job(video_db, db)
+    db.add(job_db)
+    db.commit()
+    db.refresh(job_db)
+    return _schemas.ProcessingJob.model_validate(job_db)
+
+
+def enqueue_orphaned_videos(db: "Session") -> int:
+    """Queue jobs for in-progress videos that have no job (e.g. uploads from before the queue existed)."""
+    jobs_subquery = select(_models.ProcessingJob.video_id)
+    orphaned = (
+        db.query(_models.Video)
+        .filter(
+            _models.Video.processing_status == MediaProcessingStatus.IN_PROGRESS,
+            ~_models.Video.id.in_(jobs_subquery),
+        )
         .all()
     )
+    for video_db in orphaned:
+        db.add(_new_processing_job(video_db, db))
+    db.commit()
+    return len(orphaned)
 
-    for text_splice in referencing_text_splices:
-        existing_snapshot = (
-            db.query(_models.TextSpliceRecording)
-            .filter(_models.TextSpliceRecording.text_splice_id == text_splice.id)
+
+def claim_processing_job(
+    db: "Session",
+    worker_id: str,
+    memory_budget: Optional[int] = None,
+    decode_bytes_per_second: float = 0,
+) -> Optional[_schemas.ProcessingJob]:
+    """Atomically claim the highest-priority runnable job.
+
+    Priority ages: a job gains a point for every ``JOB_PRIORITY_AGING_SECONDS`` it has been
+    runnable, so a steady stream of short or staff uploads cannot starve long ones.
+
+    Runnable means queued and due, or running with a heartbeat older than
+    ``JOB_STALE_SECONDS`` (its worker died) and not being cancelled. ``FOR UPDATE SKIP LOCKED`` lets any number
+    of workers poll concurrently without blocking on, or double-claiming, the same row.
+
+    With ``memory_budget`` (bytes), a job is only admitted while its estimated decode memory
+    (video duration x ``decode_bytes_per_second``) fits next to what live running jobs have
+    reserved; jobs that do not fit stay queued. When nothing is running the next job is
+    always admitted, so a file larger than the whole budget still gets processed. On
+    Postgres an advisory lock makes the check-and-claim atomic across workers.
+
+    A stale job that has already used all its attempts is dead-lettered instead of being
+    reclaimed, and the next runnable job is tried.
+    """
+    now = _dt.datetime.utcnow()
+    while True:
+        stale_before = now - _dt.timedelta(seconds=JOB_STALE_SECONDS)
+        query = db.query(_models.ProcessingJob)
+        estimate = None
+        if memory_budget is not None:
+            if db.bind.dialect.name == "postgresql":
+                db.execute(_sql.text("SELECT pg_advisory_xact_lock(:key)"), {"key": JOB_ADMISSION_LOCK_KEY})
+            reserved = (
+                db.query(func.coalesce(func.sum(_models.ProcessingJob.memory_reserved), 0))
+                .filter(
+                    _models.ProcessingJob.status == JobStatus.RUNNING,
+                    _models.ProcessingJob.heartbeat_at >= stale_before,
+                )
+                .scalar()
+            )
+            estimate = (
+                func.coalesce(_models.Video.duration_seconds, JOB_UNKNOWN_DURATION_SECONDS) * decode_bytes_per_second
+            )
+            query = query.join(_models.Video, _models.Video.id == _models.ProcessingJob.video_id)
+            if reserved:
+                query = query.filter(estimate <= memory_budget - reserved)
+            query = query.add_columns(estimate)
+        row = (
+            query
+            .filter(
+                _sql.or_(
+                    _sql.and_(
+                        _models.ProcessingJob.status == JobStatus.QUEUED,
+                        _models.ProcessingJob.available_at <= now,
+                    ),
+                    _sql.and_(
+                        _models.ProcessingJob.status == JobStatus.RUNNING,
+                        _models.ProcessingJob.heartbeat_at < stale_before,
+                        _models.ProcessingJob.cancel_requested.is_(False),
+                    ),
+                )
+            )
+            .order_by(
+                _effective_job_priority(now, db.bind.dialect.name).desc(),
+                _models.ProcessingJob.available_at,
+                _models.ProcessingJob.id,
+            )
+            .with_for_update(skip_locked=True, of=_models.ProcessingJob)
             .first()
         )
-        if not existing_snapshot:
-            snapshot_db = _models.TextSpliceRecording(
-                text_splice_id=text_splice.id,
-                recorded_splice_id=splice_id,
-                name=labeled_splice.name,
-                path=labeled_splice.path,
-                label=labeled_splice.label or "",
-                origin=labeled_splice.origin,
-                duration=labeled_splice.duration,
-                validation=labeled_splice.validation,
-                owner_id=labeled_splice.owner_id,
-                labeler_id=labeled_splice.labeler_id or text_splice.reserved_by,
-            )
-            db.add(snapshot_db)
-        text_splice.recorded_splice_id = None
-        text_splice.updated_at = _dt.datetime.utcnow()
+        if row is None:
+            db.rollback()
+            return None
+
+        if estimate is not None:
+            job_db, reservation = row
+        else:
+            job_db, reservation = row, None
+        if job_db.status == JobStatus.RUNNING and job_db.attempts >= job_db.max_attempts:
+            # A stale job on its last attempt keeps killing its worker (OOM, ffmpeg crash).
+            _record_job_failure(job_db, job_db.last_error or JOB_WORKER_LOST_ERROR, db)
+            db.commit()
+            continue
+        job_db.memory_reserved = int(reservation) if reservation is not None else None
+        job_db.status = JobStatus.RUNNING
+        job_db.attempts += 1
+        job_db.locked_by = worker_id
+        job_db.locked_at = now
+        job_db.heartbeat_at = now
+        db.commit()
+        db.refresh(job_db)
+        return _schemas.ProcessingJob.model_validate(job_db)
+
+
+def requeue_interrupted_jobs(db: "Session", missed_heartbeat_seconds: int) -> int:
+    """Startup resume scan: put running jobs whose worker has missed heartbeats back in the queue.
+
+    Runs with a much shorter threshold than ``JOB_STALE_SECONDS`` because it is only called
+    when a worker (re)starts, so jobs orphaned by a crash resume right away; the video's
+    ``processing_checkpoint`` lets the rerun skip stages that already finished. Jobs that
+    have used all their attempts are dead-lettered instead.
+    """
+    stale_before = _dt.datetime.utcnow() - _dt.timedelta(seconds=missed_heartbeat_seconds)
+    interrupted = db.query(_models.ProcessingJob).filter(
+        _models.ProcessingJob.status == JobStatus.RUNNING,
+        _models.ProcessingJob.cancel_requested.is_(False),
+        _sql.or_(
+            _models.ProcessingJob.heartbeat_at.is_(None),
+            _models.ProcessingJob.heartbeat_at < stale_before,
+        ),
+    )
+    exhausted = interrupted.filter(
+        _models.ProcessingJob.attempts >= _models.ProcessingJob.max_attempts
+    ).with_for_update(skip_locked=True)
+    for job_db in exhausted.all():
+        _record_job_failure(job_db, job_db.last_error or JOB_WORKER_LOST_ERROR, db)
+    requeued = (
+        interrupted
+        .filter(_models.ProcessingJob.attempts < _models.ProcessingJob.max_attempts)
+        .update(
+            {
+                _models.ProcessingJob.status: JobStatus.QUEUED,
+                _models.ProcessingJob.locked_by: None,
+                _models.ProcessingJob.available_at: _dt.datetime.utcnow(),
+                _models.ProcessingJob.updated_at: _dt.datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return requeued
+
+
+def heartbeat_processing_job(job_id: int, worker_id: str, db: "Session") -> bool:
+    """Refresh the lease on a running job; returns False if another worker has taken it over."""
+    updated = (
+        db.query(_models.ProcessingJob)
+        .filter(
+            _models.ProcessingJob.id == job_id,
+            _models.ProcessingJob.status == JobStatus.RUNNING,
+            _models.ProcessingJob.locked_by == worker_id,
+        )
+        .update(
+            {_models.ProcessingJob.heartbeat_at: _dt.datetime.utcnow()},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return updated == 1
+
+
+def complete_processing_job(job_id: int, db: "Session") -> None:
+    db.query(_models.ProcessingJob).filter(_models.ProcessingJob.id == job_id).update(
+        {
+            _models.ProcessingJob.status: JobStatus.COMPLETED,
+            _models.ProcessingJob.locked_by: None,
+            _models.ProcessingJob.last_error: None,
+            _models.ProcessingJob.updated_at: _dt.datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def _record_job_failure(job_db: _models.ProcessingJob, error_message: str, db: "Session") -> JobStatus:
+    """Schedule a retry of a failed job, or dead-letter it once its attempts are used up (no commit)."""
+    now = _dt.datetime.utcnow()
+    job_db.last_error = error_message
+    job_db.locked_by = None
+    job_db.updated_at = now
+    if job_db.attempts >= job_db.max_attempts:
+        job_db.status = JobStatus.DEAD
+        media_status = MediaProcessingStatus.DEAD_LETTER
+    else:
+        delay = min(JOB_RETRY_BASE_SECONDS * (2 ** (job_db.attempts - 1)), JOB_RETRY_MAX_SECONDS)
+        job_db.status = JobStatus.QUEUED
+        job_db.available_at = now + _dt.timedelta(seconds=delay)
+        media_status = MediaProcessingStatus.IN_PROGRESS
+
+    db.query(_models.Video).filter(_models.Video.id == job_db.video_id).update(
+        {
+            _models.Video.processing_status: media_status,
+            _models.Video.processing_error: error_message,
+        },
+        synchronize_session=False,
+    )
+    db.query(_models.UploadRecord).filter(_models.UploadRecord.video_id == job_db.video_id).update(
+        {
+            _models.UploadRecord.status: media_status,
+            _models.UploadRecord.error_message: error_message,
+            _models.UploadRecord.updated_at: now,
+        },
+        synchronize_session=False,
+    )
+    return job_db.status
+
+
+def fail_processing_job(job_id: int, error_message: str, db: "Session") -> JobStatus:
+    """Record a failed attempt and either schedule a retry with exponential backoff or dead-letter it.
+
+    While retries remain the video and its upload records stay ``IN_PROGRESS``; once the
+    job is dead they move to ``DEAD_LETTER`` in the same transaction.
+    """
+    job_db = db.query(_models.ProcessingJob).filter(_models.ProcessingJob.id == job_id).first()
+    if job_db is None:
+        raise HTTPException(404, detail="Processing job not found")
+
+    job_status = _record_job_failure(job_db, error_message, db)
+    db.commit()
+    return job_status
+
+
+def _mark_video_cancelled(video_id: int, db: "Session") -> None:
+    db.query(_models.Video).filter(_models.Video.id == video_id).update(
+        {
+            _models.Video.processing_status: MediaProcessingStatus.CANCELLED,
+            _models.Video.processing_stage: ProcessingStage.CANCELLED,
+        },
+        synchronize_session=False,
+    )
+    db.query(_models.UploadRecord).filter(_models.UploadRecord.video_id == video_id).update(
+        {
+            _models.UploadRecord.status: MediaProcessingStatus.CANCELLED,
+            _models.UploadRecord.processing_stage: ProcessingStage.CANCELLED,
+            _models.UploadRecord.updated_at: _dt.datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
+
+
+def request_processing_cancel(video_id: int, db: "Session") -> Optional[JobStatus]:
+    """Cancel the latest processing job of a video.
+
+    Queued jobs, and running jobs whose worker stopped heartbeating, are cancelled at once
+    together with the video and its uploads. A live running job only gets
+    ``cancel_requested``; its worker stops at the next stage boundary and cleans up.
+    Returns the job status after the call (``None`` when the video has no job).
+    """
+    job_db = (
+        db.query(_models.ProcessingJob)
+        .filter(_models.ProcessingJob.video_id == video_id)
+        .order_by(_models.ProcessingJob.id.desc())
+        .with_for_update()
+        .first()
+    )
+    if job_db is None:
+        db.rollback()
+        return None
+
+    stale_before = _dt.datetime.utcnow() - _dt.timedelta(seconds=JOB_STALE_SECONDS)
+    worker_alive = job_db.heartbeat_at is not None and job_db.heartbeat_at >= stale_before
+    if job_db.status == JobStatus.QUEUED or (job_db.status == JobStatus.RUNNING and not worker_alive):
+        job_db.status = JobStatus.CANCELLED
+        job_db.locked_by = None
+        _mark_video_cancelled(video_id, db)
+    elif job_db.status == JobStatus.RUNNING:
+        job_db.cancel_requested = True
+    job_status = job_db.status
+    db.commit()
+    return job_status
+
+
+def is_cancel_requested(video_id: int, db: "Session") -> bool:
+    return db.query(
+        db.query(_models.ProcessingJob)
+        .filter(
+            _models.ProcessingJob.video_id == video_id,
+            _models.ProcessingJob.cancel_requested.is_(True),
+            _models.ProcessingJob.status == JobStatus.RUNNING,
+        )
+        .exists()
+    ).scalar()
+
+
+def cancel_processing_job(job_id: int, video_id: int, db: "Session") -> None:
+    """Finish a job the worker stopped on request, marking the video and its uploads cancelled."""
+    db.query(_models.ProcessingJob).filter(_models.ProcessingJob.id == job_id).update(
+        {
+            _models.ProcessingJob.status: JobStatus.CANCELLED,
+            _models.ProcessingJob.locked_by: None,
+            _models.ProcessingJob.updated_at: _dt.datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
+    _mark_video_cancelled(video_id, db)
+    db.commit()
+
+
+def video_has_labeling_work(video_db: _models.Video, db: "Session") -> bool:
+    """True once any splice of the video left the pending queue (legacy rows included)."""
+    origin = os.path.basename(video_db.path or "")
+    worked = (
+        db.query(_models.Splice.id)
+        .filter(
+            _models.Splice.name == video_db.name,
+            _models.Splice.origin == origin,
+            _models.Splice.status != SpliceStatus.PENDING,
+        )
+        .first()
+    )
+    return worked is not None or any(
+        db.query(model.id).filter(model.name == video_db.name, model.origin == origin).first() is not None
+        for model, _ in LEGACY_SPLICE_MODELS
+    )
+
+
+def reset_video_for_resplice(
+    video_id: int,
+    splice_params: dict,
+    db: "Session",
+    on_removed: Optional[Callable[[list[str]], None]] = None,
+) -> list[str]:
+    """Drop a completed video's splices and queue it to be spliced again with ``splice_params``.
+
+    Refused with 409 unless the video finished processing and none of its splices has been
+    reserved, labeled, validated or rejected. The working audio is kept, so the job resumes
+    from the EXTRACTED checkpoint when it still exists. ``on_removed`` gets the paths of the
+    dropped splice rows before the requeued job is committed, so the old files are out of the
+    way before a worker can write new splices under the same names; if it raises nothing is
+    saved. Returns the same paths.
+    """
+    try:
+        video_db = db.query(_models.Video).filter(_models.Video.id == video_id).with_for_update().first()
+        if video_db is None:
+            raise HTTPException(404, detail="Video not found")
+        if video_db.processing_status != MediaProcessingStatus.COMPLETED:
+            raise HTTPException(409, detail="Only videos that finished processing can be re-spliced")
+
+        splice_query = db.query(_models.Splice).filter(
+            _models.Splice.name == video_db.name,
+            _models.Splice.origin == os.path.basename(video_db.path or ""),
+            _models.Splice.status == SpliceStatus.PENDING,
+        )
+        # Locking the rows first keeps the labeling queue from moving one out mid-check.
+        paths = [row.path for row in splice_query.with_entities(_models.Splice.path).with_for_update()]
+        if video_has_labeling_work(video_db, db):
+            raise HTTPException(409, detail="Splices of this video are already being labeled")
+        splice_query.delete(synchronize_session=False)
+        if on_removed is not None:
+            on_removed(paths)
+
+        audio_ready = bool(video_db.audio_path) and os.path.exists(video_db.audio_path)
+        video_db.splice_params = json.dumps(splice_params)
+        video_db.processing_checkpoint = ProcessingCheckpoint.EXTRACTED if audio_ready else None
+        video_db.splice_manifest = None
+        video_db.splice_status = "False"
+        video_db.processing_status = MediaProcessingStatus.IN_PROGRESS
+        video_db.processing_error = None
+        video_db.processing_stage = ProcessingStage.QUEUED
+        video_db.progress_percent = 0
+        _update_upload_status_for_video(video_id, MediaProcessingStatus.IN_PROGRESS, db)
+        db.query(_models.UploadRecord).filter(_models.UploadRecord.video_id == video_id).update(
+            {"processing_stage": ProcessingStage.QUEUED, "progress_percent": 0},
+            synchronize_session=False,
+        )
+        db.add(_new_processing_job(video_db, db))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return paths
+
+
+def create_upload_session(
+    session_id: str,
+    user_id: str,
+    payload: _schemas.UploadSessionCreate,
+    temp_path: str,
+    expires_at: _dt.datetime,
+    db: "Session",
+) -> _schemas.UploadSession:
+    session_db = _models.UploadSession(
+        id=session_id,
+        user_id=user_id,
+        video_name=payload.video_name,
+        category=payload.video_category,
+        original_filename=payload.filename,
+        total_size=payload.total_size,
+        received_bytes=0,
+        temp_path=temp_path,
+        status="open",
+        expires_at=expires_at,
+    )
+    db.add(session_db)
+    db.commit()
+    db.refresh(session_db)
+    return _schemas.UploadSession.model_validate(session_db)
+
 
-    db.delete(labeled_splice)
+def get_upload_session(db: "Session", session_id: str, user_id: str) -> Optional[_models.UploadSession]:
+    return (
+        db.query(_models.UploadSession)
+        .filter(
+            _models.UploadSession.id == session_id,
+            _models.UploadSession.user_id == user_id,
+        )
+        .first()
+    )
+
+
+def reserve_upload_range(
+    session_id: str,
+    user_id: str,
+    expected_offset: int,
+    writer_token: str,
+    db: "Session",
+) -> bool:
+    """Give one request the exclusive right to write at ``expected_offset``.
+
+    Succeeds only while the session is open at that offset, or its previous writer stopped
+    refreshing the reservation ``UPLOAD_WRITE_LEASE_SECONDS`` ago, so two requests for the
+    same range never write to the file together.
+    """
+    stale_before = _dt.datetime.utcnow() - _dt.timedelta(seconds=UPLOAD_WRITE_LEASE_SECONDS)
+    updated = (
+        db.query(_models.UploadSession)
+        .filter(
+            _models.UploadSession.id == session_id,
+            _models.UploadSession.user_id == user_id,
+            _models.UploadSession.received_bytes == expected_offset,
+            _sql.or_(
+                _models.UploadSession.status == "open",
+                _sql.and_(
+                    _models.UploadSession.status == "receiving",
+                    _models.UploadSession.updated_at < stale_before,
+                ),
+            ),
+        )
+        .update(
+            {
+                _models.UploadSession.status: "receiving",
+                _models.UploadSession.writer_token: writer_token,
+                _models.UploadSession.updated_at: _dt.datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return updated == 1
+
+
+def refresh_upload_range(session_id: str, writer_token: str, db: "Session") -> bool:
+    """Keep a long chunk write's reservation from going stale; False if it was taken over."""
+    updated = (
+        db.query(_models.UploadSession)
+        .filter(
+            _models.UploadSession.id == session_id,
+            _models.UploadSession.status == "receiving",
+            _models.UploadSession.writer_token == writer_token,
+        )
+        .update({_models.UploadSession.updated_at: _dt.datetime.utcnow()}, synchronize_session=False)
+    )
+    db.commit()
+    return updated == 1
+
+
+def advance_upload_session(
+    session_id: str,
+    expected_offset: int,
+    new_offset: int,
+    expires_at: _dt.datetime,
+    db: "Session",
+    writer_token: str,
+) -> bool:
+    """Commit a written range and reopen the session, if ``writer_token`` still holds it at ``expected_offset``."""
+    updated = (
+        db.query(_models.UploadSession)
+        .filter(
+            _models.UploadSession.id == session_id,
+            _models.UploadSession.status == "receiving",
+            _models.UploadSession.writer_token == writer_token,
+            _models.UploadSession.received_bytes == expected_offset,
+        )
+        .update(
+            {
+                _models.UploadSession.received_bytes: new_offset,
+                _models.UploadSession.status: "open",
+                _models.UploadSession.writer_token: None,
+                _models.UploadSession.expires_at: expires_at,
+                _models.UploadSession.updated_at: _dt.datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return updated == 1
+
+
+def claim_upload_session_for_finalize(session_id: str, user_id: str, db: "Session") -> bool:
+    """Flip an open, fully received session to ``finalizing`` so only one request assembles it."""
+    updated = (
+        db.query(_models.UploadSession)
+        .filter(
+            _models.UploadSession.id == session_id,
+            _models.UploadSession.user_id == user_id,
+            _models.UploadSession.status == "open",
+            _models.UploadSession.received_bytes == _models.UploadSession.total_size,
+            _models.UploadSession.expires_at >= _dt.datetime.utcnow(),
+        )
+        .update(
+            {
+                _models.UploadSession.status: "finalizing",
+                _models.UploadSession.updated_at: _dt.datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return updated == 1
+
+
+def update_upload_session(session_id: str, data: dict, db: "Session") -> _schemas.UploadSession:
+    session_db = db.query(_models.UploadSession).filter(_models.UploadSession.id == session_id).first()
+    if session_db is None:
+        raise HTTPException(404, detail="Upload session not found")
+
+    for key, value in data.items():
+        setattr(session_db, key, value)
+
+    db.commit()
+    db.refresh(session_db)
+    return _schemas.UploadSession.model_validate(session_db)
+
+
+def purge_expired_upload_sessions(db: "Session", now: Optional[_dt.datetime] = None) -> list[str]:
+    """Delete sessions past their expiry and return their temp file paths for cleanup."""
+    cutoff = now or _dt.datetime.utcnow()
+    expired = (
+        db.query(_models.UploadSession.id, _models.UploadSession.temp_path)
+        .filter(_models.UploadSession.expires_at < cutoff)
+        .all()
+    )
+    if not expired:
+        return []
+
+    db.query(_models.UploadSession).filter(
+        _models.UploadSession.id.in_([row.id for row in expired])
+    ).delete(synchronize_session=False)
     db.commit()
+    return [row.temp_path for row in expired]
+
 
 async def delete_splice(splice_id: int, db: "Session"):
     db.query(_models.Splice).filter(_models.Splice.id == splice_id).delete()
     db.commit()
 
-async def get_first_labeled_splice(db: "Session") -> _schemas.LabeledSplice:
-    first_splice = db.query(_models.LabeledSplice).order_by(_models.LabeledSplice.id).first()
-    return _schemas.LabeledSplice.model_validate(first_splice) if first_splice else None
 
-async def get_first_splice(db: "Session") -> _schemas.Splice:
-    first_splice = db.query(_models.Splice).order_by(_models.Splice.id).first()
+def _first_splice_in(status: SpliceStatus, db: "Session") -> Optional[_models.Splice]:
+    return (
+        db.query(_models.Splice)
+        .filter(_models.Splice.status == status)
+        .order_by(_models.Splice.id)
+        .first()
+    )
+
+async def get_first_labeled_splice(db: "Session") -> Optional[_schemas.Splice]:
+    first_splice = _first_splice_in(SpliceStatus.LABELED, db)
+    return _schemas.Splice.model_validate(first_splice) if first_splice else None
+
+async def get_first_splice(db: "Session") -> Optional[_schemas.Splice]:
+    first_splice = _first_splice_in(SpliceStatus.PENDING, db)
     return _schemas.Splice.model_validate(first_splice) if first_splice else None
 
-async def get_splice_being_processed(splice_id: int, db: "Session") -> _schemas.SpliceBeingProcessed:
-    return db.query(_models.SpliceBeingProcessed).get(splice_id)
+def get_splice(splice_id: int, db: "Session") -> Optional[_models.Splice]:
+    return db.query(_models.Splice).get(splice_id)
 
-async def delete_splice_being_processed(splice: _schemas.SpliceBeingProcessed, db: "Session") -> None:
+
+def _move_splices(
+    splice_ids: list[int],
+    from_statuses: tuple[SpliceStatus, ...],
+    to_status: SpliceStatus,
+    data: dict,
+    db: "Session",
+    holder_id: Optional[str] = None,
+) -> int:
+    """Set ``to_status`` (and ``data``) on those splices still in ``from_statuses``; does not commit.
+
+    With ``holder_id`` only splices reserved by that user move. Any reservation lease is
+    released unless ``data`` sets a new one. Returns the number of rows moved.
+    """
+    query = db.query(_models.Splice).filter(
+        _models.Splice.id.in_(splice_ids), _models.Splice.status.in_(from_statuses)
+    )
+    if holder_id is not None:
+        query = query.filter(_models.Splice.reserved_by == holder_id)
+    return query.update(
+        {
+            "reserved_by": None,
+            "reserved_until": None,
+            **data,
+            "status": to_status,
+            "updated_at": _dt.datetime.utcnow(),
+        },
+        synchronize_session="evaluate",
+    )
+
+
+def transition_splice(
+    splice_id: int,
+    from_statuses: tuple[SpliceStatus, ...],
+    to_status: SpliceStatus,
+    data: dict,
+    db: "Session",
+    holder_id: Optional[str] = None,
+    on_moved: Optional[Callable[[], Optional[dict]]] = None,
+) -> bool:
+    """Move a splice to another queue with a single UPDATE.
+
+    Returns False when the splice no longer exists, is not in one of ``from_statuses``
+    (e.g. another request finished it first) or, with ``holder_id``, is reserved by someone
+    else. ``on_moved`` runs only once the UPDATE has matched and before the commit, so side
+    effects such as trimming the audio never happen for a rejected move; the columns it
+    returns are saved with the move, and if it raises nothing is saved.
+    """
     try:
-        db.delete(splice)
+        moved = _move_splices([splice_id], from_statuses, to_status, data, db, holder_id) == 1
+        if moved and on_moved is not None:
+            extra = on_moved()
+            if extra:
+                db.query(_models.Splice).filter(_models.Splice.id == splice_id).update(
+                    extra, synchronize_session="evaluate"
+                )
         db.commit()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        db.rollback()
+        raise
+    return moved
+
+
+SPLICE_CLAIM_ATTEMPTS = 5
+# Upper bound for ``count`` on the batch claim endpoints.
+SPLICE_CLAIM_MAX_COUNT = int(os.getenv("SPLICE_CLAIM_MAX_COUNT", "10"))
+# How long a labeling/validation reservation is held before the reaper requeues it.
+SPLICE_LEASE_SECONDS = int(os.getenv("SPLICE_LEASE_SECONDS", "900"))
+SPLICE_LEASE_REAP_BATCH = int(os.getenv("SPLICE_LEASE_REAP_BATCH", "500"))
+# Queue an expired reservation goes back to.
+SPLICE_LEASE_REQUEUE = {
+    SpliceStatus.LABELING: SpliceStatus.PENDING,
+    SpliceStatus.VALIDATING: SpliceStatus.LABELED,
+}
+
+
+def _claim_queued_splices(
+    db: "Session",
+    from_status: SpliceStatus,
+    to_status: SpliceStatus,
+    holder_id: Optional[str],
+    count: int,
+) -> list[_schemas.Splice]:
+    """Reserve up to ``count`` splices for ``holder_id``, moving them from ``from_status`` to ``to_status``.
+
+    Reservations the holder already has in ``to_status`` are handed back first with a
+    renewed lease, so reloading the page does not pile up reservations; only the shortfall
+    is claimed from the queue. Anonymous callers (no ``holder_id``) always claim afresh.
+
+    New candidates come off the status's partial index and are locked with ``FOR UPDATE
+    SKIP LOCKED``, so concurrent claimers each get different rows without waiting on each
+    other; one UPDATE then moves the whole batch. It re-checks the status, and if it moves
+    fewer rows than were picked (databases without row locks) the transaction is rolled
+    back and retried. Only queued rows are ever claimed, so a clip under an active lease
+    is never handed out twice.
+    """
+    lease = {
+        "reserved_by": holder_id,
+        "reserved_until": _dt.datetime.utcnow() + _dt.timedelta(seconds=SPLICE_LEASE_SECONDS),
+    }
+    for _ in range(SPLICE_CLAIM_ATTEMPTS):
+        try:
+            held = get_reserved_splices_for_user(db, holder_id, to_status, count) if holder_id else []
+            candidates = []
+            if len(held) < count:
+                candidates = (
+                    db.query(_models.Splice)
+                    .filter(_models.Splice.status == from_status)
+                    .order_by(_models.Splice.id)
+                    .limit(count - len(held))
+                    .with_for_update(skip_locked=True)
+                    .all()
+                )
+            if not held and not candidates:
+                db.rollback()
+                return []
+            held_ids = [splice.id for splice in held]
+            candidate_ids = [candidate.id for candidate in candidates]
+            if held_ids and _move_splices(held_ids, (to_status,), to_status, lease, db) != len(held_ids):
+                db.rollback()
+                continue
+            if candidate_ids and _move_splices(candidate_ids, (from_status,), to_status, lease, db) != len(candidate_ids):
+                db.rollback()
+                continue
+            claimed = [_schemas.Splice.model_validate(splice) for splice in held + candidates]
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return claimed
+    return []
+
+
+def get_reserved_splices_for_user(
+    db: "Session",
+    user_id: str,
+    status: SpliceStatus,
+    limit: int,
+) -> list[_models.Splice]:
+    """The user's current reservations in ``status`` (LABELING or VALIDATING), oldest first."""
+    return (
+        db.query(_models.Splice)
+        .filter(_models.Splice.reserved_by == user_id, _models.Splice.status == status)
+        .order_by(_models.Splice.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def claim_splices_for_labeling(db: "Session", count: int, holder_id: Optional[str] = None) -> list[_schemas.Splice]:
+    """Reserve up to ``count`` of the oldest pending splices (PENDING -> LABELING) at once."""
+    return _claim_queued_splices(db, SpliceStatus.PENDING, SpliceStatus.LABELING, holder_id, count)
+
+
+def claim_splices_for_validation(db: "Session", count: int, holder_id: Optional[str] = None) -> list[_schemas.Splice]:
+    """Reserve up to ``count`` of the oldest labeled splices (LABELED -> VALIDATING) at once."""
+    return _claim_queued_splices(db, SpliceStatus.LABELED, SpliceStatus.VALIDATING, holder_id, count)
+
+
+def claim_splice_for_labeling(db: "Session", holder_id: Optional[str] = None) -> Optional[_schemas.Splice]:
+    """Reserve the oldest pending splice (PENDING -> LABELING)."""
+    claimed = claim_splices_for_labeling(db, 1, holder_id)
+    return claimed[0] if claimed else None
+
+
+def claim_splice_for_validation(db: "Session", holder_id: Optional[str] = None) -> Optional[_schemas.Splice]:
+    """Reserve the oldest labeled splice awaiting validation (LABELED -> VALIDATING)."""
+    claimed = claim_splices_for_validation(db, 1, holder_id)
+    return claimed[0] if claimed else None
+
+
+def release_expired_splice_leases(
+    db: "Session",
+    now: Optional[_dt.datetime] = None,
+    batch_size: int = SPLICE_LEASE_REAP_BATCH,
+) -> int:
+    """Return reservations whose lease lapsed (e.g. the labeler closed the tab) to their queue.
+
+    Works in UPDATE statements of at most ``batch_size`` rows, each committed on its own,
+    and skips rows another transaction holds (a submission in flight). Returns the number
+    of splices requeued.
+    """
+    now = now or _dt.datetime.utcnow()
+    released = 0
+    for reserved_status, queue_status in SPLICE_LEASE_REQUEUE.items():
+        while True:
+            expired_ids = (
+                select(_models.Splice.id)
+                .where(
+                    _models.Splice.status == reserved_status,
+                    # Reservations taken before leases existed have no expiry; treat them as lapsed.
+                    _sql.or_(_models.Splice.reserved_until < now, _models.Splice.reserved_until.is_(None)),
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            try:
+                batch = (
+                    db.query(_models.Splice)
+                    .filter(_models.Splice.id.in_(expired_ids), _models.Splice.status == reserved_status)
+                    .update(
+                        {"status": queue_status, "reserved_by": None, "reserved_until": None, "updated_at": now},
+                        synchronize_session=False,
+                    )
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            released += batch
+            if batch < batch_size:
+                break
+    return released
+
+
+# Tables of the old copy-and-delete lifecycle and the status their rows get in ``splices``
+# (``None``: decided per row by ``_legacy_splice_status``).
+LEGACY_SPLICE_MODELS = (
+    (_models.LabeledSplice, SpliceStatus.LABELED),
+    (_models.HighQualityLabeledSplice, SpliceStatus.VALIDATED),
+    (_models.DeletedSplice, SpliceStatus.DELETED),
+    (_models.SpliceBeingProcessed, None),
+)
+LEGACY_SPLICE_MIGRATION_BATCH = int(os.getenv("LEGACY_SPLICE_MIGRATION_BATCH", "500"))
+RECORDING_NAME_PREFIX = "recordings_"
+
+
+def _legacy_splice_status(row: _models.SpliceBeingProcessed) -> SpliceStatus:
+    # Old reservations carry no holder to return them to, so they go back to their queue.
+    return SpliceStatus.LABELED if row.status == "labeled" else SpliceStatus.PENDING
+
+
+def _repoint_recorded_splices(moved: list[tuple[_models.LabeledSplice, _models.Splice]], db: "Session") -> None:
+    """Point recorded prompts at the new ids of their migrated labeled rows.
+
+    Snapshots are matched on path as well as id, so a pointer that already carries a new
+    id is never moved again when a later legacy row happens to have that id.
+    """
+    for legacy_row, splice in moved:
+        if not (legacy_row.name or "").startswith(RECORDING_NAME_PREFIX):
+            continue
+        snapshots = (
+            db.query(_models.TextSpliceRecording)
+            .filter(
+                _models.TextSpliceRecording.recorded_splice_id == legacy_row.id,
+                _models.TextSpliceRecording.path == legacy_row.path,
+            )
+            .all()
+        )
+        for snapshot in snapshots:
+            snapshot.recorded_splice_id = splice.id
+            db.query(_models.TextSplice).filter(
+                _models.TextSplice.id == snapshot.text_splice_id,
+                _models.TextSplice.recorded_splice_id == legacy_row.id,
+            ).update({"recorded_splice_id": splice.id}, synchronize_session=False)
+
+
+def migrate_legacy_splice_batch(db: "Session", batch_size: int = LEGACY_SPLICE_MIGRATION_BATCH) -> int:
+    """Move up to ``batch_size`` rows of one legacy lifecycle table into ``splices``.
+
+    Each batch is its own short transaction and locks its rows with ``FOR UPDATE SKIP
+    LOCKED``, so the API keeps serving (and several workers can drain side by side) while
+    the migration runs. Returns the number of rows moved, 0 once every legacy table is empty.
+    """
+    for legacy_model, status in LEGACY_SPLICE_MODELS:
+        try:
+            rows = (
+                db.query(legacy_model)
+                .order_by(legacy_model.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not rows:
+                db.rollback()
+                continue
+            moved = [
+                (
+                    row,
+                    _models.Splice(
+                        name=row.name,
+                        path=row.path,
+                        label=row.label,
+                        origin=row.origin,
+                        duration=row.duration,
+                        validation=row.validation,
+                        owner_id=row.owner_id,
+                        labeler_id=getattr(row, "labeler_id", None),
+                        validator_id=getattr(row, "validator_id", None),
+                        status=status or _legacy_splice_status(row),
+                    ),
+                )
+                for row in rows
+            ]
+            db.add_all([splice for _, splice in moved])
+            db.flush()
+            if legacy_model is _models.LabeledSplice:
+                _repoint_recorded_splices(moved, db)
+            db.query(legacy_model).filter(
+                legacy_model.id.in_([row.id for row in rows])
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(rows)
+    return 0
 
 
 async def create_text_splice(text_splice: _schemas.TextSpliceCreate, db: "Session") -> _schemas.TextSplice:
@@ -347,29 +1486,13 @@ def seed_text_splices(db: "Session", prompts: list[str]) -> int:
         raise
     return len(new_records)
 
-async def create_high_quality_labeled_splice(
-    splice: _schemas.HighQualityLabeledSpliceCreate, db: "Session") -> _schemas.HighQualityLabeledSplice:
-    splice_db = _models.HighQualityLabeledSplice(**splice.model_dump())
-    db.add(splice_db)
-    db.commit()
-    db.refresh(splice_db)
-    return _schemas.HighQualityLabeledSplice.model_validate(splice_db)
-
 async def create_labeled_splice(
-    splice: _schemas.LabeledSpliceCreate, db: "Session") -> _schemas.LabeledSplice:
-    splice_db = _models.LabeledSplice(**splice.model_dump())
+    splice: _schemas.LabeledSpliceCreate, db: "Session") -> _schemas.Splice:
+    splice_db = _models.Splice(**splice.model_dump(), status=SpliceStatus.LABELED)
     db.add(splice_db)
     db.commit()
     db.refresh(splice_db)
-    return _schemas.LabeledSplice.model_validate(splice_db)
-
-async def create_deleted_splice(
-    splice: _schemas.DeletedSpliceCreate, db: "Session") -> _schemas.DeletedSplice:
-    splice_db = _models.DeletedSplice(**splice.model_dump())
-    db.add(splice_db)
-    db.commit()
-    db.refresh(splice_db)
-    return _schemas.DeletedSplice.model_validate(splice_db)
+    return _schemas.Splice.model_validate(splice_db)
 
 def get_user(db: "Session", user_id: str):
     return db.query(_models.User).filter(_models.User.id == user_id).first()
@@ -412,6 +1535,17 @@ def create_user(
     db.refresh(user_db)
     return _schemas.User.model_validate(user_db)
 
+# Statuses of splices that carry a labeler's transcript (rejected ones are not counted).
+LABELED_SPLICE_STATUSES = (SpliceStatus.LABELED, SpliceStatus.VALIDATING, SpliceStatus.VALIDATED)
+# Per-video upload stats bucket of each live status.
+VIDEO_STATS_BUCKETS = {
+    SpliceStatus.PENDING: "unlabeled_count",
+    SpliceStatus.LABELING: "unlabeled_count",
+    SpliceStatus.LABELED: "labeled_count",
+    SpliceStatus.VALIDATING: "labeled_count",
+    SpliceStatus.VALIDATED: "validated_count",
+}
+
 def get_user_stats(db: "Session", user_id: str):
     recording_name_pattern = "recordings_%"
 
@@ -443,55 +1577,28 @@ def get_user_stats(db: "Session", user_id: str):
         .subquery()
     )
 
-    # Labeled count: Exclude auto-recorded clips so recording work is tracked separately
-    labeled_count = (
-        db.query(func.count(_models.LabeledSplice.id))
-        .filter(
-            _models.LabeledSplice.labeler_id == user_id,
-            _models.LabeledSplice.name.notlike(recording_name_pattern),
-            ~_models.LabeledSplice.id.in_(recorded_splice_ids_subquery),
-        )
-        .scalar()
-        or 0
-    )
-    labeled_count += (
-        db.query(func.count(_models.HighQualityLabeledSplice.id))
+    # Labeled: everything the user transcribed that was not rejected, minus recording work.
+    labeled_query = (
+        db.query(_models.Splice.duration)
         .filter(
-            _models.HighQualityLabeledSplice.labeler_id == user_id,
-            _models.HighQualityLabeledSplice.name.notlike(recording_name_pattern),
+            _models.Splice.labeler_id == user_id,
+            _models.Splice.status.in_(LABELED_SPLICE_STATUSES),
+            _models.Splice.name.notlike(recording_name_pattern),
+            ~_models.Splice.id.in_(recorded_splice_ids_subquery),
         )
-        .scalar()
-        or 0
     )
+    labeled_count = labeled_query.count()
+    hours_labeled = sum_duration(labeled_query) / 3600.0
 
-    # Validated count: In HighQuality (validator_id)
-    validated_count = (
-        db.query(func.count(_models.HighQualityLabeledSplice.id))
-        .filter(_models.HighQualityLabeledSplice.validator_id == user_id)
-        .scalar()
-        or 0
-    )
-
-    labeled_q1 = (
-        db.query(_models.LabeledSplice.duration)
-        .filter(
-            _models.LabeledSplice.labeler_id == user_id,
-            _models.LabeledSplice.name.notlike(recording_name_pattern),
-            ~_models.LabeledSplice.id.in_(recorded_splice_ids_subquery),
-        )
-    )
-    labeled_q2 = (
-        db.query(_models.HighQualityLabeledSplice.duration)
+    validated_query = (
+        db.query(_models.Splice.duration)
         .filter(
-            _models.HighQualityLabeledSplice.labeler_id == user_id,
-            _models.HighQualityLabeledSplice.name.notlike(recording_name_pattern),
+            _models.Splice.validator_id == user_id,
+            _models.Splice.status == SpliceStatus.VALIDATED,
         )
     )
-
-    hours_labeled = (sum_duration(labeled_q1) + sum_duration(labeled_q2)) / 3600.0
-
-    validated_q = db.query(_models.HighQualityLabeledSplice.duration).filter(_models.HighQualityLabeledSplice.validator_id == user_id)
-    hours_validated = sum_duration(validated_q) / 3600.0
+    validated_count = validated_query.count()
+    hours_validated = sum_duration(validated_query) / 3600.0
 
     return {
         "recorded_count": recorded_count,
@@ -511,85 +1618,46 @@ def get_user_activity(db: "Session", user_id: str, page: int, page_size: int):
 
     labeled_stmt = (
         select(
-            _models.LabeledSplice.id.label("id"),
-            literal("labeled").label("activity_type"),
-            _models.LabeledSplice.name,
-            _models.LabeledSplice.path,
-            _models.LabeledSplice.label,
-            _models.LabeledSplice.origin,
-            _models.LabeledSplice.duration,
-            _models.LabeledSplice.validation,
-            _models.LabeledSplice.owner_id,
-            _models.LabeledSplice.labeler_id,
-            literal(None).label("validator_id"),
-            (_models.LabeledSplice.id * 10 + 1).label("sort_key"),
-        )
-        .where(
-            _models.LabeledSplice.labeler_id == user_id,
-            _models.LabeledSplice.name.notlike(recording_name_pattern),
-            ~_models.LabeledSplice.id.in_(recorded_splice_ids_subquery),
-        )
-    )
-
-    pending_validation_stmt = (
-        select(
-            _models.SpliceBeingProcessed.id.label("id"),
-            literal("labeled").label("activity_type"),
-            _models.SpliceBeingProcessed.name,
-            _models.SpliceBeingProcessed.path,
-            _models.SpliceBeingProcessed.label,
-            _models.SpliceBeingProcessed.origin,
-            _models.SpliceBeingProcessed.duration,
-            _models.SpliceBeingProcessed.validation,
-            _models.SpliceBeingProcessed.owner_id,
-            _models.SpliceBeingProcessed.labeler_id,
-            _models.SpliceBeingProcessed.validator_id,
-            (_models.SpliceBeingProcessed.id * 10 + 2).label("sort_key"),
-        )
-        .where(
-            _models.SpliceBeingProcessed.status == "labeled",
-            _models.SpliceBeingProcessed.labeler_id == user_id,
-            _models.SpliceBeingProcessed.name.notlike(recording_name_pattern),
-        )
-    )
-
-    high_quality_labeled_stmt = (
-        select(
-            _models.HighQualityLabeledSplice.id.label("id"),
+            _models.Splice.id.label("id"),
             literal("labeled").label("activity_type"),
-            _models.HighQualityLabeledSplice.name,
-            _models.HighQualityLabeledSplice.path,
-            _models.HighQualityLabeledSplice.label,
-            _models.HighQualityLabeledSplice.origin,
-            _models.HighQualityLabeledSplice.duration,
-            _models.HighQualityLabeledSplice.validation,
-            _models.HighQualityLabeledSplice.owner_id,
-            _models.HighQualityLabeledSplice.labeler_id,
-            _models.HighQualityLabeledSplice.validator_id,
-            (_models.HighQualityLabeledSplice.id * 10 + 3).label("sort_key"),
+            _models.Splice.name,
+            _models.Splice.path,
+            _models.Splice.label,
+            _models.Splice.origin,
+            _models.Splice.duration,
+            _models.Splice.validation,
+            _models.Splice.owner_id,
+            _models.Splice.labeler_id,
+            _models.Splice.validator_id,
+            (_models.Splice.id * 10 + 1).label("sort_key"),
         )
         .where(
-            _models.HighQualityLabeledSplice.labeler_id == user_id,
-            _models.HighQualityLabeledSplice.name.notlike(recording_name_pattern),
+            _models.Splice.labeler_id == user_id,
+            _models.Splice.status.in_(LABELED_SPLICE_STATUSES),
+            _models.Splice.name.notlike(recording_name_pattern),
+            ~_models.Splice.id.in_(recorded_splice_ids_subquery),
         )
     )
 
     validated_stmt = (
         select(
-            _models.HighQualityLabeledSplice.id.label("id"),
+            _models.Splice.id.label("id"),
             literal("validated").label("activity_type"),
-            _models.HighQualityLabeledSplice.name,
-            _models.HighQualityLabeledSplice.path,
-            _models.HighQualityLabeledSplice.label,
-            _models.HighQualityLabeledSplice.origin,
-            _models.HighQualityLabeledSplice.duration,
-            _models.HighQualityLabeledSplice.validation,
-            _models.HighQualityLabeledSplice.owner_id,
-            _models.HighQualityLabeledSplice.labeler_id,
-            _models.HighQualityLabeledSplice.validator_id,
-            (_models.HighQualityLabeledSplice.id * 10 + 4).label("sort_key"),
+            _models.Splice.name,
+            _models.Splice.path,
+            _models.Splice.label,
+            _models.Splice.origin,
+            _models.Splice.duration,
+            _models.Splice.validation,
+            _models.Splice.owner_id,
+            _models.Splice.labeler_id,
+            _models.Splice.validator_id,
+            (_models.Splice.id * 10 + 4).label("sort_key"),
+        )
+        .where(
+            _models.Splice.validator_id == user_id,
+            _models.Splice.status == SpliceStatus.VALIDATED,
         )
-        .where(_models.HighQualityLabeledSplice.validator_id == user_id)
     )
 
     recorded_stmt = (
@@ -612,8 +1680,6 @@ def get_user_activity(db: "Session", user_id: str, page: int, page_size: int):
 
     union_subquery = union_all(
         labeled_stmt,
-        pending_validation_stmt,
-        high_quality_labeled_stmt,
         validated_stmt,
         recorded_stmt,
     ).subquery()
@@ -665,55 +1731,15 @@ def get_splice_stats_for_video_names(db: "Session", video_names: list[str]):
 
     stats = {name: _empty() for name in unique_names}
 
-    unlabeled_rows = (
-        db.query(_models.Splice.name, func.count(_models.Splice.id))
-        .filter(_models.Splice.name.in_(unique_names))
-        .group_by(_models.Splice.name)
-        .all()
-    )
-    for name, count in unlabeled_rows:
-        bucket = stats.setdefault(name, _empty())
-        bucket["unlabeled_count"] += count
-        bucket["total_generated"] += count
-
-    labeled_rows = (
-        db.query(_models.LabeledSplice.name, func.count(_models.LabeledSplice.id))
-        .filter(_models.LabeledSplice.name.in_(unique_names))
-        .group_by(_models.LabeledSplice.name)
-        .all()
-    )
-    for name, count in labeled_rows:
-        bucket = stats.setdefault(name, _empty())
-        bucket["labeled_count"] += count
-        bucket["total_generated"] += count
-
-    validated_rows = (
-        db.query(_models.HighQualityLabeledSplice.name, func.count(_models.HighQualityLabeledSplice.id))
-        .filter(_models.HighQualityLabeledSplice.name.in_(unique_names))
-        .group_by(_models.HighQualityLabeledSplice.name)
-        .all()
-    )
-    for name, count in validated_rows:
-        bucket = stats.setdefault(name, _empty())
-        bucket["validated_count"] += count
-        bucket["total_generated"] += count
-
-    processing_rows = (
-        db.query(
-            _models.SpliceBeingProcessed.name,
-            _models.SpliceBeingProcessed.status,
-            func.count(_models.SpliceBeingProcessed.id),
-        )
-        .filter(_models.SpliceBeingProcessed.name.in_(unique_names))
-        .group_by(_models.SpliceBeingProcessed.name, _models.SpliceBeingProcessed.status)
+    status_rows = (
+        db.query(_models.Splice.name, _models.Splice.status, func.count(_models.Splice.id))
+        .filter(_models.Splice.name.in_(unique_names), _models.Splice.status != SpliceStatus.DELETED)
+        .group_by(_models.Splice.name, _models.Splice.status)
         .all()
     )
-    for name, status, count in processing_rows:
+    for name, status, count in status_rows:
         bucket = stats.setdefault(name, _empty())
-        if status == "un_labeled":
-            bucket["unlabeled_count"] += count
-        elif status == "labeled":
-            bucket["labeled_count"] += count
+        bucket[VIDEO_STATS_BUCKETS[status]] += count
         bucket["total_generated"] += count
 
     return stats
@@ -8,13 +8,13 @@ set -e
 
 # Ensure mounted volume directories exist and have correct permissions
 echo "Setting up mounted volume directories..."
-mkdir -p /code/mp3 /code/mp4 /code/splices
-chown -R appuser:appgroup /code/mp3 /code/mp4 /code/splices
-chmod -R 755 /code/mp3 /code/mp4 /code/splices
+mkdir -p /code/mp3 /code/mp4 /code/splices /code/upload_sessions
+chown -R appuser:appgroup /code/mp3 /code/mp4 /code/splices /code/upload_sessions
+chmod -R 755 /code/mp3 /code/mp4 /code/splices /code/upload_sessions
 
 # Debug: show what we have
 echo "Volume contents:"
-ls -la /code/mp3 /code/mp4 /code/splices
+ls -la /code/mp3 /code/mp4 /code/splices /code/upload_sessions
 
 echo "Starting application as appuser..."
 # Drop privileges and run the application
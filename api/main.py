@@ -1,15 +1,22 @@
+import asyncio
+import datetime as _dt
+import errno
 import io
+import json
 import logging
 import math
 import os
+import shutil
+import socket
+import time
 import uuid
-import wave
+import zipfile
 import fcntl
+import hashlib
 from contextlib import asynccontextmanager
-from typing import Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple
 
 from fastapi import (
-    BackgroundTasks,
     Depends,
     FastAPI,
     File,
@@ -18,14 +25,14 @@ from fastapi import (
     Query,
     UploadFile,
     Request,
+    Response,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.requests import ClientDisconnect
 from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from moviepy.editor import VideoFileClip
 from pydub import AudioSegment
-from pydub.silence import split_on_silence, detect_silence
 from sqlalchemy.orm import Session
 from sqlalchemy import func, select
 import sqlalchemy as _sql
@@ -33,8 +40,18 @@ import sqlalchemy as _sql
 from .database import schemas as _schemas
 from .database import services as _services
 from .database import models as _models
-from .database.enums import MediaProcessingStatus
+from .database.enums import JobStatus, MediaProcessingStatus, SpliceStatus
 from .routers import auth, users
+from .services.processing import (
+    MAX_SPLICE_DURATION_MS,
+    MIN_SPLICE_DURATION_MS,
+    _process_video_file,
+    preview_splits,
+    probe_media_duration,
+    processing_job_loop,
+    resume_interrupted_jobs,
+    splice_duration_histogram,
+)
 from .utils.paths import (
     BASE_DIR,
     IS_PRODUCTION,
@@ -44,6 +61,7 @@ from .utils.paths import (
     UPLOAD_DIR_MP3_ABS,
     UPLOAD_DIR_MP4,
     UPLOAD_DIR_MP4_ABS,
+    UPLOAD_SESSIONS_DIR,
     get_public_path,
 )
 from .docs import (
@@ -67,7 +85,22 @@ logger = logging.getLogger(__name__)
 # Constants - Use absolute paths in production (Docker), relative in development
 API_ROOT_PATH = os.getenv("API_ROOT_PATH", "")
 CONSENT_VERSION = os.getenv("CONSENT_VERSION", "2025-12-02")
-MIN_SPLICE_DURATION_MS = int(os.getenv("MIN_SPLICE_DURATION_MS", "30000"))
+# Matches nginx's client_max_body_size; set to 0 to disable the cap.
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", str(500 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+MAX_BATCH_FILES = int(os.getenv("MAX_BATCH_FILES", "100"))
+# Media processing runs in the standalone worker (`python -m api.worker`); enable this only to
+# drain the job queue inside the web process, e.g. for single-process local development.
+PROCESSING_WORKER_ENABLED = os.getenv("PROCESSING_WORKER_ENABLED", "false").lower() == "true"
+UPLOAD_SESSION_TTL = _dt.timedelta(hours=int(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24")))
+UPLOAD_SESSION_GC_INTERVAL_SECONDS = int(os.getenv("UPLOAD_SESSION_GC_INTERVAL_SECONDS", "900"))
+SPLICE_LEASE_REAP_INTERVAL_SECONDS = int(os.getenv("SPLICE_LEASE_REAP_INTERVAL_SECONDS", "60"))
+# Pause between legacy splice migration batches so the drain never hogs the database.
+LEGACY_SPLICE_MIGRATION_PAUSE_SECONDS = float(os.getenv("LEGACY_SPLICE_MIGRATION_PAUSE_SECONDS", "0.5"))
+UPLOAD_EVENTS_POLL_SECONDS = float(os.getenv("UPLOAD_EVENTS_POLL_SECONDS", "1"))
+UPLOAD_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("UPLOAD_EVENTS_KEEPALIVE_SECONDS", "15"))
+# Users allowed to re-splice any video, not only their own uploads.
+MEDIA_OPERATOR_IDS = {uid.strip() for uid in os.getenv("MEDIA_OPERATOR_IDS", "").split(",") if uid.strip()}
 DEFAULT_TEXT_SPLICE_PROMPTS = [f"sample{i}" for i in range(1, 11)]
 
 SAMPLE_FILE_PATH = "sample_audio_njerez_dhe_fate_e2.mp3"
@@ -75,20 +108,61 @@ DOCKER_SAMPLE_PATH = "/code/sample_audio_njerez_dhe_fate_e2.mp3"
 
 # In development, ensure directories exist. In production, entrypoint.sh handles this.
 if not IS_PRODUCTION:
-    for directory in [UPLOAD_DIR_MP4, UPLOAD_DIR_MP3, SPLICES_DIR]:
+    for directory in [UPLOAD_DIR_MP4, UPLOAD_DIR_MP3, SPLICES_DIR, UPLOAD_SESSIONS_DIR]:
         os.makedirs(directory, exist_ok=True)
 
 logger.info(f"Running in {'production' if IS_PRODUCTION else 'development'} mode")
 logger.info(f"Static file directories: mp4={UPLOAD_DIR_MP4_ABS}, mp3={UPLOAD_DIR_MP3_ABS}, splices={SPLICES_DIR_ABS}")
 
 
-def _persist_media_file(
-    video_name: str,
-    filename: str,
-    file_content: bytes,
-) -> Tuple[str, str, str, str, str, Optional[str]]:
-    """Save incoming media to disk and prepare derivative paths."""
+def _stream_to_path(
+    source: BinaryIO,
+    destination_path: str,
+    max_bytes: int = MAX_UPLOAD_SIZE,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Tuple[int, str]:
+    """Copy a file-like object to disk in fixed-size chunks.
+
+    Data lands in a ``.part`` file that is renamed into place once the copy completes, so
+    readers never observe a half-written asset. Raises a 413 ``HTTPException`` as soon as
+    the stream grows past ``max_bytes`` (a value of ``0`` disables the limit).
+
+    Returns the number of bytes written and the SHA-256 hex digest of the content, which
+    is computed on the same pass so deduplication never has to re-read the file.
+    """
+
+    temp_path = f"{destination_path}.part"
+    bytes_written = 0
+    digest = hashlib.sha256()
+    try:
+        with open(temp_path, "wb") as destination:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                bytes_written += len(chunk)
+                if max_bytes and bytes_written > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds the maximum upload size of {max_bytes} bytes.",
+                    )
+                destination.write(chunk)
+                digest.update(chunk)
+        os.replace(temp_path, destination_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return bytes_written, digest.hexdigest()
+
+
+def _media_paths(video_name: str, filename: str) -> Tuple[str, str, str, str, Optional[str], Optional[str]]:
+    """Storage location of an incoming media file and its derivative paths.
 
+    Returns ``(normalized_name, safe_filename, ext, file_location, mp3_path, mp4_path)`` and
+    creates the directories they live in.
+    """
     normalized_name = str(video_name).replace(" ", "_")
     ext = os.path.splitext(filename)[1].lower()
     if ext not in [".mp4", ".mp3"]:
@@ -113,33 +187,72 @@ def _persist_media_file(
         file_location = os.path.join(mp3_dir, safe_filename)
         mp3_path = file_location
 
-    with open(file_location, "wb+") as destination:
-        destination.write(file_content)
-
     return normalized_name, safe_filename, ext, file_location, mp3_path, mp4_path
 
-def _get_wav_duration(wav_path: str) -> float:
-    """Calculates the duration of a WAV file in seconds."""
+
+def _persist_media_file(
+    video_name: str,
+    filename: str,
+    source: BinaryIO,
+    max_bytes: int = MAX_UPLOAD_SIZE,
+) -> Tuple[str, str, str, str, str, Optional[str], str]:
+    """Stream incoming media to disk and prepare derivative paths.
+
+    ``source`` is read in ``UPLOAD_CHUNK_SIZE`` pieces, so peak memory stays flat
+    regardless of the upload size. The last element of the returned tuple is the
+    SHA-256 content hash of the stored file.
+    """
+
+    normalized_name, safe_filename, ext, file_location, mp3_path, mp4_path = _media_paths(video_name, filename)
+    _, content_hash = _stream_to_path(source, file_location, max_bytes=max_bytes)
+
+    return normalized_name, safe_filename, ext, file_location, mp3_path, mp4_path, content_hash
+
+
+def _move_file(source_path: str, destination_path: str) -> None:
+    """Rename ``source_path`` to ``destination_path``, copying across filesystems.
+
+    The compose files mount ``upload_sessions`` and the media directories separately, and
+    rename(2) between mount points fails with ``EXDEV``. The copy lands in a ``.part`` file
+    that is renamed into place before the source is removed.
+    """
     try:
-        with wave.open(wav_path, 'rb') as wav_file:
-            frames = wav_file.getnframes()
-            rate = wav_file.getframerate()
-            return frames / float(rate)
-    except Exception as e:
-        logger.error(f"Error calculating duration for {wav_path}: {e}")
-        return 0.0
+        os.replace(source_path, destination_path)
+        return
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
 
-def _convert_mp4_to_mp3(mp4_path: str, mp3_path: str) -> None:
-    """Converts an MP4 video file to an MP3 audio file."""
+    temp_path = f"{destination_path}.part"
     try:
-        logger.info(f"Converting {mp4_path} to {mp3_path}")
-        video = VideoFileClip(mp4_path)
-        # logger=None suppresses moviepy's stdout progress bar
-        video.audio.write_audiofile(mp3_path, logger=None)
-        video.close()
-    except Exception as e:
-        logger.error(f"Error converting mp4 to mp3: {e}")
-        raise HTTPException(status_code=500, detail=f"Audio conversion failed: {str(e)}")
+        shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, destination_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.remove(source_path)
+
+
+def _adopt_media_file(
+    video_name: str,
+    filename: str,
+    source_path: str,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Tuple[str, str, str, str, str, Optional[str], str]:
+    """``_persist_media_file`` for a file already on disk: hash it and move it into place.
+
+    Used for assembled resumable uploads. The move is a rename when the session directory
+    shares a filesystem with media storage and a copy otherwise (see ``_move_file``).
+    """
+    normalized_name, safe_filename, ext, file_location, mp3_path, mp4_path = _media_paths(video_name, filename)
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as source:
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+    _move_file(source_path, file_location)
+
+    return normalized_name, safe_filename, ext, file_location, mp3_path, mp4_path, digest.hexdigest()
 
 
 def _store_recorded_audio(user_id: str, audio_bytes: bytes) -> Tuple[str, str, float]:
@@ -163,132 +276,75 @@ def _store_recorded_audio(user_id: str, audio_bytes: bytes) -> Tuple[str, str, f
 
     return file_path, filename, duration_seconds
 
-def _splice_audio(
-    file_path: str,
-    video_name: str,
-    min_silence_len: int = 700,
-    silence_thresh: int = -20,
-    keep_silence: int = 150,
-    min_chunk_duration_ms: int = MIN_SPLICE_DURATION_MS,
-) -> None:
-    """Splits audio into chunks based on silence and enforces a minimum duration."""
-    try:
-        logger.info(f"Splicing audio for {video_name}")
-        output_dir = os.path.join(SPLICES_DIR, video_name)
-        os.makedirs(output_dir, exist_ok=True)
-        
-        audio = AudioSegment.from_file(file_path)
-        
-        silences = detect_silence(
-            audio,
-            min_silence_len=min_silence_len,
-            silence_thresh=silence_thresh
-        )
-        
-        last_split = 0
-        
-        for start, end in silences:
-            mid_point = int((start + end) / 2)
-            
-            current_chunk_duration = mid_point - last_split
-            remaining_duration = len(audio) - mid_point
-            
-            if current_chunk_duration >= min_chunk_duration_ms:
-                if remaining_duration < min_chunk_duration_ms:
-                    continue
-                
-                chunk = audio[last_split:mid_point]
-                chunk_filename = f"videoplaybackmp4_{last_split/1000}-{mid_point/1000}.wav"
-                chunk_path = os.path.join(output_dir, chunk_filename)
-                chunk.export(chunk_path, format="wav")
-                
-                last_split = mid_point
-        
-        # Export final chunk
-        final_chunk = audio[last_split:]
-        final_filename = f"videoplaybackmp4_{last_split/1000}-{len(audio)/1000}.wav"
-        final_path = os.path.join(output_dir, final_filename)
-        final_chunk.export(final_path, format="wav")
-            
-    except Exception as e:
-        logger.error(f"Error splicing audio: {e}")
-        raise HTTPException(status_code=500, detail=f"Audio splicing failed: {str(e)}")
 
+def _purge_expired_upload_sessions() -> int:
+    """Drop expired resumable upload sessions and delete their partial files."""
+    db = _services.SessionLocal()
+    try:
+        temp_paths = _services.purge_expired_upload_sessions(db)
+    finally:
+        db.close()
 
-async def _process_video_file(
-    video_id: int,
-    video_name: str,
-    safe_filename: str,
-    ext: str,
-    original_path: str,
-    mp3_path: str,
-    owner_id: str,
-    upload_record_id: Optional[int] = None,
-    db_session: Optional[Session] = None,
-) -> None:
-    """Run conversion, splicing, and status updates for a stored media asset."""
+    for temp_path in temp_paths:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning(f"Could not remove expired upload fragment {temp_path}: {exc}")
+    return len(temp_paths)
+
+
+async def _migrate_legacy_splices() -> None:
+    """Drain the legacy splice lifecycle tables into ``splices`` one short batch at a time."""
+    moved_total = 0
+    while True:
+        db = _services.SessionLocal()
+        try:
+            moved = await run_in_threadpool(_services.migrate_legacy_splice_batch, db)
+        except Exception as exc:
+            logger.error(f"Legacy splice migration failed: {exc}", exc_info=True)
+            return
+        finally:
+            db.close()
+        if not moved:
+            break
+        moved_total += moved
+        await asyncio.sleep(LEGACY_SPLICE_MIGRATION_PAUSE_SECONDS)
+    if moved_total:
+        logger.info(f"Migrated {moved_total} legacy splice rows into the unified splices table")
 
-    db = db_session or _services.SessionLocal()
-    owns_session = db_session is None
 
+def _release_expired_splice_leases() -> int:
+    db = _services.SessionLocal()
     try:
-        if ext == ".mp4":
-            await run_in_threadpool(_convert_mp4_to_mp3, original_path, mp3_path)
-
-        await run_in_threadpool(_splice_audio, mp3_path, video_name)
-
-        splices_output_dir = os.path.join(SPLICES_DIR, video_name)
-        if os.path.exists(splices_output_dir):
-            for splice_file in os.listdir(splices_output_dir):
-                splice_path = os.path.join(splices_output_dir, splice_file)
-                duration = await run_in_threadpool(_get_wav_duration, splice_path)
-
-                create_splice_data = _schemas.SpliceCreate(
-                    name=video_name,
-                    path=splice_path,
-                    origin=safe_filename,
-                    duration=str(duration),
-                    validation="0",
-                    label="",
-                    owner_id=owner_id,
-                )
-                await _services.create_splice(splice=create_splice_data, db=db)
-
-        await _services.update_video_by_id(
-            video_id=video_id,
-            update_data={
-                "mp3_path": mp3_path,
-                "to_mp3_status": "True",
-                "splice_status": "True",
-                "processing_status": MediaProcessingStatus.COMPLETED,
-                "processing_error": None,
-            },
-            db=db,
-        )
-
-        if upload_record_id is not None:
-            _services.set_upload_status(upload_record_id, MediaProcessingStatus.COMPLETED, db)
-    except Exception as exc:
-        logger.error(f"Video processing failed for video_id={video_id}: {exc}", exc_info=True)
-        await _services.update_video_by_id(
-            video_id=video_id,
-            update_data={
-                "processing_status": MediaProcessingStatus.ERROR,
-                "processing_error": str(exc),
-            },
-            db=db,
-        )
-        if upload_record_id is not None:
-            _services.set_upload_status(
-                upload_record_id,
-                MediaProcessingStatus.ERROR,
-                db,
-                error_message=str(exc),
-            )
-        raise
+        return _services.release_expired_splice_leases(db)
     finally:
-        if owns_session:
-            db.close()
+        db.close()
+
+
+async def _splice_lease_reaper() -> None:
+    """Periodically return abandoned labeling/validation reservations to their queues."""
+    while True:
+        try:
+            released = await run_in_threadpool(_release_expired_splice_leases)
+            if released:
+                logger.info(f"Requeued {released} splices with expired reservations")
+        except Exception as exc:
+            logger.error(f"Splice lease reaping failed: {exc}", exc_info=True)
+        await asyncio.sleep(SPLICE_LEASE_REAP_INTERVAL_SECONDS)
+
+
+async def _upload_session_janitor() -> None:
+    """Periodically garbage-collect abandoned resumable uploads."""
+    while True:
+        try:
+            purged = await run_in_threadpool(_purge_expired_upload_sessions)
+            if purged:
+                logger.info(f"Purged {purged} expired upload sessions")
+        except Exception as exc:
+            logger.error(f"Upload session cleanup failed: {exc}", exc_info=True)
+        await asyncio.sleep(UPLOAD_SESSION_GC_INTERVAL_SECONDS)
 
 
 @asynccontextmanager
@@ -385,7 +441,10 @@ async def lifespan(app: FastAPI):
                     # Delete ONLY the sample video records so we can recreate it
                     try:
                         # Delete splices associated with this video
-                        db.query(_models.Splice).filter(_models.Splice.name == existing_video.name).delete()
+                        db.query(_models.Splice).filter(
+                            _models.Splice.name == existing_video.name,
+                            _models.Splice.status == SpliceStatus.PENDING,
+                        ).delete()
                         # Delete the video itself
                         db.delete(existing_video)
                         db.commit()
@@ -411,23 +470,23 @@ async def lifespan(app: FastAPI):
                     if seed_file_path:
                         try:
                             logger.info(f"Reading sample file from: {seed_file_path}")
-                            with open(seed_file_path, "rb") as f:
-                                file_content = f.read()
-                            logger.info(f"Sample file size: {len(file_content)} bytes")
+                            logger.info(f"Sample file size: {os.path.getsize(seed_file_path)} bytes")
                             
                             logger.info("Starting video processing...")
-                            (
-                                normalized_name,
-                                safe_filename,
-                                ext,
-                                file_location,
-                                mp3_path,
-                                _,
-                            ) = _persist_media_file(
-                                video_name="Sample Audio Njerez Dhe Fate E2",
-                                filename="sample_audio_njerez_dhe_fate_e2.mp3",
-                                file_content=file_content,
-                            )
+                            with open(seed_file_path, "rb") as sample_file:
+                                (
+                                    normalized_name,
+                                    safe_filename,
+                                    ext,
+                                    file_location,
+                                    mp3_path,
+                                    _,
+                                    content_hash,
+                                ) = _persist_media_file(
+                                    video_name="Sample Audio Njerez Dhe Fate E2",
+                                    filename="sample_audio_njerez_dhe_fate_e2.mp3",
+                                    source=sample_file,
+                                )
 
                             create_video_data = _schemas.VideoCreate(
                                 name=normalized_name,
@@ -438,6 +497,7 @@ async def lifespan(app: FastAPI):
                                 mp3_path=mp3_path,
                                 uploader_id=system_user.id if system_user else "system",
                                 processing_status=MediaProcessingStatus.IN_PROGRESS,
+                                content_hash=content_hash,
                             )
                             video_record = await _services.create_video(video=create_video_data, db=db)
 
@@ -466,6 +526,14 @@ async def lifespan(app: FastAPI):
                         logger.warning(f"Sample file not found at {DOCKER_SAMPLE_PATH} or {SAMPLE_FILE_PATH}. Skipping seed.")
         except Exception as e:
             logger.error(f"Error during startup seeding: {e}", exc_info=True)
+
+        try:
+            orphaned = _services.enqueue_orphaned_videos(db)
+            if orphaned:
+                logger.info(f"Queued processing jobs for {orphaned} in-progress videos without one")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to queue orphaned videos: {e}", exc_info=True)
         finally:
             db.close()
             
@@ -478,9 +546,21 @@ async def lifespan(app: FastAPI):
         # The 'finally' block here runs after the try block finishes (success or exception).
         # So we just close the file.
         lock_file.close()
-        
-    yield
-    yield
+
+    background_loops = [
+        asyncio.create_task(_upload_session_janitor()),
+        asyncio.create_task(_migrate_legacy_splices()),
+        asyncio.create_task(_splice_lease_reaper()),
+    ]
+    if PROCESSING_WORKER_ENABLED:
+        await run_in_threadpool(resume_interrupted_jobs)
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        background_loops.append(asyncio.create_task(processing_job_loop(worker_id)))
+    try:
+        yield
+    finally:
+        for task in background_loops:
+            task.cancel()
 
 app = FastAPI(
     title=API_TITLE,
@@ -512,18 +592,104 @@ app.mount("/mp4", StaticFiles(directory=UPLOAD_DIR_MP4_ABS), name="mp4")
 app.include_router(auth.router)
 app.include_router(users.router)
 
+
+async def _register_media_uploads(
+    db: Session,
+    owner_id: str,
+    video_category: str,
+    stored_files: list[Tuple[str, tuple]],
+) -> list[Tuple[_schemas.UploadRecord, bool]]:
+    """Create ``Video``/``UploadRecord`` rows for persisted assets and queue their processing.
+
+    ``stored_files`` holds ``(original_filename, _persist_media_file result)`` pairs. All rows,
+    including one durable ``ProcessingJob`` per new video (prioritised by the probed duration),
+    are written in one transaction.
+    Files whose content hash matches an existing video are discarded and their upload record
+    is linked to that video (and therefore its splices) instead of running the pipeline again.
+    Returns ``(upload_record, deduplicated)`` per stored file, in order.
+    """
+    entries = []
+    for original_filename, persisted in stored_files:
+        normalized_name, _, _, file_location, mp3_path, _, content_hash = persisted
+        duration_seconds = await run_in_threadpool(probe_media_duration, file_location)
+        entries.append((
+            _schemas.VideoCreate(
+                name=normalized_name,
+                path=file_location,
+                category=video_category,
+                to_mp3_status="False",
+                splice_status="False",
+                mp3_path=mp3_path,
+                uploader_id=owner_id,
+                processing_status=MediaProcessingStatus.IN_PROGRESS,
+                content_hash=content_hash,
+                duration_seconds=duration_seconds,
+            ),
+            _schemas.UploadRecordCreate(
+                user_id=owner_id,
+                original_filename=original_filename,
+                display_name=normalized_name,
+                category=video_category,
+                consent_version=CONSENT_VERSION,
+                consent_given=True,
+                status=MediaProcessingStatus.IN_PROGRESS,
+            ),
+        ))
+
+    created_rows = _services.create_media_uploads(entries, db)
+
+    results = []
+    for (_, persisted), (video, upload_record, created) in zip(stored_files, created_rows):
+        file_location = persisted[3]
+        if not created:
+            if os.path.abspath(file_location) != os.path.abspath(video.path or ""):
+                try:
+                    os.remove(file_location)
+                except OSError as exc:
+                    logger.warning(f"Could not remove duplicate upload {file_location}: {exc}")
+            logger.info(f"Upload {upload_record.id} duplicates video {video.id}; skipping processing")
+        results.append((upload_record, not created))
+    return results
+
+
+def _discard_persisted_files(db: Session, persisted_files) -> None:
+    """Remove media stored by ``_persist_media_file`` whose registration did not go through.
+
+    A stored file can land on the path of an existing video (same name uploaded again), so
+    paths any video still points at are kept.
+    """
+    locations = {persisted[3] for persisted in persisted_files}
+    if not locations:
+        return
+    try:
+        db.rollback()
+        referenced = {
+            path for (path,) in db.query(_models.Video.path).filter(_models.Video.path.in_(locations))
+        }
+    except Exception as exc:
+        logger.warning(f"Could not check unregistered uploads before removing them, keeping them: {exc}")
+        return
+    for file_location in locations - referenced:
+        try:
+            os.remove(file_location)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning(f"Could not remove unregistered upload {file_location}: {exc}")
+
+
 @app.post(
     "/video/add",
     response_model=_schemas.ResponseModel,
     tags=["Video Intake"],
     summary="Upload and preprocess a new media asset",
     description=(
-        "Accepts MP4 or MP3 files, stores the raw asset, and schedules background processing "
-        "(conversion + splicing) so the client receives an immediate acknowledgement."
+        "Accepts MP4 or MP3 files, streams the raw asset to disk in fixed-size chunks (rejecting bodies above "
+        "`MAX_UPLOAD_SIZE` with 413), and queues a durable processing job (conversion + splicing) so the "
+        "client receives an immediate acknowledgement."
     ),
 )
 async def create_video(
-    background_tasks: BackgroundTasks,
     video_name: str = Form(...),
     video_category: str = Form(...),
     consent: bool = Form(True),
@@ -542,68 +708,459 @@ async def create_video(
     if ext not in [".mp4", ".mp3"]:
         raise HTTPException(status_code=400, detail="Invalid document type. Only .mp4 and .mp3 are supported.")
 
+    if MAX_UPLOAD_SIZE and video_file.size is not None and video_file.size > MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds the maximum upload size of {MAX_UPLOAD_SIZE} bytes.",
+        )
+
     try:
-        file_content = await video_file.read()
-        (
-            normalized_name,
-            safe_filename,
-            ext,
-            file_location,
-            mp3_path,
-            _,
-        ) = _persist_media_file(video_name, filename, file_content)
-
-        create_video_data = _schemas.VideoCreate(
-            name=normalized_name,
-            path=file_location,
-            category=video_category,
-            to_mp3_status="False",
-            splice_status="False",
-            mp3_path=mp3_path,
-            uploader_id=current_user.id,
-            processing_status=MediaProcessingStatus.IN_PROGRESS,
+        persisted = await run_in_threadpool(_persist_media_file, video_name, filename, video_file.file)
+
+        [(upload_record, deduplicated)] = await _register_media_uploads(
+            db,
+            owner_id=current_user.id,
+            video_category=video_category,
+            stored_files=[(filename, persisted)],
         )
-        video_record = await _services.create_video(video=create_video_data, db=db)
 
-        upload_record = await _services.create_upload_record(
-            upload=_schemas.UploadRecordCreate(
-                user_id=current_user.id,
-                video_id=video_record.id,
-                original_filename=filename,
-                display_name=normalized_name,
-                category=video_category,
-                consent_version=CONSENT_VERSION,
-                consent_given=True,
-                status=MediaProcessingStatus.IN_PROGRESS,
+        return _schemas.ResponseModel(
+            status="success",
+            data={
+                "video_id": upload_record.video_id,
+                "upload_id": upload_record.id,
+                "status": upload_record.status.value,
+                "deduplicated": deduplicated,
+            },
+            message=(
+                "Identical media was already uploaded; linked to its existing splices."
+                if deduplicated
+                else "Upload received. Processing has been scheduled."
             ),
-            db=db,
         )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating video: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        background_tasks.add_task(
-            _process_video_file,
-            video_record.id,
-            normalized_name,
-            safe_filename,
-            ext,
-            file_location,
-            mp3_path,
-            current_user.id,
-            upload_record.id,
+
+def _iter_batch_sources(upload_files: List[UploadFile]):
+    """Yield ``(filename, opener, declared_size)`` for every media item in a batch request.
+
+    ``.zip`` uploads are expanded member by member (directories and macOS metadata are
+    skipped); other files are passed through. ``opener`` returns a readable stream so
+    archive members are decompressed straight into ``_persist_media_file`` without being
+    loaded into memory.
+    """
+    for upload_file in upload_files:
+        filename = upload_file.filename or ""
+        if os.path.splitext(filename)[1].lower() != ".zip":
+            yield filename, (lambda handle=upload_file.file: handle), upload_file.size
+            continue
+
+        try:
+            archive = zipfile.ZipFile(upload_file.file)
+        except zipfile.BadZipFile:
+            yield filename, None, None
+            continue
+
+        for member in archive.infolist():
+            member_name = os.path.basename(member.filename)
+            if member.is_dir() or not member_name or member.filename.startswith("__MACOSX/"):
+                continue
+            yield member_name, (lambda info=member, zf=archive: zf.open(info)), member.file_size
+
+
+@app.post(
+    "/video/add/batch",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Upload several media assets in one request",
+    description=(
+        "Accepts many MP4/MP3 files and/or `.zip` archives of them. Each item is streamed to disk, all video and "
+        "upload records are created in a single transaction, and processing for the whole batch is queued "
+        "together. The response lists a per-file status (`queued`, `duplicate`, or `rejected`)."
+    ),
+)
+async def create_video_batch(
+    video_category: str = Form(...),
+    consent: bool = Form(True),
+    video_files: List[UploadFile] = File(...),
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    if not consent:
+        raise HTTPException(status_code=400, detail="Consent is required to upload media.")
+
+    items = []
+    stored_files = []
+    try:
+        for filename, opener, declared_size in _iter_batch_sources(video_files):
+            item = {"filename": filename, "status": "rejected", "video_id": None, "upload_id": None, "error": None}
+            items.append(item)
+
+            if len(items) > MAX_BATCH_FILES:
+                item["error"] = f"Batch limit of {MAX_BATCH_FILES} files exceeded."
+                continue
+            if opener is None:
+                item["error"] = "Archive could not be read."
+                continue
+            if os.path.splitext(filename)[1].lower() not in [".mp4", ".mp3"]:
+                item["error"] = "Invalid document type. Only .mp4 and .mp3 are supported."
+                continue
+            if MAX_UPLOAD_SIZE and declared_size is not None and declared_size > MAX_UPLOAD_SIZE:
+                item["error"] = f"File exceeds the maximum upload size of {MAX_UPLOAD_SIZE} bytes."
+                continue
+
+            video_name = os.path.splitext(filename)[0]
+            try:
+                with opener() as source:
+                    persisted = await run_in_threadpool(_persist_media_file, video_name, filename, source)
+            except HTTPException as exc:
+                item["error"] = exc.detail
+                continue
+            except Exception as exc:
+                logger.error(f"Error storing batch item {filename}: {exc}")
+                item["error"] = "Failed to store file."
+                continue
+            stored_files.append((item, persisted))
+
+        registered = []
+        if stored_files:
+            registered = await _register_media_uploads(
+                db,
+                owner_id=current_user.id,
+                video_category=video_category,
+                stored_files=[(item["filename"], persisted) for item, persisted in stored_files],
+            )
+    except BaseException as e:
+        # No row points at the files stored so far; do not leave them behind.
+        _discard_persisted_files(db, [persisted for _, persisted in stored_files])
+        if isinstance(e, HTTPException) or not isinstance(e, Exception):
+            raise
+        logger.error(f"Error registering batch upload: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    for (item, _), (upload_record, deduplicated) in zip(stored_files, registered):
+        item.update({
+            "status": "duplicate" if deduplicated else "queued",
+            "video_id": upload_record.video_id,
+            "upload_id": upload_record.id,
+        })
+
+    accepted = len(stored_files)
+    return _schemas.ResponseModel(
+        status="success",
+        data={"items": items, "accepted": accepted, "rejected": len(items) - accepted},
+        message=f"{accepted} of {len(items)} files accepted. Processing has been scheduled.",
+    )
+
+
+def _parse_content_range(header_value: Optional[str]) -> Tuple[int, int, Optional[int]]:
+    """Parse ``bytes <start>-<end>/<total>`` into an inclusive byte range plus the declared total."""
+    if not header_value:
+        raise HTTPException(status_code=400, detail="Content-Range header is required.")
+
+    try:
+        unit, _, range_spec = header_value.strip().partition(" ")
+        byte_range, _, total_spec = range_spec.partition("/")
+        start_str, _, end_str = byte_range.partition("-")
+        start, end = int(start_str), int(end_str)
+        total = None if total_spec in ("", "*") else int(total_spec)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Malformed Content-Range header.")
+
+    if unit != "bytes" or start < 0 or end < start:
+        raise HTTPException(status_code=400, detail="Malformed Content-Range header.")
+    return start, end, total
+
+
+def _get_open_upload_session(db: Session, session_id: str, user_id: str) -> _models.UploadSession:
+    """Load a caller-owned session, treating one past its expiry as gone even before the janitor runs."""
+    session = _services.get_upload_session(db, session_id, user_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    if session.expires_at < _dt.datetime.utcnow():
+        raise HTTPException(status_code=410, detail="Upload session has expired")
+    return session
+
+
+def _open_upload_range(path: str, offset: int) -> BinaryIO:
+    """Open a session file for writing at ``offset``, dropping any bytes past it."""
+    destination = open(path, "r+b")
+    destination.seek(offset)
+    destination.truncate()
+    return destination
+
+
+@app.post(
+    "/video/uploads",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Start a resumable media upload",
+    description=(
+        "Opens an upload session for a large MP4 or MP3. Send the bytes with `PUT /video/uploads/{id}` using "
+        "`Content-Range` headers, query the committed offset to resume after a dropped connection, then call "
+        "`/finalize` to hand the assembled file to the regular processing pipeline. Idle sessions expire."
+    ),
+)
+async def create_upload_session(
+    payload: _schemas.UploadSessionCreate,
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    if not payload.consent:
+        raise HTTPException(status_code=400, detail="Consent is required to upload media.")
+
+    ext = os.path.splitext(payload.filename)[1].lower()
+    if ext not in [".mp4", ".mp3"]:
+        raise HTTPException(status_code=400, detail="Invalid document type. Only .mp4 and .mp3 are supported.")
+
+    if MAX_UPLOAD_SIZE and payload.total_size > MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds the maximum upload size of {MAX_UPLOAD_SIZE} bytes.",
+        )
+
+    session_id = uuid.uuid4().hex
+    temp_path = os.path.join(UPLOAD_SESSIONS_DIR, f"{session_id}.part")
+    os.makedirs(UPLOAD_SESSIONS_DIR, exist_ok=True)
+    open(temp_path, "wb").close()
+
+    upload_session = _services.create_upload_session(
+        session_id=session_id,
+        user_id=current_user.id,
+        payload=payload,
+        temp_path=temp_path,
+        expires_at=_dt.datetime.utcnow() + UPLOAD_SESSION_TTL,
+        db=db,
+    )
+    return _schemas.ResponseModel(
+        status="success",
+        data=upload_session.model_dump(),
+        message="Upload session created",
+    )
+
+
+@app.get(
+    "/video/uploads/{session_id}",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Inspect a resumable upload",
+    description="Returns the committed byte offset (`received_bytes`) so clients know where to resume.",
+)
+async def get_upload_session(
+    session_id: str,
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    session = _get_open_upload_session(db, session_id, current_user.id)
+    return _schemas.ResponseModel(
+        status="success",
+        data=_schemas.UploadSession.model_validate(session).model_dump(),
+        message="Upload session retrieved",
+    )
+
+
+@app.put(
+    "/video/uploads/{session_id}",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Append a byte range to a resumable upload",
+    description=(
+        "Streams the raw request body into the session file. The `Content-Range` start must equal the current "
+        "offset; bytes received before a dropped connection are kept so the next attempt can resume from there."
+    ),
+)
+async def put_upload_chunk(
+    session_id: str,
+    request: Request,
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    session = _get_open_upload_session(db, session_id, current_user.id)
+    if session.status not in ("open", "receiving"):
+        raise HTTPException(status_code=409, detail="Upload session is no longer accepting data")
+
+    start, end, total = _parse_content_range(request.headers.get("content-range"))
+    if total is not None and total != session.total_size:
+        raise HTTPException(status_code=400, detail="Content-Range total does not match the session size.")
+    if end >= session.total_size:
+        raise HTTPException(status_code=400, detail="Content-Range exceeds the declared file size.")
+    if start != session.received_bytes:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Chunk must start at the current offset {session.received_bytes}.",
+        )
+    writer_token = uuid.uuid4().hex
+    if not _services.reserve_upload_range(session_id, current_user.id, start, writer_token, db):
+        raise HTTPException(
+            status_code=409,
+            detail="Another chunk is being written to this upload session; re-query the offset.",
         )
 
+    expected_length = end - start + 1
+    written = 0
+    disconnected = False
+
+    def ensure_lease() -> None:
+        # A stalled request may have been taken over by a retry that already rewrote this
+        # range; it must not write another byte through its own handle.
+        if not _services.refresh_upload_range(session_id, writer_token, db):
+            raise HTTPException(
+                status_code=409,
+                detail="This chunk's reservation was taken over by another request; re-query the offset.",
+            )
+
+    try:
+        destination = await run_in_threadpool(_open_upload_range, session.temp_path, start)
+        try:
+            buffer = bytearray()
+            refreshed_at = time.monotonic()
+            try:
+                async for chunk in request.stream():
+                    if written + len(buffer) + len(chunk) > expected_length:
+                        raise HTTPException(status_code=400, detail="Request body is longer than the Content-Range.")
+                    buffer += chunk
+                    if len(buffer) >= UPLOAD_CHUNK_SIZE:
+                        ensure_lease()
+                        await run_in_threadpool(destination.write, bytes(buffer))
+                        written += len(buffer)
+                        buffer.clear()
+                        refreshed_at = time.monotonic()
+                    elif time.monotonic() - refreshed_at > _services.UPLOAD_WRITE_LEASE_SECONDS / 3:
+                        ensure_lease()
+                        refreshed_at = time.monotonic()
+            except ClientDisconnect:
+                disconnected = True
+            # Bytes received before a dropped connection are kept so the client can resume.
+            if buffer:
+                ensure_lease()
+                await run_in_threadpool(destination.write, bytes(buffer))
+                written += len(buffer)
+        finally:
+            await run_in_threadpool(destination.close)
+    except BaseException:
+        # Reopen the session at the old offset (a no-op once the reservation was taken over);
+        # the next writer truncates whatever was written.
+        _services.advance_upload_session(
+            session_id, start, start, _dt.datetime.utcnow() + UPLOAD_SESSION_TTL, db, writer_token
+        )
+        raise
+
+    advanced = _services.advance_upload_session(
+        session_id=session_id,
+        expected_offset=start,
+        new_offset=start + written,
+        expires_at=_dt.datetime.utcnow() + UPLOAD_SESSION_TTL,
+        db=db,
+        writer_token=writer_token,
+    )
+    if not advanced:
+        raise HTTPException(status_code=409, detail="Upload session was modified concurrently; re-query the offset.")
+    if disconnected:
+        logger.info(f"Client disconnected from upload session {session_id} after {written} bytes")
+
+    session = _services.get_upload_session(db, session_id, current_user.id)
+    return _schemas.ResponseModel(
+        status="success",
+        data=_schemas.UploadSession.model_validate(session).model_dump(),
+        message="Chunk stored" if written == expected_length else "Partial chunk stored",
+    )
+
+
+@app.post(
+    "/video/uploads/{session_id}/finalize",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Complete a resumable upload",
+    description=(
+        "Moves the fully received file into media storage, creates the video and upload records, and schedules "
+        "conversion + splicing exactly like `/video/add`. Repeating the call returns the existing upload."
+    ),
+)
+async def finalize_upload_session(
+    session_id: str,
+    response: Response,
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    session = _get_open_upload_session(db, session_id, current_user.id)
+    if session.status == "finalized" and session.upload_record_id is not None:
+        upload_record = _services.get_upload_record(db, session.upload_record_id)
         return _schemas.ResponseModel(
             status="success",
             data={
-                "video_id": video_record.id,
+                "video_id": upload_record.video_id,
                 "upload_id": upload_record.id,
                 "status": upload_record.status.value,
             },
-            message="Upload received. Processing has been scheduled.",
+            message="Upload already finalized",
+        )
+
+    if not _services.claim_upload_session_for_finalize(session_id, current_user.id, db):
+        db.refresh(session)
+        if session.status in ("finalizing", "finalized"):
+            response.status_code = 202
+            return _schemas.ResponseModel(
+                status="finalizing",
+                data=_schemas.UploadSession.model_validate(session).model_dump(),
+                message="Upload is already being finalized; query the session for the result.",
+            )
+        if session.status == "receiving":
+            raise HTTPException(status_code=409, detail="A chunk is still being written to this upload session.")
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload incomplete: received {session.received_bytes} of {session.total_size} bytes.",
+        )
+
+    temp_path = session.temp_path
+    persisted = None
+    try:
+        persisted = await run_in_threadpool(
+            _adopt_media_file, session.video_name, session.original_filename, temp_path
+        )
+
+        [(upload_record, deduplicated)] = await _register_media_uploads(
+            db,
+            owner_id=current_user.id,
+            video_category=session.category,
+            stored_files=[(session.original_filename, persisted)],
         )
     except Exception as e:
-        logger.error(f"Error creating video: {e}")
+        db.rollback()
+        if persisted is not None and os.path.exists(persisted[3]):
+            # Put the assembled file back so the finalize can be retried.
+            await run_in_threadpool(_move_file, persisted[3], temp_path)
+        _services.update_upload_session(session_id, {"status": "open"}, db)
+        if isinstance(e, HTTPException):
+            raise
+        logger.error(f"Error finalizing upload session {session_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    _services.update_upload_session(
+        session_id,
+        {"status": "finalized", "upload_record_id": upload_record.id},
+        db,
+    )
+
+    return _schemas.ResponseModel(
+        status="success",
+        data={
+            "video_id": upload_record.video_id,
+            "upload_id": upload_record.id,
+            "status": upload_record.status.value,
+            "deduplicated": deduplicated,
+        },
+        message=(
+            "Identical media was already uploaded; linked to its existing splices."
+            if deduplicated
+            else "Upload received. Processing has been scheduled."
+        ),
+    )
+
+
 @app.get(
     "/uploads/history",
     response_model=_schemas.ResponseModel,
@@ -646,6 +1203,268 @@ async def list_upload_history(
         message="Upload history retrieved",
     )
 
+
+def _upload_progress_payload(record: _models.UploadRecord) -> dict:
+    return {
+        "upload_id": record.id,
+        "video_id": record.video_id,
+        "status": record.status.value,
+        "stage": record.processing_stage.value if record.processing_stage else None,
+        "percent": record.progress_percent,
+        "error_message": record.error_message,
+        "updated_at": record.updated_at.isoformat() if record.updated_at else None,
+    }
+
+
+def _read_upload_progress(upload_id: int) -> Optional[dict]:
+    db = _services.SessionLocal()
+    try:
+        record = db.get(_models.UploadRecord, upload_id)
+        return _upload_progress_payload(record) if record else None
+    finally:
+        db.close()
+
+
+async def _upload_progress_events(request: Request, upload_id: int):
+    """Yield SSE frames whenever the upload's stage, percentage or status changes.
+
+    Reads a single row by primary key per tick with a short-lived session on the threadpool,
+    and ends the stream once processing reaches a terminal status or the client disconnects.
+    """
+    last_payload = None
+    last_sent = asyncio.get_running_loop().time()
+    while not await request.is_disconnected():
+        payload = await run_in_threadpool(_read_upload_progress, upload_id)
+        if payload is None:
+            yield "event: error\ndata: {\"detail\": \"Upload not found\"}\n\n"
+            return
+
+        now = asyncio.get_running_loop().time()
+        if payload != last_payload:
+            yield f"event: progress\ndata: {json.dumps(payload)}\n\n"
+            last_payload = payload
+            last_sent = now
+        elif now - last_sent >= UPLOAD_EVENTS_KEEPALIVE_SECONDS:
+            yield ": keep-alive\n\n"
+            last_sent = now
+
+        if payload["status"] != MediaProcessingStatus.IN_PROGRESS.value:
+            yield f"event: done\ndata: {json.dumps(payload)}\n\n"
+            return
+        await asyncio.sleep(UPLOAD_EVENTS_POLL_SECONDS)
+
+
+@app.post(
+    "/uploads/{upload_id}/events/token",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Issue a token for an upload's progress stream",
+    description=(
+        "Browsers' `EventSource` cannot send an `Authorization` header, so it passes this short-lived token as "
+        "`?token=` to `/uploads/{upload_id}/events` instead. The token only opens that one upload's stream."
+    ),
+)
+async def create_upload_events_token(
+    upload_id: int,
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    record = _services.get_upload_record(db, upload_id)
+    if record is None or record.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    token, expires_in = auth.create_event_stream_token(current_user, upload_id)
+    return _schemas.ResponseModel(
+        status="success",
+        data={"token": token, "expires_in": expires_in},
+        message="Event stream token issued",
+    )
+
+
+@app.get(
+    "/uploads/{upload_id}/events",
+    tags=["Video Intake"],
+    summary="Stream processing progress for an upload",
+    description=(
+        "Server-sent events stream. Emits a `progress` event with `stage`, `percent` and `status` whenever "
+        "they change, `: keep-alive` comments while idle, and a final `done` event once processing completes "
+        "or fails. Authenticate with a bearer header or with `?token=` from `/uploads/{upload_id}/events/token`."
+    ),
+)
+async def stream_upload_progress(
+    upload_id: int,
+    request: Request,
+    token: Optional[str] = Query(None, description="Event stream token for clients that cannot send headers."),
+    current_user: Optional[_models.User] = Depends(auth.get_optional_user),
+    db: Session = Depends(_services.get_db),
+):
+    if current_user is None and token:
+        current_user = auth.get_event_stream_user(token, upload_id, db)
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    record = _services.get_upload_record(db, upload_id)
+    if record is None or record.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return StreamingResponse(
+        _upload_progress_events(request, upload_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post(
+    "/uploads/{upload_id}/cancel",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Cancel processing of an upload",
+    description=(
+        "Cancels a queued job immediately. A job that is already running stops at its next stage boundary "
+        "and removes the partial audio and splice files it wrote. Uploads whose media is shared with another "
+        "user's upload, or whose processing already finished, cannot be cancelled."
+    ),
+)
+async def cancel_upload_processing(
+    upload_id: int,
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    record = _services.get_upload_record(db, upload_id)
+    if record is None or record.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if record.video_id is None or record.status != MediaProcessingStatus.IN_PROGRESS:
+        raise HTTPException(status_code=409, detail="Upload is not being processed")
+
+    shared = (
+        db.query(_models.UploadRecord.id)
+        .filter(
+            _models.UploadRecord.video_id == record.video_id,
+            _models.UploadRecord.user_id != current_user.id,
+        )
+        .first()
+    )
+    if shared:
+        raise HTTPException(status_code=409, detail="This media is shared with another contributor's upload")
+
+    job_status = _services.request_processing_cancel(record.video_id, db)
+    if job_status == JobStatus.CANCELLED:
+        message = "Processing cancelled"
+    elif job_status == JobStatus.RUNNING:
+        message = "Cancellation requested; processing stops after the current stage"
+    else:
+        raise HTTPException(status_code=409, detail="Upload is not being processed")
+
+    return _schemas.ResponseModel(
+        status="success",
+        data={"upload_id": upload_id, "job_status": job_status.value},
+        message=message,
+    )
+
+
+def _restore_set_aside_splices(set_aside: List[Tuple[str, str]]) -> None:
+    for path, aside in set_aside:
+        try:
+            os.replace(aside, path)
+        except OSError as exc:
+            logger.warning(f"Could not restore splice {path}: {exc}")
+
+
+def _remove_set_aside_splices(set_aside: List[Tuple[str, str]]) -> None:
+    for path, aside in set_aside:
+        try:
+            os.remove(aside)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning(f"Could not remove splice {path}: {exc}")
+
+
+@app.post(
+    "/videos/{video_id}/resplice",
+    response_model=_schemas.ResponseModel,
+    tags=["Video Intake"],
+    summary="Preview or apply new splicing parameters for a video",
+    description=(
+        "With `dry_run` (the default) the video's working audio is scanned with the given silence and "
+        "chunk-duration parameters and the resulting chunk boundaries and a duration histogram are returned; "
+        "nothing is written. Without it, the video's unlabeled splices are removed and the video is queued to "
+        "be spliced again with these parameters. Only the uploader (or a media operator) may re-splice, and "
+        "only before any of its splices has been picked up for labeling."
+    ),
+)
+async def resplice_video(
+    video_id: int,
+    params: _schemas.RespliceRequest,
+    current_user: _models.User = Depends(auth.get_current_user),
+    db: Session = Depends(_services.get_db),
+):
+    video = _services.get_video(db, video_id)
+    if video is None:
+        raise HTTPException(status_code=404, detail="Video not found")
+    if video.uploader_id != current_user.id and current_user.id not in MEDIA_OPERATOR_IDS:
+        raise HTTPException(status_code=403, detail="Not allowed to re-splice this video")
+
+    splice_params = {
+        "min_silence_len": params.min_silence_len,
+        "silence_thresh": params.silence_thresh,
+        "min_chunk_duration_ms": params.min_chunk_duration_ms or MIN_SPLICE_DURATION_MS,
+        "max_chunk_duration_ms": (
+            MAX_SPLICE_DURATION_MS if params.max_chunk_duration_ms is None else params.max_chunk_duration_ms
+        ),
+    }
+
+    if params.dry_run:
+        source = next(
+            (path for path in (video.audio_path, video.mp3_path) if path and os.path.exists(path)),
+            None,
+        )
+        if source is None:
+            raise HTTPException(status_code=409, detail="The video's audio is not available yet")
+        try:
+            bounds = await run_in_threadpool(preview_splits, source, **splice_params)
+        except Exception as exc:
+            logger.error(f"Re-splice preview failed for video {video_id}: {exc}")
+            raise HTTPException(status_code=500, detail="Failed to preview splices")
+        return _schemas.ResponseModel(
+            status="success",
+            data={
+                "video_id": video_id,
+                "params": splice_params,
+                "count": len(bounds),
+                "splices": [{"start": start / 1000, "end": end / 1000} for start, end in bounds],
+                "histogram": splice_duration_histogram(bounds),
+            },
+            message="Dry run; no splices were changed",
+        )
+
+    set_aside: List[Tuple[str, str]] = []
+
+    def set_aside_splices(paths: List[str]) -> None:
+        # Renamed rather than deleted so a failed commit can put them back.
+        for path in paths:
+            try:
+                os.replace(path, f"{path}.resplice")
+            except FileNotFoundError:
+                continue
+            set_aside.append((path, f"{path}.resplice"))
+
+    try:
+        removed_paths = await run_in_threadpool(
+            _services.reset_video_for_resplice, video_id, splice_params, db, set_aside_splices
+        )
+    except BaseException:
+        await run_in_threadpool(_restore_set_aside_splices, set_aside)
+        raise
+    await run_in_threadpool(_remove_set_aside_splices, set_aside)
+    return _schemas.ResponseModel(
+        status="success",
+        data={"video_id": video_id, "params": splice_params, "removed_splices": len(removed_paths)},
+        message="Video queued for re-splicing",
+    )
+
+
 def _prepare_trim_window(start: Optional[float], end: Optional[float]) -> Optional[Tuple[float, float]]:
     """Validates and orders trimming boundaries."""
     if start is None and end is None:
@@ -698,48 +1517,54 @@ def _trim_audio_segment(file_path: str, start: float, end: float) -> Optional[fl
         logger.error("Failed to trim audio file %s: %s", file_path, exc)
         raise HTTPException(status_code=500, detail="Failed to trim audio file")
 
+
+CLAIM_COUNT_QUERY = Query(
+    None,
+    ge=1,
+    le=_services.SPLICE_CLAIM_MAX_COUNT,
+    description="Reserve up to this many clips in one go (e.g. to prefetch audio); `data` is then a list.",
+)
+
+
+def _claimed_splices_response(
+    claimed: List[_schemas.Splice],
+    batch: bool,
+    found_message: str,
+    empty_message: str,
+) -> _schemas.ResponseModel:
+    if not claimed:
+        return _schemas.ResponseModel(status="success", message=empty_message)
+    public = [splice.model_copy(update={"path": get_public_path(splice.path)}) for splice in claimed]
+    return _schemas.ResponseModel(
+        status="success",
+        data=public if batch else public[0],
+        message=found_message,
+    )
+
 @app.get(
     "/audio/to_label",
     response_model=_schemas.ResponseModel,
     tags=["Labeling Queue"],
     summary="Reserve the next splice for labeling",
     description=(
-        "Moves the oldest unfinished splice into the processing bucket, converts the filesystem path into "
-        "a public `/splices` URL, and returns the payload ready for transcription clients."
+        "Atomically marks the oldest pending splice as being labeled (concurrent callers always "
+        "get different splices), converts the filesystem path into a public `/splices` URL, and returns the "
+        "payload ready for transcription clients. The reservation is a lease (`reserved_until`); clips not "
+        "submitted before it lapses go back to the queue. Signed-in callers get their current reservation back "
+        "(with a renewed lease) instead of a new clip. Pass `count` to reserve several clips at once."
     ),
 )
-async def get_audio_to_label(db: Session = Depends(_services.get_db)):
-    first_splice = await _services.get_first_splice(db)
-    if not first_splice:
-        return _schemas.ResponseModel(status="success", message="No audio to label")
-
-    # Transactional logic: Create processing record -> Delete original
+async def get_audio_to_label(
+    count: Optional[int] = CLAIM_COUNT_QUERY,
+    db: Session = Depends(_services.get_db),
+    current_user: Optional[_models.User] = Depends(auth.get_optional_user),
+):
     try:
-        splice_being_processed_data = _schemas.SpliceBeingProcessedCreate(
-            name=first_splice.name,
-            path=first_splice.path,
-            label=first_splice.label,
-            origin=first_splice.origin,
-            duration=first_splice.duration,
-            validation=first_splice.validation,
-            status='un_labeled',
-            owner_id=first_splice.owner_id
-        )
-        processed_splice = await _services.create_splice_being_processed(splice_being_processed_data, db)
-        await _services.delete_splice(first_splice.id, db)
-
-        response_data = processed_splice.model_copy(update={
-            "path": get_public_path(processed_splice.path)
-        })
-
-        return _schemas.ResponseModel(
-            status="success",
-            data=response_data,
-            message="Audio retrieved for labeling"
-        )
+        claimed = _services.claim_splices_for_labeling(db, count or 1, current_user.id if current_user else None)
     except Exception as e:
         logger.error(f"Error retrieving audio to label: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve audio for labeling")
+    return _claimed_splices_response(claimed, count is not None, "Audio retrieved for labeling", "No audio to label")
 
 @app.get(
     "/audio/to_validate",
@@ -747,75 +1572,59 @@ async def get_audio_to_label(db: Session = Depends(_services.get_db)):
     tags=["Labeling Queue"],
     summary="Reserve the next splice for validation",
     description=(
-        "Transitions the next labeled splice into the processing table, ensuring validators always receive "
-        "cache-busted media URLs and up-to-date metadata."
+        "Marks the next labeled splice as being validated, ensuring validators always receive "
+        "cache-busted media URLs and up-to-date metadata. Signed-in callers get their current reservation "
+        "back instead of a new clip. Pass `count` to reserve several clips at once."
     ),
 )
-async def get_audio_to_validate(db: Session = Depends(_services.get_db)):
-    first_splice = await _services.get_first_labeled_splice(db)
-    if not first_splice:
-        return _schemas.ResponseModel(status="success", message="No audio to validate")
-
+async def get_audio_to_validate(
+    count: Optional[int] = CLAIM_COUNT_QUERY,
+    db: Session = Depends(_services.get_db),
+    current_user: Optional[_models.User] = Depends(auth.get_optional_user),
+):
     try:
-        splice_being_processed_data = _schemas.SpliceBeingProcessedCreate(
-            name=first_splice.name,
-            path=first_splice.path,
-            label=first_splice.label,
-            origin=first_splice.origin,
-            duration=first_splice.duration,
-            validation=first_splice.validation,
-            status='labeled',
-            owner_id=first_splice.owner_id,
-            labeler_id=first_splice.labeler_id
-        )
-        processed_splice = await _services.create_splice_being_processed(splice_being_processed_data, db)
-        await _services.delete_labeled_splice(first_splice.id, db)
-
-        response_data = processed_splice.model_copy(update={
-            "path": get_public_path(processed_splice.path)
-        })
-
-        return _schemas.ResponseModel(
-            status="success",
-            data=response_data,
-            message="Audio retrieved for validation"
-        )
+        claimed = _services.claim_splices_for_validation(db, count or 1, current_user.id if current_user else None)
     except Exception as e:
         logger.error(f"Error retrieving audio to validate: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve audio for validation")
+    return _claimed_splices_response(claimed, count is not None, "Audio retrieved for validation", "No audio to validate")
+
+
+def _trim_on_transition(path: str, start: Optional[float], end: Optional[float]):
+    """``transition_splice`` callback that trims the clip once its move has been accepted."""
+    trim_window = _prepare_trim_window(start, end)
+    if not trim_window:
+        return None
+
+    def trim() -> Optional[dict]:
+        new_duration = _trim_audio_segment(path, *trim_window)
+        return {"duration": str(round(new_duration, 3))} if new_duration is not None else None
 
-async def _label_splice_logic(label_splice: _schemas.LabelSplice, db: Session, user_id: str):
-    splice_being_processed = await _services.get_splice_being_processed(label_splice.id, db)
-    if not splice_being_processed or splice_being_processed.status != 'un_labeled':
+    return trim
+
+async def _label_splice_logic(
+    label_splice: _schemas.LabelSplice, db: Session, user_id: str, holder_id: Optional[str] = None
+):
+    splice = _services.get_splice(label_splice.id, db)
+    if not splice or splice.status != SpliceStatus.LABELING:
         raise HTTPException(status_code=404, detail="Splice not found or invalid status")
     
-    trim_window = _prepare_trim_window(label_splice.start, label_splice.end)
-    new_duration = None
-    if trim_window:
-        new_duration = _trim_audio_segment(splice_being_processed.path, *trim_window)
-    
     update_data = {
-        "id": label_splice.id,
         "label": label_splice.label,
         "validation": label_splice.validation or '0.95',
         "labeler_id": user_id,
     }
-    if new_duration is not None:
-        update_data["duration"] = str(round(new_duration, 3))
-    updated_splice = await _services.update_splice_being_processed(splice_id=label_splice.id, data=update_data, db=db)
-
-    labeled_splice_data = _schemas.LabeledSpliceCreate(
-        name=updated_splice.name,
-        path=updated_splice.path,
-        label=label_splice.label,
-        origin=updated_splice.origin,
-        duration=updated_splice.duration,
-        validation=label_splice.validation or '0.95',
-        owner_id=updated_splice.owner_id,
-        labeler_id=user_id
-    )
-    await _services.create_labeled_splice(labeled_splice_data, db)
-    await _services.delete_splice_being_processed(splice_being_processed, db)
+    # Signed-in labelers may only submit clips they hold; the trim runs once that is settled.
+    if not _services.transition_splice(
+        label_splice.id,
+        (SpliceStatus.LABELING,),
+        SpliceStatus.LABELED,
+        update_data,
+        db,
+        holder_id=holder_id,
+        on_moved=_trim_on_transition(splice.path, label_splice.start, label_splice.end),
+    ):
+        raise HTTPException(status_code=404, detail="Splice not found or invalid status")
 
     return _schemas.ResponseModel(status="success", message="Splice labeled and moved successfully")
 
@@ -835,7 +1644,7 @@ async def label_splice(
     current_user: _schemas.User = Depends(auth.get_current_user)
 ):
     try:
-        return await _label_splice_logic(label_splice, db, current_user.id)
+        return await _label_splice_logic(label_splice, db, current_user.id, holder_id=current_user.id)
     except HTTPException:
         raise
     except Exception as e:
@@ -868,47 +1677,30 @@ async def _validate_splice_logic(
     validate_splice: _schemas.ValidateSplice,
     db: Session,
     fallback_validator_id: Optional[str],
+    holder_id: Optional[str] = None,
 ):
-    splice_being_processed = await _services.get_splice_being_processed(validate_splice.id, db)
-    if not splice_being_processed or splice_being_processed.status != 'labeled':
+    splice = _services.get_splice(validate_splice.id, db)
+    if not splice or splice.status != SpliceStatus.VALIDATING:
         raise HTTPException(status_code=404, detail="Splice not found or invalid status")
     validator_id = validate_splice.validator_id or fallback_validator_id
     if not validator_id:
         raise HTTPException(status_code=400, detail="Validator id is required to finalize a splice")
     
-    trim_window = _prepare_trim_window(validate_splice.start, validate_splice.end)
-    new_duration = None
-    if trim_window:
-        new_duration = _trim_audio_segment(splice_being_processed.path, *trim_window)
-    
     update_data = {
-        "id": validate_splice.id,
         "label": validate_splice.label,
         "validation": validate_splice.validation or '1.0',
         "validator_id": validator_id,
     }
-    if new_duration is not None:
-        update_data["duration"] = str(round(new_duration, 3))
-
-    updated_splice = await _services.update_splice_being_processed(
-        splice_id=validate_splice.id,
-        data=update_data,
-        db=db
-    )
-
-    hq_splice_data = _schemas.HighQualityLabeledSpliceCreate(
-        name=updated_splice.name,
-        path=updated_splice.path,
-        label=validate_splice.label,
-        origin=updated_splice.origin,
-        duration=updated_splice.duration,
-        validation=validate_splice.validation or '1.0',
-        owner_id=updated_splice.owner_id,
-        validator_id=validator_id,
-        labeler_id=updated_splice.labeler_id
-    )
-    await _services.create_high_quality_labeled_splice(hq_splice_data, db)
-    await _services.delete_splice_being_processed(splice_being_processed, db)
+    if not _services.transition_splice(
+        validate_splice.id,
+        (SpliceStatus.VALIDATING,),
+        SpliceStatus.VALIDATED,
+        update_data,
+        db,
+        holder_id=holder_id,
+        on_moved=_trim_on_transition(splice.path, validate_splice.start, validate_splice.end),
+    ):
+        raise HTTPException(status_code=404, detail="Splice not found or invalid status")
 
     return _schemas.ResponseModel(status="success", message="Splice validated and moved successfully")
 
@@ -931,7 +1723,7 @@ async def validate_splice(
         if validate_splice.validator_id and validate_splice.validator_id != current_user.id:
             raise HTTPException(status_code=403, detail="Validator mismatch")
         payload = validate_splice.model_copy(update={"validator_id": current_user.id})
-        return await _validate_splice_logic(payload, db, current_user.id)
+        return await _validate_splice_logic(payload, db, current_user.id, holder_id=current_user.id)
     except HTTPException:
         raise
     except Exception as e:
@@ -970,26 +1762,16 @@ async def validate_splice_anonymous(
 )
 async def delete_splice(delete_splice: _schemas.DeleteSplice, db: Session = Depends(_services.get_db)):
     try:
-        splice_being_processed = await _services.get_splice_being_processed(delete_splice.id, db)
-        if not splice_being_processed:
+        # Only reserved clips can be rejected; the row is kept in the DELETED state.
+        if not _services.transition_splice(
+            delete_splice.id,
+            (SpliceStatus.LABELING, SpliceStatus.VALIDATING),
+            SpliceStatus.DELETED,
+            {},
+            db,
+        ):
             raise HTTPException(status_code=404, detail="Splice not found")
 
-        # Move to DeletedSplice
-        deleted_splice_data = _schemas.DeletedSpliceCreate(
-            name=splice_being_processed.name,
-            path=splice_being_processed.path,
-            label=splice_being_processed.label or "",
-            origin=splice_being_processed.origin,
-            duration=splice_being_processed.duration,
-            validation=splice_being_processed.validation or "0",
-            owner_id=splice_being_processed.owner_id,
-            labeler_id=splice_being_processed.labeler_id,
-            validator_id=splice_being_processed.validator_id
-        )
-        await _services.create_deleted_splice(deleted_splice_data, db)
-
-        await _services.delete_splice_being_processed(splice_being_processed, db)
-
         return _schemas.ResponseModel(
             status="success",
             message="Splice deleted successfully"
@@ -1010,7 +1792,12 @@ async def delete_splice(delete_splice: _schemas.DeleteSplice, db: Session = Depe
 )
 async def get_audio_sample(db: Session = Depends(_services.get_db)):
     # Optimized query using ORM
-    path = db.query(_models.Splice.path).order_by(_models.Splice.id).scalar()
+    path = (
+        db.query(_models.Splice.path)
+        .filter(_models.Splice.status == SpliceStatus.PENDING)
+        .order_by(_models.Splice.id)
+        .scalar()
+    )
     if not path:
         return _schemas.ResponseModel(status="success", data=[], message="No audio sample found")
     return _schemas.ResponseModel(status="success", data=path, message="Audio sample retrieved")
@@ -1023,7 +1810,7 @@ async def get_audio_sample(db: Session = Depends(_services.get_db)):
     description="Returns the next labeled splice without reserving it, primarily for monitoring tools.",
 )
 async def next_validation_data(db: Session = Depends(_services.get_db)):
-    first_splice = db.query(_models.LabeledSplice).order_by(_models.LabeledSplice.id).first()
+    first_splice = await _services.get_first_labeled_splice(db)
     if not first_splice:
         return _schemas.ResponseModel(status="success", message="No validation audio found")
     return _schemas.ResponseModel(status="success", data=first_splice, message="Validation audio retrieved")
@@ -1036,7 +1823,12 @@ async def next_validation_data(db: Session = Depends(_services.get_db)):
     description="Provides the ID of the first pending splice to aid lightweight dashboards.",
 )
 async def get_clip_id(db: Session = Depends(_services.get_db)):
-    first_splice_id = db.query(_models.Splice.id).order_by(_models.Splice.id).scalar()
+    first_splice_id = (
+        db.query(_models.Splice.id)
+        .filter(_models.Splice.status == SpliceStatus.PENDING)
+        .order_by(_models.Splice.id)
+        .scalar()
+    )
     if not first_splice_id:
         return _schemas.ResponseModel(status="success", message="No clip ID found")
     return _schemas.ResponseModel(status="success", data=first_splice_id, message="Clip ID retrieved")
@@ -1049,7 +1841,12 @@ async def get_clip_id(db: Session = Depends(_services.get_db)):
     description="Returns only the media path for consumers that need minimal payloads.",
 )
 async def get_validation_audio_link_plus(db: Session = Depends(_services.get_db)):
-    first_splice_path = db.query(_models.Splice.path).order_by(_models.Splice.id).scalar()
+    first_splice_path = (
+        db.query(_models.Splice.path)
+        .filter(_models.Splice.status == SpliceStatus.PENDING)
+        .order_by(_models.Splice.id)
+        .scalar()
+    )
     if not first_splice_path:
         return _schemas.ResponseModel(status="success", data=[], message="No validation audio link found")
     return _schemas.ResponseModel(status="success", data=first_splice_path, message="Validation audio link retrieved")
@@ -1195,23 +1992,28 @@ async def submit_recording(
     description="Returns durations and record counts for unlabeled, labeled, and validated corpora.",
 )
 async def get_summary(db: Session = Depends(_services.get_db)):
-    # Use a single query or parallel execution if possible, but SQLAlchemy session is synchronous usually.
-    # We can just execute them.
-    
-    # Helper to handle None result from sum
-    def get_sum(model, col):
-        return db.query(func.sum(col.cast(_sql.Float))).scalar() or 0.0
-    
-    def get_count(model):
-        return db.query(func.count(model.id)).scalar() or 0
+    totals = {
+        status: (count, duration or 0.0)
+        for status, count, duration in db.query(
+            _models.Splice.status,
+            func.count(_models.Splice.id),
+            func.sum(_models.Splice.duration.cast(_sql.Float)),
+        ).group_by(_models.Splice.status)
+    }
+
+    def get_count(status):
+        return totals.get(status, (0, 0.0))[0]
+
+    def get_sum(status):
+        return totals.get(status, (0, 0.0))[1]
 
     data = {
-        "total_duration_labeled": get_sum(_models.LabeledSplice, _models.LabeledSplice.duration),
-        "total_duration_validated": get_sum(_models.HighQualityLabeledSplice, _models.HighQualityLabeledSplice.duration),
-        "total_duration_unlabeled": get_sum(_models.Splice, _models.Splice.duration),
-        "total_labeled": get_count(_models.LabeledSplice),
-        "total_validated": get_count(_models.HighQualityLabeledSplice),
-        "total_unlabeled": get_count(_models.Splice),
+        "total_duration_labeled": get_sum(SpliceStatus.LABELED),
+        "total_duration_validated": get_sum(SpliceStatus.VALIDATED),
+        "total_duration_unlabeled": get_sum(SpliceStatus.PENDING),
+        "total_labeled": get_count(SpliceStatus.LABELED),
+        "total_validated": get_count(SpliceStatus.VALIDATED),
+        "total_unlabeled": get_count(SpliceStatus.PENDING),
     }
 
     return _schemas.ResponseModel(
@@ -32,9 +32,11 @@ GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 VERIFICATION_CODE_EXPIRE_MINUTES = 15
 RESET_CODE_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+EVENT_STREAM_TOKEN_EXPIRE_SECONDS = int(os.getenv("EVENT_STREAM_TOKEN_EXPIRE_SECONDS", "60"))
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -63,6 +65,24 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
     return _create_token(data, expires, "refresh")
 
 
+def create_event_stream_token(user: models.User, upload_id: int):
+    """A short-lived token for one upload's event stream, sent as a query parameter by ``EventSource``."""
+    expires = timedelta(seconds=EVENT_STREAM_TOKEN_EXPIRE_SECONDS)
+    return _create_token({"sub": user.email, "id": user.id, "upload_id": upload_id}, expires, "event_stream")
+
+
+def get_event_stream_user(token: str, upload_id: int, db: Session) -> Optional[models.User]:
+    """The user an event-stream token was issued to, or ``None`` if it is invalid or for another upload."""
+    try:
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("token_type") != "event_stream" or payload.get("upload_id") != upload_id:
+        return None
+    user_id: Optional[str] = payload.get("id")
+    return services.get_user(db, user_id=user_id) if user_id else None
+
+
 def _token_pair_response(user: models.User) -> schemas.Token:
     access_token, expires_in = create_access_token({"sub": user.email, "id": user.id})
     refresh_token, _ = create_refresh_token({"sub": user.email, "id": user.id})
@@ -94,6 +114,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         raise credentials_exception
     return user
 
+
+async def get_optional_user(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> Optional[models.User]:
+    """The caller when a valid bearer token is sent, otherwise ``None`` (anonymous access)."""
+    if not token:
+        return None
+    try:
+        return await get_current_user(token, db)
+    except HTTPException:
+        return None
+
 @router.post("/register", response_model=schemas.RegisterResponse)
 def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """
@@ -0,0 +1,113 @@
+"""Energy envelope sidecars for working audio.
+
+The per-millisecond energy of a source is computed once and stored next to it as
+``<audio>.energy.npy`` (the array) and ``<audio>.energy.json`` (its PCM format plus the
+source's size and mtime). Splicing, re-splicing and previews memory-map the array instead of
+decoding the audio again; a sidecar whose source has changed is ignored and rebuilt. The
+streaming splicer fills a new sidecar in place through ``create_energy_envelope``.
+"""
+
+import json
+import logging
+import os
+import wave
+from typing import Optional, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+
+from .silence import EnergyEnvelope, audio_energy_envelope, wav_energy_envelope
+
+logger = logging.getLogger(__name__)
+
+ENVELOPE_SUFFIX = ".energy.npy"
+ENVELOPE_META_SUFFIX = ".energy.json"
+
+
+def envelope_paths(audio_path: str) -> Tuple[str, str]:
+    """``(array_path, metadata_path)`` of the sidecar belonging to ``audio_path``."""
+    return f"{audio_path}{ENVELOPE_SUFFIX}", f"{audio_path}{ENVELOPE_META_SUFFIX}"
+
+
+def _source_signature(audio_path: str) -> dict:
+    stat = os.stat(audio_path)
+    return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+
+def load_energy_envelope(audio_path: str) -> Optional[EnergyEnvelope]:
+    """Memory-mapped envelope of ``audio_path``, or ``None`` if there is no valid sidecar."""
+    array_path, meta_path = envelope_paths(audio_path)
+    try:
+        with open(meta_path) as handle:
+            meta = json.load(handle)
+        if {key: meta.get(key) for key in ("source_size", "source_mtime_ns")} != _source_signature(audio_path):
+            return None
+        energy = np.load(array_path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if energy.ndim != 1 or len(energy) != meta.get("length_ms"):
+        return None
+    return EnergyEnvelope(energy, meta["frame_rate"], meta["channels"], meta["sample_width"])
+
+
+def create_energy_envelope(audio_path: str, length_ms: int, dtype) -> np.ndarray:
+    """Writable memory map of a sidecar array that is still being filled in.
+
+    The array lives in ``<audio>.energy.npy.part`` until an envelope backed by it is passed
+    to ``save_energy_envelope``, which flushes and renames it instead of writing a copy.
+    """
+    array_path, _ = envelope_paths(audio_path)
+    return np.lib.format.open_memmap(f"{array_path}.part", mode="w+", dtype=dtype, shape=(length_ms,))
+
+
+def _is_partial_sidecar(energy: np.ndarray, array_path: str) -> bool:
+    filename = getattr(energy, "filename", None)
+    return bool(filename) and os.path.abspath(filename) == os.path.abspath(f"{array_path}.part")
+
+
+def save_energy_envelope(audio_path: str, envelope: EnergyEnvelope) -> None:
+    """Write the sidecar for ``audio_path``; the metadata goes last so a partial write is never loaded."""
+    array_path, meta_path = envelope_paths(audio_path)
+    meta = {
+        "frame_rate": envelope.frame_rate,
+        "channels": envelope.channels,
+        "sample_width": envelope.sample_width,
+        "length_ms": envelope.length_ms,
+        **_source_signature(audio_path),
+    }
+    if _is_partial_sidecar(envelope.energy, array_path):
+        envelope.energy.flush()
+    else:
+        with open(f"{array_path}.part", "wb") as handle:
+            np.save(handle, np.asarray(envelope.energy))
+    os.replace(f"{array_path}.part", array_path)
+    with open(f"{meta_path}.part", "w") as handle:
+        json.dump(meta, handle)
+    os.replace(f"{meta_path}.part", meta_path)
+
+
+def store_energy_envelope(audio_path: str, envelope: EnergyEnvelope) -> None:
+    """``save_energy_envelope`` for callers that already have their result; a failure is only logged."""
+    try:
+        save_energy_envelope(audio_path, envelope)
+    except OSError as exc:
+        logger.warning(f"Could not write energy envelope for {audio_path}: {exc}")
+
+
+def ensure_energy_envelope(audio_path: str) -> EnergyEnvelope:
+    """Envelope of ``audio_path`` from its sidecar, computing and storing it first if needed.
+
+    WAV files are scanned block by block; anything else is decoded once with pydub.
+    """
+    envelope = load_energy_envelope(audio_path)
+    if envelope is not None:
+        return envelope
+    if audio_path.lower().endswith(".wav"):
+        try:
+            envelope = wav_energy_envelope(audio_path)
+        except (ValueError, wave.Error):
+            pass
+    if envelope is None:
+        envelope = audio_energy_envelope(AudioSegment.from_file(audio_path))
+    store_energy_envelope(audio_path, envelope)
+    return envelope
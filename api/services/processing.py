@@ -0,0 +1,1033 @@
+"""Media processing pipeline and durable job runner.
+
+Conversion, splicing, and splice registration live here so they can run either inside the
+API process or in the standalone worker (``python -m api.worker``) without importing the
+web application.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import subprocess
+import time
+import wave
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from moviepy.editor import VideoFileClip
+from pydub import AudioSegment
+from pydub.utils import get_prober_name
+from sqlalchemy.orm import Session
+
+from ..database import database as _database
+from ..database import schemas as _schemas
+from ..database import services as _services
+from ..database.enums import MediaProcessingStatus, ProcessingCheckpoint, ProcessingStage
+from ..utils.paths import SPLICES_DIR, UPLOAD_DIR_MP3
+from .envelope import (
+    create_energy_envelope,
+    envelope_paths,
+    ensure_energy_envelope,
+    load_energy_envelope,
+    store_energy_envelope,
+)
+from .silence import (
+    SILENCE_DETECTORS,
+    EnergyEnvelope,
+    StreamingSilenceDetector,
+    audio_energy_envelope,
+    detect_silence_envelope,
+    energy_dtype,
+)
+
+logger = logging.getLogger(__name__)
+
+MIN_SPLICE_DURATION_MS = int(os.getenv("MIN_SPLICE_DURATION_MS", "30000"))
+# Chunks longer than this are split at their quietest frame (0 disables the limit).
+MAX_SPLICE_DURATION_MS = int(os.getenv("MAX_SPLICE_DURATION_MS", "120000"))
+# Length of the frames compared when looking for the quietest point of an oversized chunk.
+SPLIT_FRAME_MS = int(os.getenv("SPLIT_FRAME_MS", "20"))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "5"))
+JOB_HEARTBEAT_SECONDS = int(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+# "pcm" demuxes the audio stream straight to WAV with ffmpeg; "mp3" keeps the legacy
+# moviepy MP4 -> MP3 conversion followed by a second decode in the splicer.
+AUDIO_EXTRACTION_MODE = os.getenv("AUDIO_EXTRACTION_MODE", "pcm").lower()
+EXTRACTION_SAMPLE_RATE = int(os.getenv("EXTRACTION_SAMPLE_RATE", "16000"))
+EXTRACTION_CHANNELS = int(os.getenv("EXTRACTION_CHANNELS", "1"))
+# Silence detection backend for the splicer: "numpy" (vectorized) or "pydub" (reference).
+SILENCE_DETECTOR = os.getenv("SILENCE_DETECTOR", "numpy").lower()
+# Chunks whose share of detected non-speech exceeds this are not exported (1 keeps every chunk).
+MAX_NON_SPEECH_RATIO = float(os.getenv("MAX_NON_SPEECH_RATIO", "1"))
+# With non-speech dropping on, silences at least this long are cut out of the splices entirely.
+NON_SPEECH_GAP_MS = int(os.getenv("NON_SPEECH_GAP_MS", "5000"))
+# "streaming" splices WAV sources window by window; "memory" decodes the whole track first.
+# The streaming detector is the numpy one; the "pydub" and "vad" detectors, and dropping
+# non-speech chunks (which needs the whole range list), use the in-memory splicer.
+SPLICE_MODE = os.getenv("SPLICE_MODE", "streaming").lower()
+SPLICE_WINDOW_MS = int(os.getenv("SPLICE_WINDOW_MS", "10000"))
+# Threads used to write chunk files in the in-memory splicer (1 writes them sequentially).
+SPLICE_EXPORT_THREADS = int(os.getenv("SPLICE_EXPORT_THREADS", "1"))
+# Decode memory all workers' running jobs may reserve together, in MB (0 disables admission control).
+DECODE_MEMORY_BUDGET_MB = int(os.getenv("DECODE_MEMORY_BUDGET_MB", "0"))
+# Peak memory of an in-memory decode relative to its raw PCM size (file bytes, samples, copies).
+DECODE_MEMORY_OVERHEAD = float(os.getenv("DECODE_MEMORY_OVERHEAD", "2.5"))
+# Format the legacy MP3 path decodes at (moviepy writes 44.1 kHz stereo).
+LEGACY_DECODE_SAMPLE_RATE = 44100
+LEGACY_DECODE_CHANNELS = 2
+# Minimum interval between progress writes from inside a stage.
+PROGRESS_UPDATE_SECONDS = float(os.getenv("PROGRESS_UPDATE_SECONDS", "1"))
+# Share of the overall percentage each stage covers: (start, end).
+STAGE_PERCENT_RANGES = {
+    ProcessingStage.EXTRACTING: (0, 30),
+    ProcessingStage.SPLICING: (30, 90),
+    ProcessingStage.REGISTERING: (90, 99),
+}
+
+RESUMABLE_AFTER_EXTRACT = (ProcessingCheckpoint.EXTRACTED, ProcessingCheckpoint.SPLICED)
+# Splicer arguments a video may override through ``Video.splice_params``.
+SPLICE_PARAM_NAMES = ("min_silence_len", "silence_thresh", "min_chunk_duration_ms", "max_chunk_duration_ms")
+# Bucket edges (seconds) of the chunk-length histogram returned by a re-splice preview.
+SPLICE_HISTOGRAM_EDGES = [0, 10, 20, 30, 45, 60, 90, 120, 300, float("inf")]
+
+# CPU-heavy stages run here when set (the worker installs a process pool); otherwise they
+# fall back to the default thread pool. The factory is kept so a broken pool can be rebuilt.
+_media_executor: Optional[Executor] = None
+_media_executor_factory: Optional[Callable[[], Executor]] = None
+
+
+class SpliceSegment(NamedTuple):
+    """One exported chunk; ``start``, ``end`` and ``duration`` are in seconds."""
+    path: str
+    start: float
+    end: float
+    duration: float
+
+
+class ProcessingCancelled(Exception):
+    """Raised between pipeline stages when the video's job has been asked to cancel."""
+
+
+class MediaProcessingError(RuntimeError):
+    """A conversion or splicing stage failed.
+
+    Stages may run in the worker's process pool, so failures are reported with this plain
+    (picklable) exception; web handlers translate it into an HTTP error themselves.
+    """
+
+
+class StageProgress:
+    """Persists a stage's progress (0.0-1.0) as an overall percentage on the video and its uploads.
+
+    Writes are throttled to one per ``PROGRESS_UPDATE_SECONDS`` and go through a fresh session,
+    so instances can be handed to splicers running in the worker's process pool (whose
+    children run ``init_media_worker_process`` to get connections of their own). Progress
+    reporting never fails the stage that reports it.
+    """
+
+    def __init__(self, video_id: int, stage: ProcessingStage):
+        self.video_id = video_id
+        self.stage = stage
+        self.start_percent, self.end_percent = STAGE_PERCENT_RANGES[stage]
+        self._last_percent: Optional[int] = None
+        self._last_write = 0.0
+
+    def __call__(self, fraction: float) -> None:
+        fraction = max(0.0, min(1.0, fraction))
+        percent = int(self.start_percent + (self.end_percent - self.start_percent) * fraction)
+        now = time.monotonic()
+        if percent == self._last_percent:
+            return
+        if fraction < 1.0 and now - self._last_write < PROGRESS_UPDATE_SECONDS:
+            return
+        db = _services.SessionLocal()
+        try:
+            _services.set_processing_progress(self.video_id, self.stage, percent, db)
+            self._last_percent = percent
+            self._last_write = now
+        except Exception as exc:
+            logger.warning(f"Could not record progress for video {self.video_id}: {exc}")
+        finally:
+            db.close()
+
+
+def _uses_streaming_splicer(splice_source: str) -> bool:
+    return (
+        SPLICE_MODE == "streaming"
+        and SILENCE_DETECTOR == "numpy"
+        and MAX_NON_SPEECH_RATIO >= 1
+        and splice_source.lower().endswith(".wav")
+    )
+
+
+def decode_bytes_per_second() -> float:
+    """Estimated peak memory per second of media for a job under the current configuration.
+
+    PCM extraction decodes at ``EXTRACTION_SAMPLE_RATE`` x ``EXTRACTION_CHANNELS``; the legacy
+    MP3 path at 44.1 kHz stereo. The in-memory splicer holds the whole 16-bit track (times
+    ``DECODE_MEMORY_OVERHEAD``). The streaming splicer's heap holds only a window; its
+    8-byte per millisecond energy envelope (about 29 MB per hour) is written through a
+    memory map of the sidecar, and is still counted in full because those dirty pages are
+    resident until the kernel writes them back.
+    """
+    if AUDIO_EXTRACTION_MODE == "pcm":
+        if _uses_streaming_splicer(".wav"):
+            return 8 * 1000
+        rate, channels = EXTRACTION_SAMPLE_RATE, EXTRACTION_CHANNELS
+    else:
+        rate, channels = LEGACY_DECODE_SAMPLE_RATE, LEGACY_DECODE_CHANNELS
+    return rate * channels * 2 * DECODE_MEMORY_OVERHEAD
+
+
+def configure_media_executor(factory: Optional[Callable[[], Executor]]) -> None:
+    """Route conversion and splicing through an executor built by ``factory``.
+
+    ``None`` shuts the current executor down and restores the thread pool.
+    """
+    global _media_executor, _media_executor_factory
+    previous = _media_executor
+    _media_executor_factory = factory
+    _media_executor = factory() if factory else None
+    if previous is not None:
+        previous.shutdown(wait=False, cancel_futures=True)
+
+
+def init_media_worker_process() -> None:
+    """Process-pool initializer: forget the database connections inherited from the parent.
+
+    Forked children start with a copy of the parent's engine pool; ``StageProgress`` opens
+    sessions in the child, and reusing a pooled connection the parent also uses would
+    interleave both processes on one Postgres socket. ``close=False`` leaves the parent's
+    connections open for the parent.
+    """
+    _database.engine.dispose(close=False)
+
+
+def _replace_broken_executor(broken: Executor) -> None:
+    """Swap a pool whose child died (crash, OOM kill) for a fresh one from the same factory."""
+    global _media_executor
+    if _media_executor is not broken or _media_executor_factory is None:
+        return
+    logger.warning("Media process pool is broken; starting a new one")
+    _media_executor = _media_executor_factory()
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_media_task(func: Callable, *args):
+    """Run a blocking media stage off the event loop on the configured executor."""
+    executor = _media_executor
+    if executor is None:
+        return await run_in_threadpool(func, *args)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool as exc:
+        _replace_broken_executor(executor)
+        raise MediaProcessingError(f"Media worker process died: {exc}") from exc
+
+
+def _convert_mp4_to_mp3(mp4_path: str, mp3_path: str) -> None:
+    """Converts an MP4 video file to an MP3 audio file."""
+    try:
+        logger.info(f"Converting {mp4_path} to {mp3_path}")
+        root, ext = os.path.splitext(mp3_path)
+        # moviepy picks the codec from the extension, so the temp name keeps it.
+        tmp_path = f"{root}.part{ext}"
+        video = VideoFileClip(mp4_path)
+        # logger=None suppresses moviepy's stdout progress bar
+        video.audio.write_audiofile(tmp_path, logger=None)
+        video.close()
+        os.replace(tmp_path, mp3_path)
+    except Exception as e:
+        logger.error(f"Error converting mp4 to mp3: {e}")
+        raise MediaProcessingError(f"Audio conversion failed: {e}") from e
+
+
+def _extract_audio_pcm(
+    source_path: str,
+    wav_path: str,
+    sample_rate: int = EXTRACTION_SAMPLE_RATE,
+    channels: int = EXTRACTION_CHANNELS,
+) -> None:
+    """Demuxes the first audio stream of ``source_path`` into 16-bit PCM WAV.
+
+    Only the audio stream is decoded (``-vn``), so video frames are never touched, and the
+    output is resampled once to ``sample_rate``. The WAV is written next to its final path
+    and renamed into place so a crash never leaves a truncated file behind.
+    """
+    tmp_path = f"{wav_path}.part"
+    command = [
+        AudioSegment.converter, "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", source_path,
+        "-map", "0:a:0", "-vn", "-sn", "-dn",
+        "-ac", str(channels), "-ar", str(sample_rate),
+        "-c:a", "pcm_s16le", "-f", "wav",
+        tmp_path,
+    ]
+    try:
+        logger.info(f"Extracting audio from {source_path} to {wav_path} ({sample_rate} Hz, {channels} ch)")
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode("utf-8", errors="replace").strip() or "ffmpeg failed")
+        os.replace(tmp_path, wav_path)
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        logger.error(f"Error extracting audio: {e}")
+        raise MediaProcessingError(f"Audio extraction failed: {e}") from e
+
+
+def probe_media_duration(path: str) -> Optional[float]:
+    """Media duration in seconds from the container header, or a bitrate estimate from the size.
+
+    Used for queue priority only, so a rough figure is enough; returns ``None`` when neither
+    ffprobe nor the file size is available.
+    """
+    try:
+        result = subprocess.run(
+            [
+                get_prober_name(), "-v", "error", "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1", path,
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+        if result.returncode == 0:
+            return float(result.stdout.decode().strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        pass
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return None
+    # ~128 kbit/s audio, ~1.5 Mbit/s video.
+    bytes_per_second = 16_000 if path.lower().endswith(".mp3") else 190_000
+    return size / bytes_per_second
+
+
+def _load_manifest(raw: Optional[str]) -> Optional[List[SpliceSegment]]:
+    """Manifest saved at the SPLICED checkpoint, or ``None`` if it is missing or any chunk is gone."""
+    if not raw:
+        return None
+    try:
+        manifest = [SpliceSegment(*entry) for entry in json.loads(raw)]
+    except (TypeError, ValueError):
+        return None
+    if not all(os.path.exists(segment.path) for segment in manifest):
+        return None
+    return manifest
+
+
+def _working_audio_path(video_name: str, safe_filename: str, suffix: str = ".wav") -> str:
+    """Location of the video's decoded working audio inside its MP3 directory."""
+    return os.path.join(UPLOAD_DIR_MP3, video_name, f"{os.path.splitext(safe_filename)[0]}{suffix}")
+
+
+def _split_oversized(
+    start_ms: int,
+    end_ms: int,
+    energy: Callable[[int, int], np.ndarray],
+    min_chunk_duration_ms: int,
+    max_chunk_duration_ms: int,
+) -> List[Tuple[int, int]]:
+    """Break ``[start_ms, end_ms)`` into pieces no longer than ``max_chunk_duration_ms``.
+
+    Each cut goes to the centre of the quietest ``SPLIT_FRAME_MS`` frame between
+    ``min_piece`` after the current start and ``max_chunk_duration_ms`` after it, where
+    ``min_piece`` is the smaller of the minimum duration and half the maximum, so both
+    sides of every cut stay at least ``min_piece`` long. ``energy(a, b)`` returns the
+    per-millisecond energy of ``[a, b)``. ``min_piece`` is at least 1 ms, so every cut
+    advances the start and the loop terminates for any positive maximum.
+    """
+    if not max_chunk_duration_ms or end_ms - start_ms <= max_chunk_duration_ms:
+        return [(start_ms, end_ms)]
+    min_piece = max(1, min(min_chunk_duration_ms, max_chunk_duration_ms // 2))
+    frame = max(1, min(SPLIT_FRAME_MS, min_piece))
+    pieces = []
+    while end_ms - start_ms > max_chunk_duration_ms:
+        low = start_ms + min_piece
+        high = min(start_ms + max_chunk_duration_ms, end_ms - min_piece)
+        # Frames centred between ``low`` and ``high``.
+        window = np.asarray(energy(low - frame // 2, high + frame - frame // 2), dtype=np.float64)
+        running = np.concatenate(([0.0], np.cumsum(window)))
+        frame_energy = running[frame:] - running[:-frame]
+        # The latest of equally quiet frames, so pieces stay as long as allowed.
+        candidates = frame_energy[:high - low + 1]
+        cut = high - int(np.argmin(candidates[::-1]))
+        if cut <= start_ms:
+            raise MediaProcessingError(f"Split of [{start_ms}, {end_ms}) ms did not advance")
+        pieces.append((start_ms, cut))
+        start_ms = cut
+    pieces.append((start_ms, end_ms))
+    return pieces
+
+
+def _plan_splits(
+    silences: List[List[int]],
+    length_ms: int,
+    min_chunk_duration_ms: int,
+    max_chunk_duration_ms: int = 0,
+    energy: Optional[Callable[[int, int], np.ndarray]] = None,
+) -> List[Tuple[int, int]]:
+    """Chunk ``(start_ms, end_ms)`` bounds: cut at the middle of every silence that leaves at
+    least ``min_chunk_duration_ms`` on both sides, and let the last chunk run to the end.
+    With ``max_chunk_duration_ms`` and ``energy``, longer chunks go through ``_split_oversized``."""
+    bounds = []
+    last_split = 0
+    for start, end in silences:
+        mid_point = int((start + end) / 2)
+        if mid_point - last_split < min_chunk_duration_ms:
+            continue
+        if length_ms - mid_point < min_chunk_duration_ms:
+            continue
+        bounds.append((last_split, mid_point))
+        last_split = mid_point
+    bounds.append((last_split, length_ms))
+    if not max_chunk_duration_ms or energy is None:
+        return bounds
+    return [
+        piece
+        for chunk_start, chunk_end in bounds
+        for piece in _split_oversized(chunk_start, chunk_end, energy, min_chunk_duration_ms, max_chunk_duration_ms)
+    ]
+
+
+def _drop_non_speech(
+    bounds: List[Tuple[int, int]],
+    silences: List[List[int]],
+    length_ms: int,
+    max_non_speech_ratio: float,
+) -> List[Tuple[int, int]]:
+    """Keep the chunks whose share of milliseconds inside ``silences`` is at most ``max_non_speech_ratio``."""
+    if max_non_speech_ratio >= 1 or not bounds:
+        return bounds
+    non_speech = np.zeros(length_ms + 1, dtype=np.int64)
+    for start, end in silences:
+        non_speech[start] += 1
+        non_speech[min(end, length_ms)] -= 1
+    covered = np.concatenate(([0], np.cumsum(np.cumsum(non_speech)[:length_ms] > 0)))
+    return [
+        (start, end)
+        for start, end in bounds
+        if end <= start or (covered[end] - covered[start]) / (end - start) <= max_non_speech_ratio
+    ]
+
+
+def _plan_chunks(
+    silences: List[List[int]],
+    length_ms: int,
+    min_chunk_duration_ms: int,
+    max_chunk_duration_ms: int,
+    energy: Callable[[int, int], np.ndarray],
+    max_non_speech_ratio: float,
+) -> List[Tuple[int, int]]:
+    """``_plan_splits`` plus non-speech removal when ``max_non_speech_ratio`` is below 1.
+
+    Silences of at least ``NON_SPEECH_GAP_MS`` are then left out entirely and the audio
+    between them is planned island by island; an island shorter than the minimum duration
+    becomes one short chunk. Remaining chunks go through ``_drop_non_speech``.
+    """
+    if max_non_speech_ratio >= 1:
+        return _plan_splits(silences, length_ms, min_chunk_duration_ms, max_chunk_duration_ms, energy)
+
+    bounds = []
+    island_start = 0
+    inner: List[List[int]] = []
+    for start, end in [*silences, [length_ms, length_ms]]:
+        if end - start < NON_SPEECH_GAP_MS and start < length_ms:
+            inner.append([start - island_start, end - island_start])
+            continue
+        if start > island_start:
+            offset = island_start
+            island = _plan_splits(
+                inner,
+                start - offset,
+                min_chunk_duration_ms,
+                max_chunk_duration_ms,
+                lambda a, b: energy(a + offset, b + offset),
+            )
+            bounds.extend((chunk_start + offset, chunk_end + offset) for chunk_start, chunk_end in island)
+        island_start = end
+        inner = []
+    return _drop_non_speech(bounds, silences, length_ms, max_non_speech_ratio)
+
+
+def plan_audio_splits(
+    audio: AudioSegment,
+    envelope: EnergyEnvelope,
+    detector: str = SILENCE_DETECTOR,
+    min_silence_len: int = 700,
+    silence_thresh: int = -20,
+    min_chunk_duration_ms: int = MIN_SPLICE_DURATION_MS,
+    max_chunk_duration_ms: int = MAX_SPLICE_DURATION_MS,
+    max_non_speech_ratio: float = MAX_NON_SPEECH_RATIO,
+) -> List[Tuple[int, int]]:
+    """Chunk bounds for decoded ``audio`` using the ``detector`` splitter backend.
+
+    ``envelope`` must describe ``audio``; the "numpy" backend runs on it directly and every
+    backend uses it to split oversized chunks. Chunks dominated by non-speech are dropped
+    according to ``max_non_speech_ratio``.
+    """
+    if detector not in SILENCE_DETECTORS:
+        raise ValueError(f"Unknown silence detector '{detector}'")
+    if detector == "numpy":
+        silences = detect_silence_envelope(envelope, min_silence_len=min_silence_len, silence_thresh=silence_thresh)
+    else:
+        silences = SILENCE_DETECTORS[detector](
+            audio,
+            min_silence_len=min_silence_len,
+            silence_thresh=silence_thresh
+        )
+    return _plan_chunks(
+        silences,
+        len(audio),
+        min_chunk_duration_ms,
+        max_chunk_duration_ms,
+        _envelope_slice(envelope),
+        max_non_speech_ratio,
+    )
+
+
+def _envelope_slice(envelope: EnergyEnvelope) -> Callable[[int, int], np.ndarray]:
+    return lambda start_ms, end_ms: envelope.energy[start_ms:end_ms]
+
+
+def preview_splits(
+    file_path: str,
+    min_silence_len: int = 700,
+    silence_thresh: int = -20,
+    min_chunk_duration_ms: int = MIN_SPLICE_DURATION_MS,
+    max_chunk_duration_ms: int = MAX_SPLICE_DURATION_MS,
+    detector: str = SILENCE_DETECTOR,
+    max_non_speech_ratio: float = MAX_NON_SPEECH_RATIO,
+) -> List[Tuple[int, int]]:
+    """Chunk bounds the splicer would produce for ``file_path`` with these parameters.
+
+    Reads only the energy envelope sidecar (building it on first use), so previews of an
+    ingested file never decode the audio, except for the "vad" backend, which needs the
+    samples. Nothing but the sidecar is written.
+    """
+    envelope = ensure_energy_envelope(file_path)
+    if detector == "vad":
+        return plan_audio_splits(
+            AudioSegment.from_file(file_path),
+            envelope,
+            detector,
+            min_silence_len=min_silence_len,
+            silence_thresh=silence_thresh,
+            min_chunk_duration_ms=min_chunk_duration_ms,
+            max_chunk_duration_ms=max_chunk_duration_ms,
+            max_non_speech_ratio=max_non_speech_ratio,
+        )
+    silences = detect_silence_envelope(envelope, min_silence_len=min_silence_len, silence_thresh=silence_thresh)
+    return _plan_chunks(
+        silences,
+        envelope.length_ms,
+        min_chunk_duration_ms,
+        max_chunk_duration_ms,
+        _envelope_slice(envelope),
+        max_non_speech_ratio,
+    )
+
+
+def splice_duration_histogram(bounds: List[Tuple[int, int]]) -> List[dict]:
+    """Count chunks per ``SPLICE_HISTOGRAM_EDGES`` bucket; the last bucket is open-ended."""
+    durations = [(end - start) / 1000 for start, end in bounds]
+    counts, edges = np.histogram(durations, bins=SPLICE_HISTOGRAM_EDGES)
+    return [
+        {
+            "min_seconds": float(low),
+            "max_seconds": None if np.isinf(high) else float(high),
+            "count": int(count),
+        }
+        for low, high, count in zip(edges[:-1], edges[1:], counts)
+    ]
+
+
+def _write_wav_chunk(
+    chunk_path: str,
+    frames: memoryview,
+    channels: int,
+    sample_width: int,
+    frame_rate: int,
+) -> None:
+    """Writes a PCM slice as a WAV file without copying it through an AudioSegment."""
+    if sample_width == 1:
+        # pydub keeps 8-bit audio signed in memory; WAV stores it unsigned.
+        frames = np.frombuffer(frames, dtype=np.uint8) ^ 0x80
+    tmp_path = f"{chunk_path}.part"
+    with wave.open(tmp_path, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(frame_rate)
+        writer.writeframes(frames)
+    os.replace(tmp_path, chunk_path)
+
+
+def _splice_audio(
+    file_path: str,
+    video_name: str,
+    min_silence_len: int = 700,
+    silence_thresh: int = -20,
+    keep_silence: int = 150,
+    min_chunk_duration_ms: int = MIN_SPLICE_DURATION_MS,
+    max_chunk_duration_ms: int = MAX_SPLICE_DURATION_MS,
+    detector: str = SILENCE_DETECTOR,
+    max_non_speech_ratio: float = MAX_NON_SPEECH_RATIO,
+    export_threads: int = SPLICE_EXPORT_THREADS,
+    progress: Optional[Callable[[float], None]] = None,
+) -> List[SpliceSegment]:
+    """Splits audio into chunks based on silence (or non-speech, with the "vad" backend) and
+    enforces the chunk duration limits.
+
+    The source is decoded once; the returned manifest describes exactly the chunks written
+    by this call, in order, so callers never need to list or reopen the output directory.
+    Chunks are written straight from slices of the decoded buffer, ``export_threads`` at a
+    time. ``progress`` receives the completed fraction after detection and after writing.
+    """
+    try:
+        logger.info(f"Splicing audio for {video_name}")
+        output_dir = os.path.join(SPLICES_DIR, video_name)
+        os.makedirs(output_dir, exist_ok=True)
+
+        if detector not in SILENCE_DETECTORS:
+            raise ValueError(f"Unknown silence detector '{detector}'")
+
+        audio = AudioSegment.from_file(file_path)
+
+        # The envelope sidecar replaces the energy pass; it is saved for later re-splices.
+        envelope = load_energy_envelope(file_path)
+        if envelope is None:
+            envelope = audio_energy_envelope(audio)
+            store_energy_envelope(file_path, envelope)
+        bounds = plan_audio_splits(
+            audio,
+            envelope,
+            detector,
+            min_silence_len=min_silence_len,
+            silence_thresh=silence_thresh,
+            min_chunk_duration_ms=min_chunk_duration_ms,
+            max_chunk_duration_ms=max_chunk_duration_ms,
+            max_non_speech_ratio=max_non_speech_ratio,
+        )
+
+        manifest: List[SpliceSegment] = []
+        pending_writes = []
+        pcm = memoryview(audio.raw_data)
+        frame_width = audio.frame_width
+        total_frames = len(pcm) // frame_width
+
+        def export_chunk(start_ms: int, end_ms: int) -> None:
+            # Same millisecond -> frame rounding as pydub slicing.
+            first_frame = int(start_ms * audio.frame_rate / 1000.0)
+            last_frame = min(int(end_ms * audio.frame_rate / 1000.0), total_frames)
+            chunk_filename = f"videoplaybackmp4_{start_ms/1000}-{end_ms/1000}.wav"
+            chunk_path = os.path.join(output_dir, chunk_filename)
+            pending_writes.append((chunk_path, pcm[first_frame * frame_width:last_frame * frame_width]))
+            manifest.append(SpliceSegment(
+                path=chunk_path,
+                start=start_ms / 1000,
+                end=end_ms / 1000,
+                duration=(last_frame - first_frame) / float(audio.frame_rate),
+            ))
+
+        for start_ms, end_ms in bounds:
+            export_chunk(start_ms, end_ms)
+        if progress:
+            progress(0.5)
+
+        def write_chunk(item) -> None:
+            _write_wav_chunk(item[0], item[1], audio.channels, audio.sample_width, audio.frame_rate)
+
+        if export_threads > 1 and len(pending_writes) > 1:
+            with ThreadPoolExecutor(max_workers=export_threads) as pool:
+                list(pool.map(write_chunk, pending_writes))
+        else:
+            for item in pending_writes:
+                write_chunk(item)
+        if progress:
+            progress(1.0)
+        return manifest
+
+    except Exception as e:
+        logger.error(f"Error splicing audio: {e}")
+        raise MediaProcessingError(f"Audio splicing failed: {e}") from e
+
+
+def _splice_audio_streaming(
+    file_path: str,
+    video_name: str,
+    min_silence_len: int = 700,
+    silence_thresh: int = -20,
+    keep_silence: int = 150,
+    min_chunk_duration_ms: int = MIN_SPLICE_DURATION_MS,
+    max_chunk_duration_ms: int = MAX_SPLICE_DURATION_MS,
+    window_ms: int = SPLICE_WINDOW_MS,
+    progress: Optional[Callable[[float], None]] = None,
+) -> List[SpliceSegment]:
+    """Splices a PCM WAV with the same cut rules as ``_splice_audio`` in bounded memory.
+
+    The file is read ``window_ms`` at a time and fed to a streaming silence detector. Each
+    chunk is copied from a second handle on the same file as soon as its cut point is
+    known. The detector writes the per-millisecond energy envelope (8 bytes per ms, about
+    29 MB per hour) straight into a memory map of its sidecar, which oversized chunks are
+    also split from, so the heap holds only a window and the envelope's pages are file
+    backed. When a sidecar already exists the cuts are planned from it and the file is only
+    read to copy chunks. ``progress`` receives the fraction of frames read after every
+    window (or of chunks written, with a sidecar).
+    """
+    try:
+        logger.info(f"Splicing audio for {video_name} (streaming)")
+        output_dir = os.path.join(SPLICES_DIR, video_name)
+        os.makedirs(output_dir, exist_ok=True)
+
+        with wave.open(file_path, "rb") as reader, wave.open(file_path, "rb") as chunk_reader:
+            frame_rate = reader.getframerate()
+            total_frames = reader.getnframes()
+            window_frames = max(1, frame_rate * window_ms // 1000)
+            length_ms = round(1000 * (total_frames / frame_rate))
+            envelope = load_energy_envelope(file_path)
+            detector = None
+            if envelope is None:
+                dtype = energy_dtype(reader.getsampwidth())
+                try:
+                    energy_out = create_energy_envelope(file_path, length_ms, dtype)
+                except (OSError, ValueError) as exc:
+                    logger.warning(f"Could not create energy sidecar for {file_path}, keeping it in memory: {exc}")
+                    energy_out = np.zeros(length_ms, dtype=dtype)
+                detector = StreamingSilenceDetector(
+                    frame_rate,
+                    reader.getnchannels(),
+                    reader.getsampwidth(),
+                    total_frames,
+                    min_silence_len=min_silence_len,
+                    silence_thresh=silence_thresh,
+                    energy_out=energy_out,
+                )
+            manifest: List[SpliceSegment] = []
+
+            def export_chunk(start_ms: int, end_ms: int) -> None:
+                # Same millisecond -> frame rounding as pydub slicing.
+                first_frame = int(start_ms * frame_rate / 1000.0)
+                last_frame = min(int(end_ms * frame_rate / 1000.0), total_frames)
+                chunk_filename = f"videoplaybackmp4_{start_ms/1000}-{end_ms/1000}.wav"
+                chunk_path = os.path.join(output_dir, chunk_filename)
+                tmp_path = f"{chunk_path}.part"
+                chunk_reader.setpos(first_frame)
+                with wave.open(tmp_path, "wb") as writer:
+                    writer.setparams(reader.getparams())
+                    remaining = last_frame - first_frame
+                    while remaining > 0:
+                        data = chunk_reader.readframes(min(window_frames, remaining))
+                        if not data:
+                            break
+                        writer.writeframesraw(data)
+                        remaining -= len(data) // reader.getsampwidth() // reader.getnchannels()
+                os.replace(tmp_path, chunk_path)
+                manifest.append(SpliceSegment(
+                    path=chunk_path,
+                    start=start_ms / 1000,
+                    end=end_ms / 1000,
+                    duration=(last_frame - first_frame) / float(frame_rate),
+                ))
+
+            if envelope is not None:
+                silences = detect_silence_envelope(
+                    envelope, min_silence_len=min_silence_len, silence_thresh=silence_thresh
+                )
+                bounds = _plan_splits(
+                    silences, length_ms, min_chunk_duration_ms, max_chunk_duration_ms, _envelope_slice(envelope)
+                )
+                for index, (start_ms, end_ms) in enumerate(bounds, start=1):
+                    export_chunk(start_ms, end_ms)
+                    if progress:
+                        progress(index / len(bounds))
+                return manifest
+
+            last_split = 0
+
+            def recorded_energy(start_ms: int, end_ms: int) -> np.ndarray:
+                return energy_out[start_ms:end_ms]
+
+            def export_bounded(start_ms: int, end_ms: int) -> None:
+                for piece in _split_oversized(
+                    start_ms, end_ms, recorded_energy, min_chunk_duration_ms, max_chunk_duration_ms
+                ):
+                    export_chunk(*piece)
+
+            def consider(silences: List[List[int]]) -> None:
+                nonlocal last_split
+                for start, end in silences:
+                    mid_point = int((start + end) / 2)
+                    if mid_point - last_split < min_chunk_duration_ms:
+                        continue
+                    if length_ms - mid_point < min_chunk_duration_ms:
+                        continue
+                    export_bounded(last_split, mid_point)
+                    last_split = mid_point
+
+            while True:
+                data = reader.readframes(window_frames)
+                if not data:
+                    break
+                consider(detector.feed(data))
+                if progress and total_frames:
+                    progress(reader.tell() / total_frames)
+            consider(detector.finish())
+
+            # Export final chunk
+            export_bounded(last_split, length_ms)
+            if progress:
+                progress(1.0)
+        store_energy_envelope(file_path, detector.envelope())
+        return manifest
+
+    except Exception as e:
+        logger.error(f"Error splicing audio: {e}")
+        raise MediaProcessingError(f"Audio splicing failed: {e}") from e
+
+
+async def _process_video_file(
+    video_id: int,
+    video_name: str,
+    safe_filename: str,
+    ext: str,
+    original_path: str,
+    mp3_path: Optional[str],
+    owner_id: str,
+    db_session: Optional[Session] = None,
+) -> None:
+    """Run conversion, splicing, and status updates for a stored media asset.
+
+    Status changes are applied to every upload record linked to the video, so
+    deduplicated uploads follow the original through to completion. Each stage records a
+    ``processing_checkpoint`` once its output is in place, and a rerun (retry or crash
+    resume) skips every stage whose checkpoint and files are still valid; a video whose
+    splices are already registered is left untouched.
+    """
+
+    db = db_session or _services.SessionLocal()
+    owns_session = db_session is None
+    outputs: List[str] = []
+
+    def check_cancelled() -> None:
+        if _services.is_cancel_requested(video_id, db):
+            raise ProcessingCancelled(f"Processing of video {video_id} was cancelled")
+
+    try:
+        video = _services.get_video(db, video_id)
+        checkpoint = video.processing_checkpoint if video else None
+        if video and (
+            checkpoint == ProcessingCheckpoint.REGISTERED
+            or video.processing_status == MediaProcessingStatus.COMPLETED
+        ):
+            # Splices were registered before the job itself was marked done (e.g. the worker
+            # died in between); registering them again would duplicate every row.
+            logger.info(f"Video {video_id} already has its splices registered; nothing to redo")
+            return
+        if AUDIO_EXTRACTION_MODE == "pcm" and ext == ".mp4":
+            # No MP3 is produced on this path; keep the column pointing at real files only.
+            mp3_path = None
+
+        check_cancelled()
+        splice_source = video.audio_path if video else None
+        if checkpoint in RESUMABLE_AFTER_EXTRACT and splice_source and os.path.exists(splice_source):
+            logger.info(f"Resuming video_id={video_id} after extraction ({splice_source})")
+            if splice_source != original_path:
+                outputs.extend((splice_source, *envelope_paths(splice_source)))
+        else:
+            _services.set_processing_progress(video_id, ProcessingStage.EXTRACTING, 0, db)
+            if AUDIO_EXTRACTION_MODE == "pcm":
+                splice_source = _working_audio_path(video_name, safe_filename)
+                os.makedirs(os.path.dirname(splice_source), exist_ok=True)
+                outputs.extend((splice_source, *envelope_paths(splice_source)))
+                await _run_media_task(_extract_audio_pcm, original_path, splice_source)
+            else:
+                if ext == ".mp4":
+                    mp3_path = mp3_path or _working_audio_path(video_name, safe_filename, ".mp3")
+                    outputs.extend((mp3_path, *envelope_paths(mp3_path)))
+                    await _run_media_task(_convert_mp4_to_mp3, original_path, mp3_path)
+                splice_source = mp3_path
+            _services.record_processing_checkpoint(
+                video_id, ProcessingCheckpoint.EXTRACTED, db, audio_path=splice_source, splice_manifest=None
+            )
+
+        check_cancelled()
+        manifest = _load_manifest(video.splice_manifest) if checkpoint == ProcessingCheckpoint.SPLICED else None
+        if manifest is not None:
+            logger.info(f"Resuming video_id={video_id} after splicing ({len(manifest)} chunks)")
+        else:
+            _services.set_processing_progress(
+                video_id, ProcessingStage.SPLICING, STAGE_PERCENT_RANGES[ProcessingStage.SPLICING][0], db
+            )
+            if _uses_streaming_splicer(splice_source):
+                splicer = _splice_audio_streaming
+            else:
+                splicer = _splice_audio
+            splice_params = json.loads(video.splice_params) if video and video.splice_params else {}
+            manifest = await _run_media_task(
+                functools.partial(splicer, progress=StageProgress(video_id, ProcessingStage.SPLICING), **splice_params),
+                splice_source,
+                video_name,
+            )
+            _services.record_processing_checkpoint(
+                video_id,
+                ProcessingCheckpoint.SPLICED,
+                db,
+                splice_manifest=json.dumps([list(segment) for segment in manifest]),
+            )
+        outputs.extend(segment.path for segment in manifest)
+
+        check_cancelled()
+        _services.set_processing_progress(
+            video_id, ProcessingStage.REGISTERING, STAGE_PERCENT_RANGES[ProcessingStage.REGISTERING][0], db
+        )
+
+        splices = [
+            _schemas.SpliceCreate(
+                name=video_name,
+                path=segment.path,
+                origin=safe_filename,
+                duration=str(segment.duration),
+                validation="0",
+                label="",
+                owner_id=owner_id,
+            )
+            for segment in manifest
+        ]
+        _services.create_splices_bulk(
+            video_id,
+            splices,
+            {
+                "mp3_path": mp3_path,
+                "audio_path": splice_source,
+                "to_mp3_status": "True" if mp3_path else "False",
+                "splice_status": "True",
+                "processing_status": MediaProcessingStatus.COMPLETED,
+                "processing_error": None,
+                "processing_stage": ProcessingStage.COMPLETED,
+                "progress_percent": 100,
+                "processing_checkpoint": ProcessingCheckpoint.REGISTERED,
+            },
+            db,
+        )
+    except ProcessingCancelled:
+        logger.info(f"Processing of video_id={video_id} cancelled; removing {len(outputs)} partial outputs")
+        db.rollback()
+        for path in outputs:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning(f"Could not remove partial output {path}: {exc}")
+        raise
+    except Exception as exc:
+        logger.error(f"Video processing failed for video_id={video_id}: {exc}", exc_info=True)
+        db.rollback()
+        _services.set_processing_progress(video_id, ProcessingStage.FAILED, None, db)
+        await _services.update_video_by_id(
+            video_id=video_id,
+            update_data={
+                "processing_status": MediaProcessingStatus.ERROR,
+                "processing_error": str(exc),
+            },
+            db=db,
+        )
+        _services.set_upload_status_for_video(
+            video_id,
+            MediaProcessingStatus.ERROR,
+            db,
+            error_message=str(exc),
+        )
+        raise
+    finally:
+        if owns_session:
+            db.close()
+
+
+async def _job_heartbeat(job_id: int, worker_id: str) -> None:
+    """Keep a claimed job's lease fresh so other workers do not reclaim it mid-run."""
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+        db = _services.SessionLocal()
+        try:
+            if not _services.heartbeat_processing_job(job_id, worker_id, db):
+                logger.warning(f"Lost the lease on processing job {job_id}")
+        except Exception as exc:
+            logger.warning(f"Heartbeat for processing job {job_id} failed: {exc}")
+        finally:
+            db.close()
+
+
+async def run_processing_job(job: _schemas.ProcessingJob, worker_id: str) -> None:
+    """Execute one claimed job and record its outcome (complete, cancel, retry, or dead-letter)."""
+    db = _services.SessionLocal()
+    heartbeat = asyncio.create_task(_job_heartbeat(job.id, worker_id))
+    try:
+        video = _services.get_video(db, job.video_id)
+        if video is None:
+            raise ValueError(f"Video {job.video_id} no longer exists")
+        await _process_video_file(
+            video_id=video.id,
+            video_name=video.name,
+            safe_filename=os.path.basename(video.path),
+            ext=os.path.splitext(video.path)[1].lower(),
+            original_path=video.path,
+            mp3_path=video.mp3_path,
+            owner_id=video.uploader_id,
+            db_session=db,
+        )
+    except ProcessingCancelled:
+        _services.cancel_processing_job(job.id, job.video_id, db)
+        logger.info(f"Processing job {job.id} cancelled")
+    except Exception as exc:
+        db.rollback()
+        outcome = _services.fail_processing_job(job.id, str(exc), db)
+        logger.warning(f"Processing job {job.id} attempt {job.attempts} failed, now {outcome.value}: {exc}")
+    else:
+        _services.complete_processing_job(job.id, db)
+    finally:
+        heartbeat.cancel()
+        db.close()
+
+
+def resume_interrupted_jobs() -> int:
+    """Requeue jobs orphaned by a crashed worker; called once when a worker starts."""
+    db = _services.SessionLocal()
+    try:
+        requeued = _services.requeue_interrupted_jobs(db, missed_heartbeat_seconds=2 * JOB_HEARTBEAT_SECONDS)
+    finally:
+        db.close()
+    if requeued:
+        logger.info(f"Requeued {requeued} interrupted processing job(s) for resume")
+    return requeued
+
+
+async def processing_job_loop(worker_id: str) -> None:
+    """Claim and run processing jobs until cancelled, sleeping while the queue is empty."""
+    while True:
+        job = None
+        db = _services.SessionLocal()
+        try:
+            job = _services.claim_processing_job(
+                db,
+                worker_id,
+                memory_budget=DECODE_MEMORY_BUDGET_MB * 1024 * 1024 or None,
+                decode_bytes_per_second=decode_bytes_per_second(),
+            )
+        except Exception as exc:
+            logger.error(f"Failed to claim a processing job: {exc}", exc_info=True)
+        finally:
+            db.close()
+
+        if job is None:
+            await asyncio.sleep(JOB_POLL_INTERVAL_SECONDS)
+            continue
+        logger.info(f"Worker {worker_id} claimed processing job {job.id} for video {job.video_id}")
+        await run_processing_job(job, worker_id)
@@ -0,0 +1,381 @@
+"""Vectorized silence detection over raw PCM samples.
+
+``detect_silence_numpy`` is a drop-in replacement for ``pydub.silence.detect_silence``: same
+arguments, same millisecond grid, same RMS-versus-dBFS comparison, same range merging. It
+sums squared samples once per millisecond and derives every window's RMS from a prefix
+sum, so the cost is linear in the input instead of ``len(audio) * min_silence_len``.
+``StreamingSilenceDetector`` applies the same rules to PCM fed in arbitrary pieces, keeping
+only ``min_silence_len`` milliseconds of state between calls. The per-millisecond energy is
+also what ``EnergyEnvelope`` holds, so ``detect_silence_envelope`` can rerun detection with
+new parameters without touching the audio again. ``detect_non_speech_vad`` adds a
+zero-crossing-rate test on top of the energy test to also cut around noise.
+"""
+
+import os
+import wave
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.silence import detect_silence as _pydub_detect_silence
+from pydub.utils import db_to_float
+
+# Milliseconds of audio squared and summed per step; bounds temporary memory on long inputs.
+ENERGY_BLOCK_MS = 10_000
+
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# Energy + zero-crossing-rate voice activity detection (the "vad" backend).
+VAD_FRAME_MS = int(os.getenv("VAD_FRAME_MS", "20"))
+VAD_ZCR_MAX = float(os.getenv("VAD_ZCR_MAX", "0.3"))
+VAD_HANGOVER_MS = int(os.getenv("VAD_HANGOVER_MS", "200"))
+
+
+def millisecond_bounds(frame_rate: int, length_ms: int, start_ms: int = 0) -> np.ndarray:
+    """Frame index at which every millisecond starts, using pydub's ``frame_count(ms)`` rounding.
+
+    Covers milliseconds ``start_ms`` through ``length_ms`` inclusive.
+    """
+    return (np.arange(start_ms, length_ms + 1, dtype=np.int64) * frame_rate / 1000.0).astype(np.int64)
+
+
+def _block_energy(samples: np.ndarray, channels: int, frame_edges: np.ndarray, accumulator) -> np.ndarray:
+    """Energy of each millisecond whose frames ``frame_edges`` delimit; ``samples`` starts at ``frame_edges[0]``."""
+    block = samples.astype(accumulator)
+    running = np.concatenate(([0], np.cumsum(block * block)))
+    offsets = (frame_edges - frame_edges[0]) * channels
+    return running[offsets[1:]] - running[offsets[:-1]]
+
+
+def energy_dtype(sample_width: int):
+    """dtype of per-millisecond energy sums for ``sample_width``-byte samples."""
+    # Exact integer sums for 8/16-bit audio; 32-bit squares would overflow int64.
+    return np.float64 if sample_width == 4 else np.int64
+
+
+def millisecond_energy(audio: AudioSegment) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum of squared samples (all channels) for each millisecond of ``audio``.
+
+    Returns ``(energy, bounds)`` where ``energy[i]`` covers frames ``bounds[i]:bounds[i + 1]``.
+    """
+    samples = np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width])
+    channels = audio.channels
+    total_frames = len(samples) // channels
+    length_ms = len(audio)
+    bounds = millisecond_bounds(audio.frame_rate, length_ms)
+    accumulator = energy_dtype(audio.sample_width)
+
+    energy = np.empty(length_ms, dtype=accumulator)
+    for block_start in range(0, length_ms, ENERGY_BLOCK_MS):
+        block_end = min(block_start + ENERGY_BLOCK_MS, length_ms)
+        frame_edges = np.minimum(bounds[block_start:block_end + 1], total_frames)
+        block = samples[frame_edges[0] * channels:frame_edges[-1] * channels]
+        energy[block_start:block_end] = _block_energy(block, channels, frame_edges, accumulator)
+    return energy, bounds
+
+
+class EnergyEnvelope(NamedTuple):
+    """Per-millisecond sum of squared samples of a PCM source plus the format needed to read it."""
+    energy: np.ndarray
+    frame_rate: int
+    channels: int
+    sample_width: int
+
+    @property
+    def length_ms(self) -> int:
+        return len(self.energy)
+
+
+def audio_energy_envelope(audio: AudioSegment) -> EnergyEnvelope:
+    """``EnergyEnvelope`` of a decoded segment."""
+    energy, _ = millisecond_energy(audio)
+    return EnergyEnvelope(energy, audio.frame_rate, audio.channels, audio.sample_width)
+
+
+def wav_energy_envelope(path: str) -> EnergyEnvelope:
+    """``EnergyEnvelope`` of a PCM WAV file, read ``ENERGY_BLOCK_MS`` at a time.
+
+    Raises ``ValueError`` for sample widths NumPy cannot read directly (24-bit).
+    """
+    with wave.open(path, "rb") as reader:
+        frame_rate = reader.getframerate()
+        channels = reader.getnchannels()
+        sample_width = reader.getsampwidth()
+        total_frames = reader.getnframes()
+        if sample_width not in _SAMPLE_DTYPES:
+            raise ValueError(f"Unsupported sample width {sample_width}")
+        length_ms = round(1000 * (total_frames / frame_rate))
+        bounds = millisecond_bounds(frame_rate, length_ms)
+        accumulator = energy_dtype(sample_width)
+
+        energy = np.empty(length_ms, dtype=accumulator)
+        for block_start in range(0, length_ms, ENERGY_BLOCK_MS):
+            block_end = min(block_start + ENERGY_BLOCK_MS, length_ms)
+            frame_edges = np.minimum(bounds[block_start:block_end + 1], total_frames)
+            data = reader.readframes(int(frame_edges[-1] - frame_edges[0]))
+            if sample_width == 1:
+                # WAV stores 8-bit audio unsigned; pydub (and the energy grid) use signed samples.
+                samples = (np.frombuffer(data, dtype=np.uint8) ^ 0x80).view(np.int8)
+            else:
+                samples = np.frombuffer(data, dtype=_SAMPLE_DTYPES[sample_width])
+            energy[block_start:block_end] = _block_energy(samples, channels, frame_edges, accumulator)
+    return EnergyEnvelope(energy, frame_rate, channels, sample_width)
+
+
+def _silent_ranges(
+    energy: np.ndarray,
+    bounds: np.ndarray,
+    channels: int,
+    threshold: float,
+    min_silence_len: int,
+    seek_step: int,
+) -> List[List[int]]:
+    """pydub's windowed RMS test and range merging over a per-millisecond energy array."""
+    seg_len = len(energy)
+    if seg_len < min_silence_len:
+        return []
+
+    last_slice_start = seg_len - min_silence_len
+    starts = np.arange(0, last_slice_start + 1, seek_step, dtype=np.int64)
+    if last_slice_start % seek_step:
+        starts = np.append(starts, last_slice_start)
+
+    running = np.concatenate(([0], np.cumsum(energy)))
+    window_energy = running[starts + min_silence_len] - running[starts]
+    # pydub pads a short trailing slice with silence, so the sample count follows the bounds.
+    window_samples = (bounds[starts + min_silence_len] - bounds[starts]) * channels
+    # audioop.rms truncates to an integer before pydub compares it with the threshold.
+    rms = np.floor(np.sqrt(window_energy / np.maximum(window_samples, 1)))
+    silence_starts = starts[rms <= threshold]
+
+    if not len(silence_starts):
+        return []
+
+    gaps = np.diff(silence_starts)
+    breaks = np.flatnonzero((gaps != seek_step) & (gaps > min_silence_len))
+    range_starts = np.concatenate((silence_starts[:1], silence_starts[breaks + 1]))
+    range_ends = np.concatenate((silence_starts[breaks], silence_starts[-1:])) + min_silence_len
+    return [[int(start), int(end)] for start, end in zip(range_starts, range_ends)]
+
+
+def detect_silence_numpy(
+    audio_segment: AudioSegment,
+    min_silence_len: int = 1000,
+    silence_thresh: float = -16,
+    seek_step: int = 1,
+) -> List[List[int]]:
+    """Return ``[start_ms, end_ms]`` silent ranges with ``pydub.silence.detect_silence`` semantics."""
+    if audio_segment.sample_width not in _SAMPLE_DTYPES:
+        return _pydub_detect_silence(audio_segment, min_silence_len, silence_thresh, seek_step)
+    if len(audio_segment) < min_silence_len:
+        return []
+
+    threshold = db_to_float(silence_thresh) * audio_segment.max_possible_amplitude
+    energy, bounds = millisecond_energy(audio_segment)
+    return _silent_ranges(energy, bounds, audio_segment.channels, threshold, min_silence_len, seek_step)
+
+
+def detect_silence_envelope(
+    envelope: EnergyEnvelope,
+    min_silence_len: int = 1000,
+    silence_thresh: float = -16,
+    seek_step: int = 1,
+) -> List[List[int]]:
+    """``detect_silence_numpy`` over a precomputed per-millisecond energy envelope; no PCM is read."""
+    threshold = db_to_float(silence_thresh) * (1 << (8 * envelope.sample_width - 1))
+    bounds = millisecond_bounds(envelope.frame_rate, envelope.length_ms)
+    return _silent_ranges(envelope.energy, bounds, envelope.channels, threshold, min_silence_len, seek_step)
+
+
+class StreamingSilenceDetector:
+    """Incremental ``detect_silence_numpy`` (``seek_step=1``) over interleaved PCM bytes.
+
+    ``total_frames`` must be known up front (it is in a WAV header) because pydub's grid
+    depends on the rounded length. ``feed`` and ``finish`` return silent ranges as soon as
+    no later window can extend them, in order; their concatenation equals the ranges
+    ``detect_silence_numpy`` reports for the whole input.
+
+    With ``energy_out`` (``length_ms`` values of ``energy_dtype(sample_width)``), every
+    finished millisecond's energy is written into it as it is computed. Passing a memory
+    map of the envelope sidecar keeps the whole-file envelope out of the process's heap;
+    the detector itself only holds the samples and energy of the current window.
+    """
+
+    def __init__(
+        self,
+        frame_rate: int,
+        channels: int,
+        sample_width: int,
+        total_frames: int,
+        min_silence_len: int = 1000,
+        silence_thresh: float = -16,
+        energy_out: Optional[np.ndarray] = None,
+    ):
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.total_frames = total_frames
+        self.min_silence_len = min_silence_len
+        self.length_ms = round(1000 * (total_frames / frame_rate))
+        self.threshold = db_to_float(silence_thresh) * (1 << (8 * sample_width - 1))
+        self._dtype = _SAMPLE_DTYPES[sample_width]
+        self._accumulator = energy_dtype(sample_width)
+
+        # Samples not yet folded into a finished millisecond, starting at frame ``_pending_frame``.
+        self._pending = np.empty(0, dtype=self._accumulator)
+        self._pending_frame = 0
+        # Per-millisecond energy for ``[_scan_ms, _next_ms)``: windows not evaluated yet.
+        self._energy = np.empty(0, dtype=self._accumulator)
+        self._scan_ms = 0
+        self._next_ms = 0
+        self._range_start: Optional[int] = None
+        self._previous_start: Optional[int] = None
+        # Destination of every finished millisecond's energy, when the caller wants the envelope.
+        if energy_out is not None and len(energy_out) != self.length_ms:
+            raise ValueError(f"energy_out holds {len(energy_out)} values, expected {self.length_ms}")
+        self._energy_out = energy_out
+
+    def feed(self, data: bytes) -> List[List[int]]:
+        samples = np.frombuffer(data, dtype=self._dtype).astype(self._accumulator)
+        self._pending = np.concatenate((self._pending, samples))
+        self._consume(final=False)
+        return self._scan(final=False)
+
+    def finish(self) -> List[List[int]]:
+        self._consume(final=True)
+        return self._scan(final=True)
+
+    def envelope(self) -> EnergyEnvelope:
+        """Energy envelope of every finished millisecond so far (a view of ``energy_out``)."""
+        if self._energy_out is None:
+            raise RuntimeError("StreamingSilenceDetector was created without energy_out")
+        return EnergyEnvelope(self._energy_out[:self._next_ms], self.frame_rate, self.channels, self.sample_width)
+
+    def _consume(self, final: bool) -> None:
+        available_end = self._pending_frame + len(self._pending) // self.channels
+        # Only the milliseconds the buffered frames can reach, never the rest of the file.
+        reachable_ms = self.length_ms if final else min(
+            self.length_ms, int(available_end * 1000 / self.frame_rate) + 2
+        )
+        bounds = millisecond_bounds(self.frame_rate, max(reachable_ms, self._next_ms), start_ms=self._next_ms)
+        if final:
+            complete = self.length_ms - self._next_ms
+        else:
+            complete = int(np.searchsorted(bounds[1:], available_end, side="right"))
+        if complete <= 0:
+            return
+
+        frame_edges = np.minimum(bounds[:complete + 1], min(available_end, self.total_frames))
+        offsets = (frame_edges - self._pending_frame) * self.channels
+        running = np.concatenate(([0], np.cumsum(self._pending * self._pending)))
+        energy = running[offsets[1:]] - running[offsets[:-1]]
+        self._energy = np.concatenate((self._energy, energy))
+        if self._energy_out is not None:
+            self._energy_out[self._next_ms:self._next_ms + complete] = energy
+        self._next_ms += complete
+        self._pending = self._pending[offsets[-1]:]
+        self._pending_frame = int(frame_edges[-1])
+
+    def _scan(self, final: bool) -> List[List[int]]:
+        window = self.min_silence_len
+        last_slice_start = self.length_ms - window
+        scan_end = min(self._next_ms - window, last_slice_start) + 1
+        silence_starts = np.empty(0, dtype=np.int64)
+
+        if scan_end > self._scan_ms:
+            starts = np.arange(self._scan_ms, scan_end, dtype=np.int64)
+            running = np.concatenate(([0], np.cumsum(self._energy)))
+            local = starts - self._scan_ms
+            window_energy = running[local + window] - running[local]
+            bounds = millisecond_bounds(self.frame_rate, int(starts[-1]) + window, start_ms=self._scan_ms)
+            window_samples = (bounds[local + window] - bounds[local]) * self.channels
+            rms = np.floor(np.sqrt(window_energy / np.maximum(window_samples, 1)))
+            silence_starts = starts[rms <= self.threshold]
+            self._energy = self._energy[scan_end - self._scan_ms:]
+            self._scan_ms = scan_end
+
+        ranges = []
+        for start in silence_starts.tolist():
+            if self._previous_start is None:
+                self._range_start = start
+            elif start - self._previous_start > window:
+                ranges.append([self._range_start, self._previous_start + window])
+                self._range_start = start
+            self._previous_start = start
+
+        # Nothing scanned from here on can merge into the open range once the gap exceeds the window.
+        if self._previous_start is not None and (final or self._scan_ms - self._previous_start > window):
+            ranges.append([self._range_start, self._previous_start + window])
+            self._range_start = self._previous_start = None
+        return ranges
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """``(start, end)`` index pairs of the runs of ``True`` in ``mask``."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+
+
+def detect_non_speech_vad(
+    audio_segment: AudioSegment,
+    min_silence_len: int = 1000,
+    silence_thresh: float = -16,
+    frame_ms: int = VAD_FRAME_MS,
+    zcr_max: float = VAD_ZCR_MAX,
+    hangover_ms: int = VAD_HANGOVER_MS,
+) -> List[List[int]]:
+    """Non-speech ``[start_ms, end_ms]`` ranges from frame energy and zero-crossing rate.
+
+    A ``frame_ms`` frame is speech when its RMS is above ``silence_thresh`` (the same test
+    the dBFS detectors apply) and its zero-crossing rate is at most ``zcr_max`` crossings per
+    sample; broadband noise such as crowds, wind or hiss crosses zero far more often than
+    voiced speech. Speech decisions are extended by ``hangover_ms`` on both sides so
+    unvoiced consonants and short pauses stay inside words. Runs of non-speech at least
+    ``min_silence_len`` long are returned, so the result plugs into the same cut rules as
+    ``detect_silence``.
+    """
+    if audio_segment.sample_width not in _SAMPLE_DTYPES:
+        audio_segment = audio_segment.set_sample_width(2)
+    length_ms = len(audio_segment)
+    frames = length_ms // frame_ms
+    if length_ms < min_silence_len or frames == 0:
+        return []
+
+    energy, bounds = millisecond_energy(audio_segment)
+    channels = audio_segment.channels
+    edges = bounds[: frames * frame_ms + 1: frame_ms]
+    frame_energy = energy[: frames * frame_ms].reshape(frames, frame_ms).sum(axis=1)
+    frame_samples = np.maximum(np.diff(edges) * channels, 1)
+    threshold = db_to_float(silence_thresh) * audio_segment.max_possible_amplitude
+    loud = np.sqrt(frame_energy / frame_samples) > threshold
+
+    samples = np.frombuffer(audio_segment.raw_data, dtype=_SAMPLE_DTYPES[audio_segment.sample_width])
+    total_frames = len(samples) // channels
+    # Sign of the channel sum, so crossings are counted once per sample frame.
+    signs = np.signbit(samples[: total_frames * channels].reshape(-1, channels).sum(axis=1, dtype=np.int64))
+    crossings = np.concatenate(([0], np.cumsum(signs[1:] != signs[:-1])))
+    frame_edges = np.minimum(edges, max(total_frames - 1, 0))
+    zcr = (crossings[frame_edges[1:]] - crossings[frame_edges[:-1]]) / np.maximum(np.diff(frame_edges), 1)
+
+    speech = loud & (zcr <= zcr_max)
+    hangover = hangover_ms // frame_ms
+    if hangover:
+        speech = np.convolve(speech, np.ones(2 * hangover + 1), mode="same") > 0
+
+    ranges = []
+    for start, end in _runs(~speech):
+        start_ms = start * frame_ms
+        end_ms = length_ms if end == frames else end * frame_ms
+        if end_ms - start_ms >= min_silence_len:
+            ranges.append([start_ms, end_ms])
+    return ranges
+
+
+# Splitter backends for ``_splice_audio``. Each takes ``(audio_segment, min_silence_len,
+# silence_thresh)`` and returns sorted, non-overlapping ``[start_ms, end_ms]`` ranges that hold
+# no speech; the splicer cuts inside those ranges.
+SILENCE_DETECTORS = {
+    "pydub": _pydub_detect_silence,
+    "numpy": detect_silence_numpy,
+    "vad": detect_non_speech_vad,
+}
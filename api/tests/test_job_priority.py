@@ -0,0 +1,149 @@
+import datetime as _dt
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import sqlalchemy as _sql
+from sqlalchemy.orm import sessionmaker
+
+from api.database import database as _database
+from api.database import models, services
+from api.database.enums import JobStatus, MediaProcessingStatus
+from api.services import processing
+
+
+class ComputeJobPriorityTests(unittest.TestCase):
+    def test_shorter_media_gets_a_higher_lane(self):
+        uploader = SimpleNamespace(id="user-1", email="someone@example.com")
+        two_minutes = services.compute_job_priority(120, uploader)
+        one_hour = services.compute_job_priority(3600, uploader)
+        three_hours_plus = services.compute_job_priority(3 * 3600 + 1, uploader)
+        self.assertGreater(two_minutes, one_hour)
+        self.assertGreater(one_hour, three_hours_plus)
+
+    def test_uploader_role_moves_one_lane(self):
+        regular = SimpleNamespace(id="user-1", email="someone@example.com")
+        staff = SimpleNamespace(id="staff-1", email="staff@example.com")
+        system = SimpleNamespace(id="system", email=services.SYSTEM_UPLOADER_EMAIL)
+        with mock.patch.object(services, "PRIORITY_UPLOADER_IDS", {"staff-1"}):
+            base = services.compute_job_priority(1800, regular)
+            self.assertEqual(services.compute_job_priority(1800, staff), base + 10)
+            self.assertEqual(services.compute_job_priority(1800, system), base - 10)
+
+
+class DecodeMemoryEstimateTests(unittest.TestCase):
+    def test_in_memory_decode_scales_with_the_pcm_format(self):
+        with mock.patch.multiple(
+            processing,
+            AUDIO_EXTRACTION_MODE="pcm",
+            SPLICE_MODE="memory",
+            EXTRACTION_SAMPLE_RATE=16000,
+            EXTRACTION_CHANNELS=1,
+            DECODE_MEMORY_OVERHEAD=2.0,
+        ):
+            self.assertEqual(processing.decode_bytes_per_second(), 16000 * 2 * 2.0)
+            with mock.patch.object(processing, "EXTRACTION_CHANNELS", 2):
+                self.assertEqual(processing.decode_bytes_per_second(), 16000 * 2 * 2 * 2.0)
+
+    def test_streaming_splicer_only_reserves_the_envelope(self):
+        with mock.patch.multiple(
+            processing, AUDIO_EXTRACTION_MODE="pcm", SPLICE_MODE="streaming", SILENCE_DETECTOR="numpy"
+        ):
+            self.assertLess(processing.decode_bytes_per_second(), 16000 * 2)
+
+    def test_only_the_numpy_detector_streams(self):
+        with mock.patch.object(processing, "SPLICE_MODE", "streaming"):
+            for detector, streams in (("numpy", True), ("pydub", False), ("vad", False)):
+                with mock.patch.object(processing, "SILENCE_DETECTOR", detector):
+                    self.assertEqual(processing._uses_streaming_splicer("episode.wav"), streams)
+
+
+class ClaimProcessingJobTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory(prefix="job_tests_")
+        self.addCleanup(temp_dir.cleanup)
+        engine = _sql.create_engine(f"sqlite:///{os.path.join(temp_dir.name, 'jobs.db')}")
+        self.addCleanup(engine.dispose)
+        _database.Base.metadata.create_all(engine)
+        self.Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def _running_job(self, db, attempts, heartbeat_age_seconds):
+        video = models.Video(name="episode", processing_status=MediaProcessingStatus.IN_PROGRESS)
+        db.add(video)
+        db.flush()
+        heartbeat = _dt.datetime.utcnow() - _dt.timedelta(seconds=heartbeat_age_seconds)
+        job = models.ProcessingJob(
+            video_id=video.id,
+            status=JobStatus.RUNNING,
+            attempts=attempts,
+            max_attempts=3,
+            locked_by="dead-worker",
+            heartbeat_at=heartbeat,
+        )
+        db.add(job)
+        db.commit()
+        return job.id, video.id
+
+    def _queued_job(self, db, priority, waiting_seconds):
+        video = models.Video(name="episode", processing_status=MediaProcessingStatus.IN_PROGRESS)
+        db.add(video)
+        db.flush()
+        job = models.ProcessingJob(
+            video_id=video.id,
+            status=JobStatus.QUEUED,
+            priority=priority,
+            available_at=_dt.datetime.utcnow() - _dt.timedelta(seconds=waiting_seconds),
+        )
+        db.add(job)
+        db.commit()
+        return job.id
+
+    def test_waiting_time_lifts_a_low_lane_past_new_high_priority_jobs(self):
+        with self.Session() as db:
+            long_waiting = self._queued_job(db, priority=0, waiting_seconds=4 * 3600)
+            fresh = self._queued_job(db, priority=30, waiting_seconds=60)
+
+            with mock.patch.object(services, "JOB_PRIORITY_AGING_SECONDS", 0):
+                self.assertEqual(services.claim_processing_job(db, "worker").id, fresh)
+            db.query(models.ProcessingJob).filter_by(id=fresh).update({"status": JobStatus.QUEUED})
+            db.commit()
+
+            # Four hours at one point per ten minutes is worth 24 points: not yet enough.
+            with mock.patch.object(services, "JOB_PRIORITY_AGING_SECONDS", 600):
+                self.assertEqual(services.claim_processing_job(db, "worker").id, fresh)
+            db.query(models.ProcessingJob).filter_by(id=fresh).update({"status": JobStatus.QUEUED})
+            db.commit()
+
+            with mock.patch.object(services, "JOB_PRIORITY_AGING_SECONDS", 300):
+                self.assertEqual(services.claim_processing_job(db, "worker").id, long_waiting)
+
+    def test_stale_job_on_its_last_attempt_is_dead_lettered_instead_of_reclaimed(self):
+        with self.Session() as db:
+            exhausted, exhausted_video = self._running_job(db, 3, services.JOB_STALE_SECONDS + 60)
+            retryable, _ = self._running_job(db, 1, services.JOB_STALE_SECONDS + 60)
+
+            claimed = services.claim_processing_job(db, "worker")
+
+            self.assertEqual(claimed.id, retryable)
+            self.assertEqual(db.get(models.ProcessingJob, exhausted).status, JobStatus.DEAD)
+            self.assertEqual(
+                db.get(models.Video, exhausted_video).processing_status, MediaProcessingStatus.DEAD_LETTER
+            )
+            self.assertIsNone(services.claim_processing_job(db, "worker"))
+
+    def test_startup_requeue_dead_letters_exhausted_jobs(self):
+        with self.Session() as db:
+            exhausted, _ = self._running_job(db, 3, 120)
+            retryable, _ = self._running_job(db, 2, 120)
+
+            self.assertEqual(services.requeue_interrupted_jobs(db, 60), 1)
+
+            db.expire_all()
+            self.assertEqual(db.get(models.ProcessingJob, exhausted).status, JobStatus.DEAD)
+            self.assertEqual(db.get(models.ProcessingJob, retryable).status, JobStatus.QUEUED)
+
+
+if __name__ == "__main__":
+    unittest.main()
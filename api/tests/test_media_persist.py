@@ -0,0 +1,56 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from fastapi import HTTPException
+
+from api.main import _parse_content_range, _stream_to_path
+
+
+class StreamToPathTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="persist_tests_")
+        self.destination = os.path.join(self.temp_dir, "upload.mp3")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_copies_stream_in_chunks(self):
+        payload = os.urandom(10_000)
+        written, content_hash = _stream_to_path(io.BytesIO(payload), self.destination, max_bytes=0, chunk_size=1024)
+        self.assertEqual(written, len(payload))
+        self.assertEqual(content_hash, hashlib.sha256(payload).hexdigest())
+        with open(self.destination, "rb") as handle:
+            self.assertEqual(handle.read(), payload)
+        self.assertFalse(os.path.exists(f"{self.destination}.part"))
+
+    def test_rejects_oversized_stream_and_cleans_up(self):
+        with self.assertRaises(HTTPException) as ctx:
+            _stream_to_path(io.BytesIO(b"x" * 4096), self.destination, max_bytes=1000, chunk_size=512)
+        self.assertEqual(ctx.exception.status_code, 413)
+        self.assertFalse(os.path.exists(self.destination))
+        self.assertFalse(os.path.exists(f"{self.destination}.part"))
+
+    def test_accepts_stream_at_exact_limit(self):
+        written, _ = _stream_to_path(io.BytesIO(b"x" * 1000), self.destination, max_bytes=1000, chunk_size=300)
+        self.assertEqual(written, 1000)
+
+
+class ParseContentRangeTests(unittest.TestCase):
+    def test_parses_range_with_total(self):
+        self.assertEqual(_parse_content_range("bytes 0-1023/4096"), (0, 1023, 4096))
+
+    def test_accepts_unknown_total(self):
+        self.assertEqual(_parse_content_range("bytes 1024-2047/*"), (1024, 2047, None))
+
+    def test_rejects_missing_or_malformed_header(self):
+        for value in (None, "", "bytes 10-5/20", "items 0-1/2", "bytes a-b/c"):
+            with self.assertRaises(HTTPException):
+                _parse_content_range(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
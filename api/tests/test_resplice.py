@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import sqlalchemy as _sql
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from api import main
+from api.database import database as _database
+from api.database import models, services
+from api.database.enums import MediaProcessingStatus
+from api.routers import auth
+
+
+class RespliceTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory(prefix="resplice_tests_")
+        self.addCleanup(temp_dir.cleanup)
+        self.root = temp_dir.name
+        engine = _sql.create_engine(
+            f"sqlite:///{os.path.join(self.root, 'resplice.db')}", connect_args={"check_same_thread": False}
+        )
+        self.addCleanup(engine.dispose)
+        _database.Base.metadata.create_all(engine)
+        self.Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        self.splice_paths = [os.path.join(self.root, f"episode_{index}.wav") for index in range(2)]
+        with self.Session() as db:
+            db.add(models.User(id="owner", email="owner@example.com"))
+            video = models.Video(
+                name="episode",
+                path=os.path.join(self.root, "episode.mp4"),
+                uploader_id="owner",
+                processing_status=MediaProcessingStatus.COMPLETED,
+            )
+            db.add(video)
+            for path in self.splice_paths:
+                with open(path, "wb") as splice_file:
+                    splice_file.write(b"old splice")
+                db.add(models.Splice(
+                    name="episode", path=path, label="", origin="episode.mp4",
+                    duration="30", validation="0", owner_id="owner",
+                ))
+            db.commit()
+            self.video_id = video.id
+            self.user = db.get(models.User, "owner")
+
+        def get_db():
+            db = self.Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        main.app.dependency_overrides[services.get_db] = get_db
+        main.app.dependency_overrides[auth.get_current_user] = lambda: self.user
+        self.addCleanup(main.app.dependency_overrides.clear)
+        self.client = TestClient(main.app)
+
+    def _resplice(self):
+        return self.client.post(f"/videos/{self.video_id}/resplice", json={"dry_run": False})
+
+    def _queued_jobs(self):
+        with self.Session() as db:
+            return db.query(models.ProcessingJob).count()
+
+    def test_old_splices_are_moved_aside_before_the_job_is_queued(self):
+        seen = []
+
+        def on_removed(paths):
+            seen.append((sorted(paths), self._queued_jobs()))
+
+        with self.Session() as db:
+            services.reset_video_for_resplice(self.video_id, {}, db, on_removed)
+
+        self.assertEqual(seen, [(sorted(self.splice_paths), 0)])
+        self.assertEqual(self._queued_jobs(), 1)
+
+    def test_resplice_removes_the_old_files(self):
+        response = self._resplice()
+
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["data"]["removed_splices"], 2)
+        self.assertEqual(os.listdir(self.root), ["resplice.db"])
+
+    def test_failed_requeue_restores_the_old_files(self):
+        with mock.patch.object(services, "_new_processing_job", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                self._resplice()
+
+        self.assertEqual(self._queued_jobs(), 0)
+        for path in self.splice_paths:
+            with open(path, "rb") as splice_file:
+                self.assertEqual(splice_file.read(), b"old splice")
+        with self.Session() as db:
+            self.assertEqual(db.query(models.Splice).count(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
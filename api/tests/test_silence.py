@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.silence import detect_silence
+
+from api.services.envelope import envelope_paths, ensure_energy_envelope, load_energy_envelope
+from api.services.silence import detect_non_speech_vad, detect_silence_envelope, detect_silence_numpy
+
+
+def _noise_with_gaps(frame_rate: int, channels: int, seconds: int) -> AudioSegment:
+    rng = np.random.default_rng(7)
+    frames = frame_rate * seconds
+    noise = rng.standard_normal(frames * channels) * 10_000
+    envelope = np.repeat(rng.choice([1.0, 0.01, 0.05], size=seconds * 2), frames * channels // (seconds * 2) + 1)
+    samples = (noise * envelope[: frames * channels]).clip(-32768, 32767).astype(np.int16)
+    return AudioSegment(samples.tobytes(), frame_rate=frame_rate, sample_width=2, channels=channels)
+
+
+class DetectSilenceNumpyTests(unittest.TestCase):
+    def test_matches_pydub_on_fractional_millisecond_grid(self):
+        audio = _noise_with_gaps(frame_rate=44100, channels=2, seconds=12)
+        for min_silence_len, silence_thresh, seek_step in [(700, -20, 1), (300, -30, 7)]:
+            self.assertEqual(
+                detect_silence_numpy(audio, min_silence_len, silence_thresh, seek_step),
+                detect_silence(audio, min_silence_len, silence_thresh, seek_step),
+            )
+
+    def test_short_audio_has_no_silence(self):
+        audio = AudioSegment.silent(duration=500, frame_rate=16000)
+        self.assertEqual(detect_silence_numpy(audio, min_silence_len=700), [])
+
+
+class VadSplitterTests(unittest.TestCase):
+    def test_loud_broadband_noise_is_not_speech(self):
+        rng = np.random.default_rng(1)
+        t = np.arange(16000 * 3) / 16000
+        voiced = np.sin(2 * np.pi * 150 * t) * 12_000
+        noise = rng.standard_normal(16000 * 2) * 8_000
+        samples = np.concatenate((voiced, noise, voiced)).astype(np.int16)
+        audio = AudioSegment(samples.tobytes(), frame_rate=16000, sample_width=2, channels=1)
+
+        self.assertEqual(detect_silence_numpy(audio, min_silence_len=700, silence_thresh=-20), [])
+        ranges = detect_non_speech_vad(audio, min_silence_len=700, silence_thresh=-20)
+        self.assertEqual(len(ranges), 1)
+        start, end = ranges[0]
+        self.assertTrue(3000 <= start <= 3300 and 4700 <= end <= 5000)
+
+
+class EnergyEnvelopeSidecarTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory(prefix="envelope_tests_")
+        self.addCleanup(temp_dir.cleanup)
+        self.source = os.path.join(temp_dir.name, "episode.wav")
+        self.audio = _noise_with_gaps(frame_rate=44100, channels=2, seconds=6)
+        self.audio.export(self.source, format="wav")
+
+    def test_sidecar_detection_matches_pydub(self):
+        self.assertIsNone(load_energy_envelope(self.source))
+        ensure_energy_envelope(self.source)
+        envelope = load_energy_envelope(self.source)
+
+        self.assertIsInstance(envelope.energy, np.memmap)
+        self.assertEqual(envelope.length_ms, len(self.audio))
+        self.assertEqual(
+            detect_silence_envelope(envelope, min_silence_len=300, silence_thresh=-30),
+            detect_silence(self.audio, 300, -30),
+        )
+
+    def test_sidecar_is_ignored_once_the_source_changes(self):
+        ensure_energy_envelope(self.source)
+        self.audio[:3000].export(self.source, format="wav")
+
+        self.assertIsNone(load_energy_envelope(self.source))
+        self.assertEqual(ensure_energy_envelope(self.source).length_ms, 3000)
+        self.assertTrue(all(os.path.exists(path) for path in envelope_paths(self.source)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,258 @@
+import datetime as _dt
+import os
+import tempfile
+import threading
+import unittest
+
+import sqlalchemy as _sql
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from api.database import database as _database
+from api.database import models, services
+from api.database.enums import SpliceStatus
+
+CLAIMERS = 8
+SPLICES = 40
+
+
+def _test_engine(path: str):
+    """``TEST_DATABASE_URL`` (Postgres, for real SKIP LOCKED) or a SQLite file with writer locking."""
+    url = os.getenv("TEST_DATABASE_URL")
+    if url:
+        return _sql.create_engine(url, pool_size=CLAIMERS)
+    engine = _sql.create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 30})
+
+    # SQLite has no row locks; BEGIN IMMEDIATE makes concurrent transactions queue for the write lock.
+    @event.listens_for(engine, "connect")
+    def _autocommit_driver(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+class ConcurrentSpliceClaimTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory(prefix="claim_tests_")
+        self.addCleanup(temp_dir.cleanup)
+        self.engine = _test_engine(os.path.join(temp_dir.name, "claims.db"))
+        self.addCleanup(self.engine.dispose)
+        _database.Base.metadata.drop_all(self.engine)
+        _database.Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+
+        with self.Session() as db:
+            db.add(models.User(id="owner", email="owner@example.com"))
+            db.flush()
+            for index in range(SPLICES):
+                db.add(models.Splice(
+                    name="episode",
+                    path=f"/splices/episode/{index}.wav",
+                    label="",
+                    origin="episode.mp4",
+                    duration="30",
+                    validation="0",
+                    owner_id="owner",
+                ))
+            db.commit()
+
+    def _drain(self, claim):
+        claimed = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(CLAIMERS)
+
+        def worker():
+            barrier.wait()
+            with self.Session() as db:
+                while True:
+                    batch = claim(db)
+                    if not batch:
+                        return
+                    with lock:
+                        claimed.extend(splice.path for splice in (batch if isinstance(batch, list) else [batch]))
+
+        threads = [threading.Thread(target=worker) for _ in range(CLAIMERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return claimed
+
+    def test_concurrent_label_claims_never_share_a_splice(self):
+        claimed = self._drain(services.claim_splice_for_labeling)
+
+        self.assertEqual(len(claimed), SPLICES)
+        self.assertEqual(len(set(claimed)), SPLICES)
+        with self.Session() as db:
+            self.assertEqual(db.query(models.Splice).filter_by(status=SpliceStatus.PENDING).count(), 0)
+            self.assertEqual(db.query(models.Splice).filter_by(status=SpliceStatus.LABELING).count(), SPLICES)
+
+    def test_concurrent_batch_claims_never_share_a_splice(self):
+        claimed = self._drain(lambda db: services.claim_splices_for_labeling(db, 3))
+
+        self.assertEqual(len(claimed), SPLICES)
+        self.assertEqual(len(set(claimed)), SPLICES)
+        with self.Session() as db:
+            self.assertEqual(db.query(models.Splice).filter_by(status=SpliceStatus.LABELING).count(), SPLICES)
+
+    def test_repeated_claims_return_the_holders_reservation(self):
+        with self.Session() as db:
+            first = services.claim_splice_for_labeling(db, "owner")
+            again = services.claim_splice_for_labeling(db, "owner")
+            self.assertEqual(again.id, first.id)
+            self.assertGreaterEqual(again.reserved_until, first.reserved_until)
+
+            # A batch tops the held reservation up instead of replacing it.
+            batch = services.claim_splices_for_labeling(db, 3, "owner")
+            self.assertEqual(batch[0].id, first.id)
+            self.assertEqual(len({splice.id for splice in batch}), 3)
+            self.assertEqual(db.query(models.Splice).filter_by(reserved_by="owner").count(), 3)
+
+            # Anonymous callers have nothing to reuse.
+            self.assertNotIn(services.claim_splice_for_labeling(db).id, {splice.id for splice in batch})
+
+    def test_splice_keeps_its_row_through_labeling_and_validation(self):
+        with self.Session() as db:
+            claimed = services.claim_splice_for_labeling(db)
+            self.assertEqual(claimed.status, SpliceStatus.LABELING)
+            self.assertTrue(services.transition_splice(
+                claimed.id, (SpliceStatus.LABELING,), SpliceStatus.LABELED,
+                {"label": "mirëdita", "labeler_id": "owner"}, db,
+            ))
+            # A second submission of the same reservation finds nothing to move.
+            self.assertFalse(services.transition_splice(
+                claimed.id, (SpliceStatus.LABELING,), SpliceStatus.LABELED, {}, db,
+            ))
+
+            reviewed = services.claim_splice_for_validation(db)
+            self.assertEqual((reviewed.id, reviewed.label), (claimed.id, "mirëdita"))
+            self.assertTrue(services.transition_splice(
+                reviewed.id, (SpliceStatus.VALIDATING,), SpliceStatus.VALIDATED, {"validator_id": "owner"}, db,
+            ))
+            self.assertEqual(db.query(models.Splice).count(), SPLICES)
+            self.assertEqual(services.get_splice(claimed.id, db).status, SpliceStatus.VALIDATED)
+
+    def test_submission_requires_the_current_lease_holder(self):
+        with self.Session() as db:
+            db.add(models.User(id="other", email="other@example.com"))
+            db.commit()
+            claimed = services.claim_splice_for_labeling(db, "owner")
+            side_effects = []
+
+            def trim():
+                side_effects.append(claimed.id)
+                return {"duration": "12.5"}
+
+            self.assertFalse(services.transition_splice(
+                claimed.id, (SpliceStatus.LABELING,), SpliceStatus.LABELED, {"label": "x"}, db,
+                holder_id="other", on_moved=trim,
+            ))
+            self.assertEqual(side_effects, [])
+            self.assertEqual(services.get_splice(claimed.id, db).status, SpliceStatus.LABELING)
+
+            self.assertTrue(services.transition_splice(
+                claimed.id, (SpliceStatus.LABELING,), SpliceStatus.LABELED, {"label": "x"}, db,
+                holder_id="owner", on_moved=trim,
+            ))
+            self.assertEqual(side_effects, [claimed.id])
+            self.assertEqual(services.get_splice(claimed.id, db).duration, "12.5")
+
+    def test_reaper_requeues_only_lapsed_reservations(self):
+        with self.Session() as db:
+            abandoned = services.claim_splices_for_labeling(db, 3, "owner")
+            self.assertEqual(abandoned[0].reserved_by, "owner")
+            self.assertTrue(services.transition_splice(
+                abandoned[2].id, (SpliceStatus.LABELING,), SpliceStatus.LABELED, {"label": "x"}, db,
+            ))
+            in_review = services.claim_splice_for_validation(db, "owner")
+
+            self.assertEqual(services.release_expired_splice_leases(db), 0)
+            lapsed = _dt.datetime.utcnow() + _dt.timedelta(seconds=services.SPLICE_LEASE_SECONDS + 1)
+            self.assertEqual(services.release_expired_splice_leases(db, now=lapsed, batch_size=1), 3)
+
+            statuses = {splice.id: services.get_splice(splice.id, db) for splice in abandoned}
+            self.assertEqual(statuses[abandoned[0].id].status, SpliceStatus.PENDING)
+            self.assertIsNone(statuses[abandoned[0].id].reserved_by)
+            self.assertEqual(services.get_splice(in_review.id, db).status, SpliceStatus.LABELED)
+            # The requeued clip is the oldest again, so the next claim hands it out.
+            self.assertEqual(services.claim_splice_for_labeling(db).id, abandoned[0].id)
+
+
+class LegacySpliceMigrationTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory(prefix="migration_tests_")
+        self.addCleanup(temp_dir.cleanup)
+        self.engine = _test_engine(os.path.join(temp_dir.name, "migration.db"))
+        self.addCleanup(self.engine.dispose)
+        _database.Base.metadata.drop_all(self.engine)
+        _database.Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+
+    def _row(self, model, index, **extra):
+        return model(
+            name=f"episode_{index}",
+            path=f"/splices/{index}.wav",
+            label="",
+            origin="episode.mp4",
+            duration="30",
+            validation="0",
+            owner_id="owner",
+            **extra,
+        )
+
+    def test_batches_move_every_legacy_row_and_repoint_recordings(self):
+        with self.Session() as db:
+            db.add(models.User(id="owner", email="owner@example.com"))
+            db.flush()
+            db.add_all([self._row(models.Splice, index) for index in range(3)])
+            db.add_all([self._row(models.LabeledSplice, index, labeler_id="owner") for index in range(3, 6)])
+            recording = models.LabeledSplice(
+                name="recordings_owner", path="/recordings/take.wav", label="tekst", origin="take.wav",
+                duration="4", validation="0.95", owner_id="owner", labeler_id="owner",
+            )
+            db.add(recording)
+            db.add_all([
+                self._row(models.HighQualityLabeledSplice, 7, labeler_id="owner", validator_id="owner"),
+                self._row(models.DeletedSplice, 8),
+                self._row(models.SpliceBeingProcessed, 9, status="un_labeled"),
+                self._row(models.SpliceBeingProcessed, 10, status="labeled", labeler_id="owner"),
+            ])
+            db.flush()
+            prompt = models.TextSplice(prompt_text="tekst", status="completed", recorded_splice_id=recording.id)
+            db.add(prompt)
+            db.flush()
+            db.add(models.TextSpliceRecording(
+                text_splice_id=prompt.id, recorded_splice_id=recording.id, name=recording.name,
+                path=recording.path, label=recording.label, owner_id="owner", labeler_id="owner",
+            ))
+            db.commit()
+
+            batches = []
+            while moved := services.migrate_legacy_splice_batch(db, batch_size=2):
+                batches.append(moved)
+
+            self.assertEqual(sum(batches), 8)
+            self.assertTrue(all(moved <= 2 for moved in batches))
+            for model, _ in services.LEGACY_SPLICE_MODELS:
+                self.assertEqual(db.query(model).count(), 0)
+            by_status = dict(
+                db.query(models.Splice.status, _sql.func.count(models.Splice.id)).group_by(models.Splice.status)
+            )
+            self.assertEqual(by_status, {
+                SpliceStatus.PENDING: 4,
+                SpliceStatus.LABELED: 5,
+                SpliceStatus.VALIDATED: 1,
+                SpliceStatus.DELETED: 1,
+            })
+
+            migrated = db.query(models.Splice).filter_by(path="/recordings/take.wav").one()
+            self.assertEqual(db.query(models.TextSplice).one().recorded_splice_id, migrated.id)
+            self.assertEqual(db.query(models.TextSpliceRecording).one().recorded_splice_id, migrated.id)
+
+
+if __name__ == "__main__":
+    unittest.main()
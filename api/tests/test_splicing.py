@@ -0,0 +1,168 @@
+import asyncio
+import functools
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import numpy as np
+from pydantic import ValidationError
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from api.database.enums import MediaProcessingStatus, ProcessingCheckpoint
+from api.database.schemas import RespliceRequest
+from api.services import processing
+from api.services.silence import wav_energy_envelope
+
+
+class SpliceManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="splice_tests_")
+        self.source = os.path.join(self.temp_dir, "source.wav")
+        tone = Sine(440).to_audio_segment(duration=2000).set_frame_rate(16000).set_channels(1)
+        gap = AudioSegment.silent(duration=1000, frame_rate=16000)
+        (tone + gap + tone + gap + tone).export(self.source, format="wav")
+        patcher = mock.patch.object(processing, "SPLICES_DIR", self.temp_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_manifest_describes_exported_chunks(self):
+        stale_dir = os.path.join(self.temp_dir, "episode")
+        os.makedirs(stale_dir)
+        stale_path = os.path.join(stale_dir, "videoplaybackmp4_0.0-99.0.wav")
+        open(stale_path, "wb").close()
+
+        manifest = processing._splice_audio(self.source, "episode", min_chunk_duration_ms=1500)
+
+        self.assertEqual(len(manifest), 3)
+        self.assertNotIn(stale_path, [segment.path for segment in manifest])
+        self.assertEqual(manifest[0].start, 0.0)
+        self.assertAlmostEqual(manifest[-1].end, 8.0, places=2)
+        for previous, current in zip(manifest, manifest[1:]):
+            self.assertEqual(previous.end, current.start)
+        for segment in manifest:
+            self.assertTrue(os.path.exists(segment.path))
+            self.assertAlmostEqual(segment.duration, segment.end - segment.start, places=2)
+
+    def test_streaming_mode_matches_in_memory_cuts(self):
+        in_memory = processing._splice_audio(
+            self.source, "memory", min_chunk_duration_ms=1500, export_threads=3
+        )
+        streamed = processing._splice_audio_streaming(
+            self.source, "streamed", min_chunk_duration_ms=1500, window_ms=250
+        )
+
+        self.assertEqual(
+            [(os.path.basename(s.path), s.start, s.end) for s in streamed],
+            [(os.path.basename(s.path), s.start, s.end) for s in in_memory],
+        )
+        for expected, actual in zip(in_memory[:-1], streamed[:-1]):
+            with open(expected.path, "rb") as left, open(actual.path, "rb") as right:
+                self.assertEqual(left.read(), right.read())
+
+    def test_streaming_reuses_energy_sidecar(self):
+        first = processing._splice_audio_streaming(self.source, "first", min_chunk_duration_ms=1500)
+        stored = processing.load_energy_envelope(self.source)
+        self.assertIsNotNone(stored)
+        # The envelope is filled in place and renamed, not copied from memory.
+        self.assertFalse(os.path.exists(f"{processing.envelope_paths(self.source)[0]}.part"))
+        self.assertEqual(stored.energy.tolist(), wav_energy_envelope(self.source).energy.tolist())
+
+        with mock.patch.object(processing, "StreamingSilenceDetector") as detector:
+            second = processing._splice_audio_streaming(self.source, "second", min_chunk_duration_ms=1500)
+
+        detector.assert_not_called()
+        self.assertEqual([(s.start, s.end) for s in second], [(s.start, s.end) for s in first])
+
+    def test_long_chunks_are_cut_at_their_quietest_frame(self):
+        source = os.path.join(self.temp_dir, "no_silence.wav")
+        loud = Sine(440).to_audio_segment(duration=2600).set_frame_rate(16000).set_channels(1)
+        quiet = Sine(440).to_audio_segment(duration=100, volume=-15).set_frame_rate(16000).set_channels(1)
+        (loud + quiet + loud + quiet + loud).export(source, format="wav")
+
+        streamed = processing._splice_audio_streaming(
+            source, "bounded", min_chunk_duration_ms=1000, max_chunk_duration_ms=3000, window_ms=250
+        )
+        in_memory = processing._splice_audio(
+            source, "bounded_memory", min_chunk_duration_ms=1000, max_chunk_duration_ms=3000
+        )
+
+        self.assertEqual(len(streamed), 3)
+        self.assertTrue(2.6 <= streamed[0].end <= 2.7)
+        self.assertTrue(5.3 <= streamed[1].end <= 5.4)
+        self.assertTrue(all(segment.end - segment.start <= 3.0 for segment in streamed))
+        self.assertEqual([(s.start, s.end) for s in in_memory], [(s.start, s.end) for s in streamed])
+
+    def test_tiny_maximum_still_advances_every_cut(self):
+        pieces = processing._split_oversized(0, 100, lambda a, b: np.zeros(b - a), 30000, 1)
+
+        self.assertEqual(len(pieces), 100)
+        self.assertTrue(all(end > start for start, end in pieces))
+        with self.assertRaises(ValidationError):
+            RespliceRequest(max_chunk_duration_ms=1)
+        self.assertEqual(RespliceRequest(max_chunk_duration_ms=0).max_chunk_duration_ms, 0)
+
+    def test_preview_reports_cuts_without_writing(self):
+        manifest = processing._splice_audio(self.source, "episode", min_chunk_duration_ms=1500)
+        written = set(os.listdir(self.temp_dir))
+
+        bounds = processing.preview_splits(self.source, min_chunk_duration_ms=1500)
+
+        self.assertEqual([(start / 1000, end / 1000) for start, end in bounds], [(s.start, s.end) for s in manifest])
+        self.assertEqual(set(os.listdir(self.temp_dir)), written)
+        histogram = processing.splice_duration_histogram(bounds)
+        self.assertEqual(sum(bucket["count"] for bucket in histogram), len(bounds))
+        self.assertIsNone(histogram[-1]["max_seconds"])
+
+
+class MediaExecutorTests(unittest.TestCase):
+    def tearDown(self):
+        processing.configure_media_executor(None)
+
+    def test_failures_cross_the_process_pool_and_a_broken_pool_is_rebuilt(self):
+        processing.configure_media_executor(functools.partial(
+            ProcessPoolExecutor, max_workers=1, initializer=processing.init_media_worker_process
+        ))
+
+        async def scenario():
+            with self.assertRaises(processing.MediaProcessingError):
+                await processing._run_media_task(processing._extract_audio_pcm, "/nonexistent.mp4", "/tmp/x.wav")
+            with self.assertRaises(processing.MediaProcessingError):
+                await processing._run_media_task(os._exit, 1)
+            return await processing._run_media_task(pow, 2, 5)
+
+        self.assertEqual(asyncio.run(scenario()), 32)
+
+
+class RegisteredVideoTests(unittest.TestCase):
+    def test_rerun_of_a_registered_video_does_not_register_splices_again(self):
+        video = mock.Mock(
+            processing_checkpoint=ProcessingCheckpoint.REGISTERED,
+            processing_status=MediaProcessingStatus.COMPLETED,
+        )
+        with mock.patch.object(processing._services, "get_video", return_value=video), \
+                mock.patch.object(processing._services, "create_splices_bulk") as create_splices, \
+                mock.patch.object(processing, "_run_media_task") as run_media_task:
+            asyncio.run(processing._process_video_file(
+                video_id=1,
+                video_name="episode",
+                safe_filename="episode.mp4",
+                ext=".mp4",
+                original_path="/media/episode.mp4",
+                mp3_path=None,
+                owner_id="owner",
+                db_session=mock.Mock(),
+            ))
+
+        create_splices.assert_not_called()
+        run_media_task.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import sqlalchemy as _sql
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from api import main
+from api.database import database as _database
+from api.database import models, services
+from api.database.enums import MediaProcessingStatus, ProcessingStage
+from api.routers import auth
+
+
+def _frames(body):
+    """Split an SSE body into ``(event, data)`` pairs, skipping keep-alive comments."""
+    frames = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if lines:
+            frames.append((lines["event"], json.loads(lines["data"])))
+    return frames
+
+
+class UploadEventStreamTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory(prefix="upload_event_tests_")
+        self.addCleanup(temp_dir.cleanup)
+        engine = _sql.create_engine(
+            f"sqlite:///{os.path.join(temp_dir.name, 'events.db')}", connect_args={"check_same_thread": False}
+        )
+        self.addCleanup(engine.dispose)
+        _database.Base.metadata.create_all(engine)
+        self.Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+        with self.Session() as db:
+            db.add(models.User(id="uploader", email="uploader@example.com"))
+            record = models.UploadRecord(
+                user_id="uploader",
+                original_filename="episode.mp4",
+                display_name="episode",
+                processing_stage=ProcessingStage.SPLICING,
+                progress_percent=40,
+            )
+            db.add(record)
+            db.commit()
+            self.upload_id = record.id
+            self.user = db.get(models.User, "uploader")
+
+        def get_db():
+            db = self.Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        main.app.dependency_overrides[services.get_db] = get_db
+        self.addCleanup(main.app.dependency_overrides.clear)
+        for target, name, value in (
+            (auth, "JWT_SECRET_KEY", "test-secret"),
+            (services, "SessionLocal", self.Session),
+            (main, "UPLOAD_EVENTS_POLL_SECONDS", 0),
+        ):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def _finish_after_first_read(self):
+        read_progress = main._read_upload_progress
+        reads = []
+
+        def read_then_complete(upload_id):
+            payload = read_progress(upload_id)
+            if not reads:
+                with self.Session() as db:
+                    record = db.get(models.UploadRecord, upload_id)
+                    record.status = MediaProcessingStatus.COMPLETED
+                    record.processing_stage = ProcessingStage.COMPLETED
+                    record.progress_percent = 100
+                    db.commit()
+            reads.append(payload)
+            return payload
+
+        return mock.patch.object(main, "_read_upload_progress", side_effect=read_then_complete)
+
+    def test_query_token_streams_progress_until_done(self):
+        token, _ = auth.create_event_stream_token(self.user, self.upload_id)
+
+        with self._finish_after_first_read():
+            response = self.client.get(f"/uploads/{self.upload_id}/events", params={"token": token})
+
+        self.assertEqual(response.status_code, 200, response.text)
+        frames = _frames(response.text)
+        self.assertEqual([event for event, _ in frames], ["progress", "progress", "done"])
+        self.assertEqual((frames[0][1]["stage"], frames[0][1]["percent"]), ("splicing", 40))
+        self.assertEqual((frames[2][1]["status"], frames[2][1]["percent"]), ("completed", 100))
+
+    def test_token_endpoint_issues_a_token_for_the_stream(self):
+        main.app.dependency_overrides[auth.get_current_user] = lambda: self.user
+        issued = self.client.post(f"/uploads/{self.upload_id}/events/token").json()["data"]
+        self.assertEqual(issued["expires_in"], auth.EVENT_STREAM_TOKEN_EXPIRE_SECONDS)
+
+        with self._finish_after_first_read():
+            response = self.client.get(f"/uploads/{self.upload_id}/events", params={"token": issued["token"]})
+        self.assertEqual(_frames(response.text)[-1][0], "done")
+
+    def test_stream_rejects_missing_or_foreign_tokens(self):
+        self.assertEqual(self.client.get(f"/uploads/{self.upload_id}/events").status_code, 401)
+        other_upload, _ = auth.create_event_stream_token(self.user, self.upload_id + 1)
+        access, _ = auth.create_access_token({"sub": self.user.email, "id": self.user.id})
+        for token in (other_upload, access, "not-a-token"):
+            response = self.client.get(f"/uploads/{self.upload_id}/events", params={"token": token})
+            self.assertEqual(response.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
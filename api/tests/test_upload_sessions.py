@@ -0,0 +1,155 @@
+import datetime as _dt
+import errno
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import sqlalchemy as _sql
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from api import main
+from api.database import database as _database
+from api.database import models, services
+from api.routers import auth
+
+PAYLOAD = bytes(range(256)) * 40
+
+
+class UploadSessionFlowTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory(prefix="upload_session_tests_")
+        self.addCleanup(temp_dir.cleanup)
+        self.root = temp_dir.name
+        engine = _sql.create_engine(
+            f"sqlite:///{os.path.join(self.root, 'uploads.db')}", connect_args={"check_same_thread": False}
+        )
+        self.addCleanup(engine.dispose)
+        _database.Base.metadata.create_all(engine)
+        self.Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+        with self.Session() as db:
+            db.add(models.User(id="uploader", email="uploader@example.com"))
+            db.commit()
+            self.user = db.get(models.User, "uploader")
+
+        def get_db():
+            db = self.Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        main.app.dependency_overrides[services.get_db] = get_db
+        main.app.dependency_overrides[auth.get_current_user] = lambda: self.user
+        self.addCleanup(main.app.dependency_overrides.clear)
+        for name in ("UPLOAD_SESSIONS_DIR", "UPLOAD_DIR_MP3", "UPLOAD_DIR_MP4"):
+            patcher = mock.patch.object(main, name, os.path.join(self.root, name.lower()))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(main, "probe_media_duration", return_value=60.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def _create(self, total_size=len(PAYLOAD)):
+        response = self.client.post(
+            "/video/uploads",
+            json={"video_name": "episode", "video_category": "Story", "filename": "episode.mp3", "total_size": total_size},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"]["id"]
+
+    def _put(self, session_id, start, body, total=len(PAYLOAD)):
+        return self.client.put(
+            f"/video/uploads/{session_id}",
+            content=body,
+            headers={"content-range": f"bytes {start}-{start + len(body) - 1}/{total}"},
+        )
+
+    def test_create_reports_an_empty_session(self):
+        session_id = self._create()
+        data = self.client.get(f"/video/uploads/{session_id}").json()["data"]
+        self.assertEqual((data["received_bytes"], data["total_size"], data["status"]), (0, len(PAYLOAD), "open"))
+
+    def test_short_chunk_is_kept_and_upload_resumes_from_its_end(self):
+        session_id = self._create()
+        # The body stops halfway through the declared range, as after a dropped connection.
+        response = self.client.put(
+            f"/video/uploads/{session_id}",
+            content=PAYLOAD[:1500],
+            headers={"content-range": f"bytes 0-2999/{len(PAYLOAD)}"},
+        )
+        self.assertEqual(response.json()["message"], "Partial chunk stored")
+        self.assertEqual(self.client.get(f"/video/uploads/{session_id}").json()["data"]["received_bytes"], 1500)
+
+        self.assertEqual(self._put(session_id, 0, PAYLOAD[:1500]).status_code, 409)
+        self.assertEqual(self._put(session_id, 1500, PAYLOAD[1500:]).status_code, 200)
+        self.assertEqual(self.client.post(f"/video/uploads/{session_id}/finalize").status_code, 200)
+
+    def test_put_at_a_reserved_offset_is_rejected(self):
+        session_id = self._create()
+        with self.Session() as db:
+            self.assertTrue(services.reserve_upload_range(session_id, "uploader", 0, "other-writer", db))
+
+        self.assertEqual(self._put(session_id, 0, PAYLOAD[:1000]).status_code, 409)
+        self.assertEqual(self.client.post(f"/video/uploads/{session_id}/finalize").status_code, 409)
+
+    def test_expired_session_cannot_be_read_or_finalized(self):
+        session_id = self._create()
+        self.assertEqual(self._put(session_id, 0, PAYLOAD).status_code, 200)
+        with self.Session() as db:
+            db.get(models.UploadSession, session_id).expires_at = _dt.datetime.utcnow() - _dt.timedelta(minutes=1)
+            db.commit()
+
+        self.assertEqual(self.client.get(f"/video/uploads/{session_id}").status_code, 410)
+        self.assertEqual(self.client.post(f"/video/uploads/{session_id}/finalize").status_code, 410)
+        with self.Session() as db:
+            self.assertEqual(db.query(models.Video).count(), 0)
+
+    def test_chunks_assemble_and_finalize_across_filesystems(self):
+        session_id = self._create()
+        self.assertEqual(self._put(session_id, 0, PAYLOAD[:4000]).json()["data"]["received_bytes"], 4000)
+        self.assertEqual(self._put(session_id, 4000, PAYLOAD[4000:]).json()["data"]["received_bytes"], len(PAYLOAD))
+
+        sessions_dir = os.path.join(self.root, "upload_sessions_dir")
+        real_replace = os.replace
+
+        def cross_device_replace(source, destination):
+            # Session files and media storage are separate mounts in the compose files.
+            if os.path.dirname(os.path.abspath(source)) == sessions_dir and not str(destination).startswith(sessions_dir):
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return real_replace(source, destination)
+
+        with mock.patch.object(main.os, "replace", side_effect=cross_device_replace):
+            response = self.client.post(f"/video/uploads/{session_id}/finalize")
+
+        self.assertEqual(response.status_code, 200, response.text)
+        upload_id = response.json()["data"]["upload_id"]
+        with self.Session() as db:
+            video = db.get(models.Video, db.get(models.UploadRecord, upload_id).video_id)
+            with open(video.path, "rb") as stored:
+                self.assertEqual(stored.read(), PAYLOAD)
+            self.assertEqual(db.get(models.UploadSession, session_id).status, "finalized")
+        self.assertEqual(os.listdir(sessions_dir), [])
+        # Repeating the call returns the same upload.
+        again = self.client.post(f"/video/uploads/{session_id}/finalize")
+        self.assertEqual(again.json()["data"]["upload_id"], upload_id)
+
+    def test_chunk_stops_writing_once_its_reservation_is_taken_over(self):
+        session_id = self._create()
+        self.assertEqual(self._put(session_id, 0, PAYLOAD[:1000]).status_code, 200)
+        temp_path = os.path.join(self.root, "upload_sessions_dir", f"{session_id}.part")
+        with open(temp_path, "rb") as existing:
+            before = existing.read()
+
+        with mock.patch.object(services, "refresh_upload_range", return_value=False):
+            response = self._put(session_id, 1000, PAYLOAD[1000:2000])
+
+        self.assertEqual(response.status_code, 409)
+        with open(temp_path, "rb") as existing:
+            self.assertEqual(existing.read(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
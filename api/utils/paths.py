@@ -10,6 +10,8 @@ BASE_DIR = "/code" if os.path.exists("/code") else "."
 UPLOAD_DIR_MP4 = os.path.join(BASE_DIR, "mp4")
 UPLOAD_DIR_MP3 = os.path.join(BASE_DIR, "mp3")
 SPLICES_DIR = os.path.join(BASE_DIR, "splices")
+# Partial resumable uploads; never mounted as a static directory.
+UPLOAD_SESSIONS_DIR = os.path.join(BASE_DIR, "upload_sessions")
 
 UPLOAD_DIR_MP4_ABS = os.path.abspath(UPLOAD_DIR_MP4)
 UPLOAD_DIR_MP3_ABS = os.path.abspath(UPLOAD_DIR_MP3)
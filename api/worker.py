@@ -0,0 +1,76 @@
+"""Standalone media processing worker.
+
+Drains the durable ``processing_jobs`` queue outside the web tier so MP4 -> MP3 conversion
+and splicing never compete with request handling in the uvicorn workers. Run it with
+``python -m api.worker`` from the repository root (``python -m app.worker`` inside the API
+image). Any number of workers may run against the same database; jobs are claimed with
+``SELECT ... FOR UPDATE SKIP LOCKED``.
+"""
+
+import argparse
+import asyncio
+import functools
+import logging
+import os
+import signal
+import socket
+from concurrent.futures import ProcessPoolExecutor
+
+from .services import processing as _processing
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+MEDIA_WORKER_CONCURRENCY = int(os.getenv("MEDIA_WORKER_CONCURRENCY", "2"))
+
+
+async def _serve(concurrency: int) -> None:
+    """Run ``concurrency`` job loops backed by a process pool of the same size until signalled."""
+    _processing.resume_interrupted_jobs()
+    _processing.configure_media_executor(
+        functools.partial(
+            ProcessPoolExecutor,
+            max_workers=concurrency,
+            initializer=_processing.init_media_worker_process,
+        )
+    )
+
+    worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+    loops = [
+        asyncio.create_task(_processing.processing_job_loop(f"{worker_prefix}:{slot}"))
+        for slot in range(concurrency)
+    ]
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info(f"Media worker {worker_prefix} started with concurrency={concurrency}")
+    await stop_event.wait()
+
+    logger.info("Shutting down media worker; unfinished jobs will be reclaimed after their lease expires")
+    for task in loops:
+        task.cancel()
+    await asyncio.gather(*loops, return_exceptions=True)
+    _processing.configure_media_executor(None)
+
+
+def main() -> None:
+    """Parse command-line options and start the worker."""
+    parser = argparse.ArgumentParser(description="DibraSpeaks media processing worker")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MEDIA_WORKER_CONCURRENCY,
+        help="Number of jobs processed in parallel (and size of the process pool).",
+    )
+    args = parser.parse_args()
+    asyncio.run(_serve(max(1, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
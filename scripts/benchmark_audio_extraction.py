@@ -0,0 +1,109 @@
+"""Compare the legacy moviepy MP4 -> MP3 path with direct PCM extraction.
+
+Each mode runs in a fresh child process so peak RSS is measured in isolation. The
+reported peak covers both the Python process and any ffmpeg subprocess it spawned, and
+includes the decode the splicer performs afterwards (MP3 decode on the legacy path, a
+plain WAV read on the PCM path).
+
+Usage (from the repository root):
+
+    python scripts/benchmark_audio_extraction.py path/to/episode.mp4
+    python scripts/benchmark_audio_extraction.py --generate 3600   # synthetic 1-hour MP4
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from api.services import processing  # noqa: E402
+
+
+def _generate_sample(path: str, seconds: int) -> None:
+    """Write a small-frame H.264/AAC test video of the requested length."""
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", f"testsrc=size=640x360:rate=25:duration={seconds}",
+            "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=44100:duration={seconds}",
+            "-c:v", "libx264", "-preset", "ultrafast", "-c:a", "aac", "-ac", "2",
+            "-shortest", path,
+        ],
+        check=True,
+    )
+
+
+def _run_mode(mode: str, source: str, workdir: str, queue) -> None:
+    try:
+        queue.put(_measure(mode, source, workdir))
+    except Exception as exc:
+        queue.put({"mode": mode, "error": str(exc)})
+
+
+def _measure(mode: str, source: str, workdir: str) -> dict:
+    from pydub import AudioSegment
+
+    started = time.perf_counter()
+    if mode == "mp3":
+        target = os.path.join(workdir, "audio.mp3")
+        processing._convert_mp4_to_mp3(source, target)
+    else:
+        target = os.path.join(workdir, "audio.wav")
+        processing._extract_audio_pcm(source, target)
+    extracted = time.perf_counter()
+    AudioSegment.from_file(target)
+    decoded = time.perf_counter()
+
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {
+        "mode": mode,
+        "extract_s": extracted - started,
+        "decode_s": decoded - extracted,
+        "total_s": decoded - started,
+        "peak_rss_mb": max(self_rss, child_rss) / 1024,
+        "output_mb": os.path.getsize(target) / (1024 * 1024),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", nargs="?", help="MP4 file to benchmark")
+    parser.add_argument("--generate", type=int, metavar="SECONDS", help="Generate a synthetic MP4 of this length")
+    parser.add_argument("--modes", default="mp3,pcm", help="Comma-separated modes to run (default: mp3,pcm)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="extract_bench_") as workdir:
+        source = args.source
+        if args.generate:
+            source = os.path.join(workdir, "sample.mp4")
+            print(f"Generating {args.generate}s sample video...")
+            _generate_sample(source, args.generate)
+        if not source:
+            parser.error("pass an MP4 path or --generate SECONDS")
+
+        context = multiprocessing.get_context("spawn")
+        print(f"{'mode':<6}{'extract s':>12}{'decode s':>12}{'total s':>12}{'peak RSS MB':>14}{'output MB':>12}")
+        for mode in args.modes.split(","):
+            queue = context.Queue()
+            child = context.Process(target=_run_mode, args=(mode, source, workdir, queue))
+            child.start()
+            result = queue.get()
+            child.join()
+            if "error" in result:
+                print(f"{result['mode']:<6} failed: {result['error']}")
+                continue
+            print(
+                f"{result['mode']:<6}{result['extract_s']:>12.2f}{result['decode_s']:>12.2f}"
+                f"{result['total_s']:>12.2f}{result['peak_rss_mb']:>14.1f}{result['output_mb']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
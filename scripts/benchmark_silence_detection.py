@@ -0,0 +1,88 @@
+"""Benchmark pydub's detect_silence against the vectorized NumPy detector.
+
+Runs both backends with the splicer's parameters on the same decoded audio, checks that
+they return identical ranges, and prints wall time and speedup. Also times re-detection
+from a memory-mapped energy envelope sidecar, the path re-splices and previews take.
+
+Usage (from the repository root):
+
+    python scripts/benchmark_silence_detection.py path/to/episode.wav
+    python scripts/benchmark_silence_detection.py --seconds 3600   # synthetic 1-hour input
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from pydub import AudioSegment
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from api.services.envelope import load_energy_envelope, save_energy_envelope  # noqa: E402
+from api.services.silence import SILENCE_DETECTORS, audio_energy_envelope, detect_silence_envelope  # noqa: E402
+
+
+def _synthetic_speech(seconds: int, frame_rate: int) -> AudioSegment:
+    """Noise bursts of 2-20 s separated by 0.3-2 s pauses, 16-bit mono."""
+    rng = np.random.default_rng(0)
+    pieces = []
+    total = 0
+    while total < seconds * frame_rate:
+        talk = int(rng.uniform(2, 20) * frame_rate)
+        pause = int(rng.uniform(0.3, 2) * frame_rate)
+        pieces.append((rng.standard_normal(talk) * 8000).astype(np.int16))
+        pieces.append((rng.standard_normal(pause) * 30).astype(np.int16))
+        total += talk + pause
+    samples = np.concatenate(pieces)[: seconds * frame_rate]
+    return AudioSegment(samples.tobytes(), frame_rate=frame_rate, sample_width=2, channels=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", nargs="?", help="Audio file to benchmark")
+    parser.add_argument("--seconds", type=int, default=3600, help="Length of the synthetic input (default: 3600)")
+    parser.add_argument("--frame-rate", type=int, default=16000, help="Sample rate of the synthetic input")
+    parser.add_argument("--min-silence-len", type=int, default=700)
+    parser.add_argument("--silence-thresh", type=int, default=-20)
+    args = parser.parse_args()
+
+    if args.source:
+        audio = AudioSegment.from_file(args.source)
+    else:
+        audio = _synthetic_speech(args.seconds, args.frame_rate)
+    print(f"Input: {len(audio) / 1000:.0f}s, {audio.frame_rate} Hz, {audio.channels} ch")
+
+    timings = {}
+    results = {}
+    for name in ("numpy", "pydub"):
+        started = time.perf_counter()
+        results[name] = SILENCE_DETECTORS[name](
+            audio,
+            min_silence_len=args.min_silence_len,
+            silence_thresh=args.silence_thresh,
+        )
+        timings[name] = time.perf_counter() - started
+        print(f"{name:<6}{timings[name]:>10.2f}s  {len(results[name])} silent ranges")
+
+    with tempfile.TemporaryDirectory(prefix="silence_bench_") as workdir:
+        sidecar_source = os.path.join(workdir, "source.wav")
+        open(sidecar_source, "wb").close()
+        save_energy_envelope(sidecar_source, audio_energy_envelope(audio))
+        started = time.perf_counter()
+        results["envelope"] = detect_silence_envelope(
+            load_energy_envelope(sidecar_source),
+            min_silence_len=args.min_silence_len,
+            silence_thresh=args.silence_thresh,
+        )
+        timings["envelope"] = time.perf_counter() - started
+    print(f"{'sidecar':<8}{timings['envelope']:>8.2f}s  {len(results['envelope'])} silent ranges")
+
+    print(f"identical ranges: {results['numpy'] == results['pydub'] == results['envelope']}")
+    print(f"speedup: {timings['pydub'] / max(timings['numpy'], 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare splitter backends on throughput and on how much non-speech ends up in the splices.
+
+The synthetic input alternates voiced "speech" (harmonic tones with a syllable-rate
+envelope), quiet pauses and loud broadband crowd noise, so every millisecond has a known
+label. Each backend plans the chunks ``_splice_audio`` would export (after dropping chunks
+above ``--max-non-speech-ratio``) and the script reports:
+
+* throughput: seconds of audio planned per second of wall time;
+* non-speech: share of the exported audio that is pause or noise;
+* speech kept: share of all speech that is still in an exported chunk.
+
+Usage (from the repository root):
+
+    python scripts/benchmark_vad_splitting.py                 # 30-minute synthetic input
+    python scripts/benchmark_vad_splitting.py --seconds 3600 --max-non-speech-ratio 0.3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from pydub import AudioSegment
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from api.services import processing  # noqa: E402
+from api.services.silence import audio_energy_envelope  # noqa: E402
+
+
+def _field_recording(seconds: int, frame_rate: int):
+    """16-bit mono audio plus a per-millisecond ``True`` = speech label."""
+    rng = np.random.default_rng(3)
+    pieces = []
+    labels = []
+    total = 0
+    while total < seconds * frame_rate:
+        kind = rng.choice(["speech", "pause", "noise"], p=[0.6, 0.2, 0.2])
+        length = int(rng.uniform(0.4, 2.0 if kind == "pause" else 25.0) * frame_rate)
+        t = np.arange(length) / frame_rate
+        if kind == "speech":
+            f0 = rng.uniform(110, 220)
+            voiced = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6))
+            syllables = 0.55 + 0.45 * np.sin(2 * np.pi * rng.uniform(3, 5) * t)
+            samples = voiced * syllables * 9000
+        elif kind == "noise":
+            samples = rng.standard_normal(length) * 7000
+        else:
+            samples = rng.standard_normal(length) * 40
+        pieces.append(samples.clip(-32768, 32767).astype(np.int16))
+        labels.append(np.full(length, kind == "speech"))
+        total += length
+    samples = np.concatenate(pieces)[: seconds * frame_rate]
+    frame_labels = np.concatenate(labels)[: seconds * frame_rate]
+    audio = AudioSegment(samples.tobytes(), frame_rate=frame_rate, sample_width=2, channels=1)
+    per_ms = frame_labels[: len(audio) * frame_rate // 1000].reshape(len(audio), frame_rate // 1000)
+    return audio, per_ms.mean(axis=1) >= 0.5
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=1800, help="Length of the synthetic input (default: 1800)")
+    parser.add_argument("--frame-rate", type=int, default=16000, help="Sample rate of the synthetic input")
+    parser.add_argument("--backends", default="numpy,vad", help="Comma-separated splitter backends")
+    parser.add_argument("--min-chunk-ms", type=int, default=processing.MIN_SPLICE_DURATION_MS)
+    parser.add_argument("--max-chunk-ms", type=int, default=processing.MAX_SPLICE_DURATION_MS)
+    parser.add_argument("--max-non-speech-ratio", type=float, default=0.5)
+    args = parser.parse_args()
+
+    audio, speech = _field_recording(args.seconds, args.frame_rate)
+    envelope = audio_energy_envelope(audio)
+    print(f"Input: {len(audio) / 1000:.0f}s, {speech.mean():.0%} speech")
+    print(f"{'backend':<8}{'x realtime':>12}{'chunks':>8}{'non-speech':>12}{'speech kept':>13}")
+
+    for backend in args.backends.split(","):
+        started = time.perf_counter()
+        bounds = processing.plan_audio_splits(
+            audio,
+            envelope,
+            backend,
+            min_chunk_duration_ms=args.min_chunk_ms,
+            max_chunk_duration_ms=args.max_chunk_ms,
+            max_non_speech_ratio=args.max_non_speech_ratio,
+        )
+        elapsed = time.perf_counter() - started
+
+        exported = np.zeros(len(audio), dtype=bool)
+        for start, end in bounds:
+            exported[start:end] = True
+        non_speech = (exported & ~speech).sum() / max(exported.sum(), 1)
+        kept = (exported & speech).sum() / max(speech.sum(), 1)
+        print(
+            f"{backend:<8}{len(audio) / 1000 / max(elapsed, 1e-9):>12.0f}{len(bounds):>8}"
+            f"{non_speech:>12.1%}{kept:>13.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -36,7 +36,7 @@ interface UploadHistoryItem {
   original_filename: string;
   display_name: string;
   category?: string;
-  status: "in_progress" | "completed" | "error";
+  status: "in_progress" | "completed" | "error" | "dead_letter" | "cancelled";
   created_at: string;
   updated_at: string;
   error_message?: string;
@@ -361,7 +361,9 @@ export default function MyLabelsPage() {
     const statusConfig: Record<UploadHistoryItem["status"], { label: string; palette: PaletteKey }> = {
       completed: { label: "Completed", palette: "success" },
       in_progress: { label: "Processing", palette: "warning" },
-      error: { label: "Error", palette: "error" }
+      error: { label: "Error", palette: "error" },
+      dead_letter: { label: "Failed", palette: "error" },
+      cancelled: { label: "Cancelled", palette: "primary" }
     }
 
     const config = statusConfig[status]
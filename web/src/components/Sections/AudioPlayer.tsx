@@ -35,19 +35,19 @@ export default function MainSection() {
   const [cutMode, setCutMode] = useState(false);
   const [startTime, setStartTime] = useState<number | null>(null);
   const [endTime, setEndTime] = useState<number | null>(null);
+  const { data: session, status: sessionStatus } = useSession();
+  const router = useRouter();
+  const DEFAULT_AUTH_MESSAGE = t("authDialog.default");
+  const [openAuthDialog, setOpenAuthDialog] = useState(false);
+  const [authDialogMessage, setAuthDialogMessage] = useState(DEFAULT_AUTH_MESSAGE);
+  const accessToken = (session as { accessToken?: string } | null)?.accessToken;
   const { clip, isLoading, statusMessage, error, fetchNextClip, submitClip, deleteClip } = useSpliceQueue("label", {
     noAudio: t("queue.noAudio"),
     fetchError: t("queue.fetchError"),
     submitError: t("queue.submitError"),
     deleteError: t("queue.deleteError"),
-  });
+  }, accessToken);
   const hasClip = Boolean(clip);
-  const { data: session } = useSession();
-  const router = useRouter();
-  const DEFAULT_AUTH_MESSAGE = t("authDialog.default");
-  const [openAuthDialog, setOpenAuthDialog] = useState(false);
-  const [authDialogMessage, setAuthDialogMessage] = useState(DEFAULT_AUTH_MESSAGE);
-  const accessToken = (session as { accessToken?: string } | null)?.accessToken;
 
   useEffect(() => {
     setAuthDialogMessage(DEFAULT_AUTH_MESSAGE);
@@ -158,8 +158,13 @@ export default function MainSection() {
   }, [clip?.audioUrl, clip?.id]);
 
   useEffect(() => {
+    // Claim only once the session has resolved: an anonymous claim sent before the token
+    // arrives would strand a reservation on every page load.
+    if (sessionStatus === "loading" || (sessionStatus === "authenticated" && !accessToken)) {
+      return;
+    }
     fetchNextClip();
-  }, [fetchNextClip]);
+  }, [accessToken, fetchNextClip, sessionStatus]);
 
   useEffect(() => {
     setLabelValue("");
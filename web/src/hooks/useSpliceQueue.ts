@@ -64,7 +64,7 @@ const STAGE_CONFIG: Record<SpliceStage, {
   },
 };
 
-export function useSpliceQueue(stage: SpliceStage, copy: QueueCopy = {}): UseSpliceQueueResult {
+export function useSpliceQueue(stage: SpliceStage, copy: QueueCopy = {}, accessToken?: string): UseSpliceQueueResult {
   const [clip, setClip] = useState<SpliceClip | null>(null);
   const [isLoading, setIsLoading] = useState(false);
   const [statusMessage, setStatusMessage] = useState<string | null>(null);
@@ -77,7 +77,9 @@ export function useSpliceQueue(stage: SpliceStage, copy: QueueCopy = {}): UseSpl
     setError(null);
 
     try {
-      const { data } = await axios.get(`${API_BASE}${STAGE_CONFIG[stage].fetchPath}`);
+      // Signed-in callers get their existing reservation back instead of a new clip on every reload.
+      const headers = accessToken ? { Authorization: `Bearer ${accessToken}` } : undefined;
+      const { data } = await axios.get(`${API_BASE}${STAGE_CONFIG[stage].fetchPath}`, { headers });
       const clipData = data?.data;
       if (clipData) {
         const audioUrl = buildFileAccessUrl(FILE_BASE, clipData.path);
@@ -105,7 +107,7 @@ export function useSpliceQueue(stage: SpliceStage, copy: QueueCopy = {}): UseSpl
         setIsLoading(false);
       }
     }
-  }, [copy.fetchError, copy.noAudio, stage]);
+  }, [accessToken, copy.fetchError, copy.noAudio, stage]);
 
   const submitClip = useCallback(async ({ label, start, end, isAuthenticated, accessToken, validatorId }: SubmitArgs) => {
     if (!clip) {